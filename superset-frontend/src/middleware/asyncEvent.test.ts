@@ -475,6 +475,79 @@ describe('asyncEvent middleware', () => {
     );
   });
 
+  // eslint-disable-next-line no-restricted-globals -- TODO: Migrate from describe blocks
+  describe('long polling transport', () => {
+    const config = {
+      GLOBAL_ASYNC_QUERIES_TRANSPORT: 'long_polling',
+      GLOBAL_ASYNC_QUERIES_POLLING_DELAY: 50,
+      GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT: 20,
+      GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL: '',
+    };
+
+    test('waits for events on the server and polls again right away', async () => {
+      jest.useFakeTimers();
+      try {
+        fetchMock.get(
+          EVENTS_ENDPOINT,
+          () =>
+            new Promise(resolve => {
+              setTimeout(
+                () => resolve({ status: 200, body: { result: [] } }),
+                config.GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT * 1000,
+              );
+            }),
+        );
+        asyncEvent.init(config);
+        asyncEvent.waitForAsyncData(asyncPendingEvent).catch(() => {});
+
+        await jest.advanceTimersByTimeAsync(
+          config.GLOBAL_ASYNC_QUERIES_POLLING_DELAY,
+        );
+        const calls = fetchMock.callHistory.calls(EVENTS_ENDPOINT);
+        expect(calls).toHaveLength(1);
+        expect(calls[0].url).toContain('timeout=20');
+
+        await jest.advanceTimersByTimeAsync(
+          config.GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT * 1000,
+        );
+        expect(fetchMock.callHistory.calls(EVENTS_ENDPOINT)).toHaveLength(2);
+      } finally {
+        mockedIsFeatureEnabled.mockReturnValueOnce(false);
+        asyncEvent.init(config);
+        jest.useRealTimers();
+      }
+    });
+
+    test('keeps the polling delay when the server does not wait', async () => {
+      jest.useFakeTimers();
+      try {
+        fetchMock.get(EVENTS_ENDPOINT, {
+          status: 200,
+          body: { result: [] },
+        });
+        asyncEvent.init(config);
+        asyncEvent.waitForAsyncData(asyncPendingEvent).catch(() => {});
+
+        await jest.advanceTimersByTimeAsync(
+          config.GLOBAL_ASYNC_QUERIES_POLLING_DELAY,
+        );
+        expect(fetchMock.callHistory.calls(EVENTS_ENDPOINT)).toHaveLength(1);
+
+        await jest.advanceTimersByTimeAsync(
+          config.GLOBAL_ASYNC_QUERIES_POLLING_DELAY - 1,
+        );
+        expect(fetchMock.callHistory.calls(EVENTS_ENDPOINT)).toHaveLength(1);
+
+        await jest.advanceTimersByTimeAsync(1);
+        expect(fetchMock.callHistory.calls(EVENTS_ENDPOINT)).toHaveLength(2);
+      } finally {
+        mockedIsFeatureEnabled.mockReturnValueOnce(false);
+        asyncEvent.init(config);
+        jest.useRealTimers();
+      }
+    });
+  });
+
   // eslint-disable-next-line no-restricted-globals -- TODO: Migrate from describe blocks
   describe('ws transport', () => {
     let wsServer: WS;
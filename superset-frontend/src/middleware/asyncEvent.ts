@@ -47,6 +47,7 @@ type AppConfig = Record<string, any>;
 type ListenerFn = (asyncEvent: AsyncEvent) => Promise<any>;
 
 const TRANSPORT_POLLING = 'polling';
+const TRANSPORT_LONG_POLLING = 'long_polling';
 const TRANSPORT_WS = 'ws';
 const JOB_STATUS = {
   PENDING: 'pending',
@@ -65,6 +66,7 @@ const MAX_ERROR_POLLING_DELAY_MS = 60000;
 let config: AppConfig;
 let transport: string;
 let pollingDelayMs: number;
+let longPollingTimeoutS: number;
 let pollingTimeoutId: number;
 let listenersByJobId: Map<string, ListenerFn>;
 let retriesByJobId: Map<string, number>;
@@ -189,7 +191,7 @@ export const waitForAsyncData = async (
   });
 
 const fetchEvents = makeApi<
-  { last_id?: string | null },
+  { last_id?: string | null; timeout?: number },
   { result: AsyncEvent[] }
 >({
   method: 'GET',
@@ -235,7 +237,10 @@ export const processEvents = async (events: AsyncEvent[]) => {
   });
 };
 
-const getPollingDelay = () => {
+const getPollingDelay = (waitedForEvents: boolean) => {
+  // a long polling request that waited for new events on the server is followed
+  // by the next one right away
+  if (!consecutivePollingErrorCount && waitedForEvents) return 0;
   if (!consecutivePollingErrorCount) return pollingDelayMs;
   const backoffDelayMs = pollingDelayMs * 2 ** consecutivePollingErrorCount;
   return Math.max(
@@ -246,12 +251,25 @@ const getPollingDelay = () => {
 
 const loadEventsFromApi = async () => {
   const generation = pollingGeneration;
-  const eventArgs = lastReceivedEventId ? { last_id: lastReceivedEventId } : {};
+  const eventArgs: { last_id?: string; timeout?: number } = lastReceivedEventId
+    ? { last_id: lastReceivedEventId }
+    : {};
+  if (transport === TRANSPORT_LONG_POLLING) {
+    eventArgs.timeout = longPollingTimeoutS;
+  }
+  let waitedForEvents = false;
   if (listenersByJobId.size) {
     try {
+      const requestedAt = Date.now();
       const { result: events } = await fetchEvents(eventArgs);
       if (generation !== pollingGeneration) return;
       consecutivePollingErrorCount = 0;
+      // the server may answer right away without waiting, e.g. for an unknown
+      // last event id, so only skip the delay when it did wait for events
+      waitedForEvents =
+        transport === TRANSPORT_LONG_POLLING &&
+        (!!events?.length ||
+          Date.now() - requestedAt >= longPollingTimeoutS * 1000);
       if (events?.length) await processEvents(events);
     } catch (err) {
       if (generation !== pollingGeneration) return;
@@ -261,8 +279,11 @@ const loadEventsFromApi = async () => {
   }
 
   if (generation !== pollingGeneration) return;
-  if (transport === TRANSPORT_POLLING) {
-    pollingTimeoutId = window.setTimeout(loadEventsFromApi, getPollingDelay());
+  if (transport === TRANSPORT_POLLING || transport === TRANSPORT_LONG_POLLING) {
+    pollingTimeoutId = window.setTimeout(
+      loadEventsFromApi,
+      getPollingDelay(waitedForEvents),
+    );
   }
 };
 
@@ -324,6 +345,7 @@ export const init = (appConfig?: AppConfig) => {
   config = appConfig || getBootstrapData().common.conf;
   transport = config.GLOBAL_ASYNC_QUERIES_TRANSPORT || TRANSPORT_POLLING;
   pollingDelayMs = config.GLOBAL_ASYNC_QUERIES_POLLING_DELAY || 500;
+  longPollingTimeoutS = config.GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT || 25;
 
   try {
     lastReceivedEventId = localStorage.getItem(LOCALSTORAGE_KEY);
@@ -331,7 +353,7 @@ export const init = (appConfig?: AppConfig) => {
     logging.warn('Failed to fetch last event Id from localStorage');
   }
 
-  if (transport === TRANSPORT_POLLING) {
+  if (transport === TRANSPORT_POLLING || transport === TRANSPORT_LONG_POLLING) {
     loadEventsFromApi();
   }
   if (transport === TRANSPORT_WS) {
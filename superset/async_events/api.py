@@ -17,7 +17,7 @@
 import logging
 import uuid
 
-from flask import request, Response
+from flask import current_app, request, Response
 from flask_appbuilder import expose
 from flask_appbuilder.api import safe
 from flask_appbuilder.security.decorators import permission_name, protect
@@ -59,6 +59,13 @@ class AsyncEventsRestApi(BaseSupersetApi):
             description: Last ID received by the client
             schema:
                 type: string
+          - in: query
+            name: timeout
+            description: >-
+              Seconds to wait for new events when there are none, with the
+              long_polling transport. Capped by the server configuration.
+            schema:
+                type: number
           responses:
             200:
               description: Async event results
@@ -98,7 +105,15 @@ class AsyncEventsRestApi(BaseSupersetApi):
                 request
             )
             last_event_id = request.args.get("last_id")
-            events = async_query_manager.read_events(async_channel_id, last_event_id)
+            timeout = 0.0
+            if current_app.config["GLOBAL_ASYNC_QUERIES_TRANSPORT"] == "long_polling":
+                timeout = min(
+                    request.args.get("timeout", 0.0, type=float),
+                    current_app.config["GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT"],
+                )
+            events = async_query_manager.read_events(
+                async_channel_id, last_event_id, timeout
+            )
 
         except AsyncQueryTokenException:
             return self.response_401()
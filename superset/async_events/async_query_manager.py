@@ -31,6 +31,7 @@ from superset.async_events.cache_backend import (
     RedisCacheBackend,
     RedisSentinelCacheBackend,
 )
+from superset.async_events.stream_reader import AsyncEventStreamReader
 from superset.utils import json
 from superset.utils.core import get_user_id
 
@@ -114,6 +115,7 @@ class AsyncQueryManager:
     def __init__(self) -> None:
         super().__init__()
         self._cache: Optional[BaseCache] = None
+        self._stream_reader: Optional[AsyncEventStreamReader] = None
         self._stream_prefix: str = ""
         self._stream_limit: Optional[int]
         self._stream_limit_firehose: Optional[int]
@@ -162,6 +164,13 @@ class AsyncQueryManager:
             "GLOBAL_ASYNC_QUERIES_JWT_EXPIRATION_SECONDS"
         ]
 
+        if app.config["GLOBAL_ASYNC_QUERIES_TRANSPORT"] == "long_polling":
+            self._stream_reader = AsyncEventStreamReader(
+                self._cache,
+                block_ms=app.config["GLOBAL_ASYNC_QUERIES_LONG_POLLING_BLOCK_MS"],
+                count=self.MAX_EVENT_COUNT,
+            )
+
         if app.config["GLOBAL_ASYNC_QUERIES_REGISTER_REQUEST_HANDLERS"]:
             self.register_request_handlers(app)
 
@@ -369,14 +378,25 @@ class AsyncQueryManager:
         return job_metadata
 
     def read_events(
-        self, channel: str, last_id: Optional[str]
+        self, channel: str, last_id: Optional[str], timeout: float = 0
     ) -> list[Optional[dict[str, Any]]]:
+        """
+        Read the events of a channel.
+
+        :param channel: The async channel ID
+        :param last_id: The ID of the last event received, if any
+        :param timeout: Seconds to wait for new events when there are none, with
+            the ``long_polling`` transport
+        :returns: The events added after ``last_id``
+        """
         if not self._cache:
             raise CacheBackendNotInitialized("Cache backend not initialized")
 
         stream_name = f"{self._stream_prefix}{channel}"
         start_id = increment_id(last_id) if last_id else "-"
         results = self._cache.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
+        if not results and timeout > 0 and self._stream_reader:
+            results = self._stream_reader.wait(stream_name, last_id, timeout)
         # Decode bytes to strings, decode_responses is not supported at RedisCache and RedisSentinelCache  # noqa: E501
         if isinstance(self._cache, (RedisSentinelCacheBackend, RedisCacheBackend)):
             decoded_results = [
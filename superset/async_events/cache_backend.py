@@ -154,6 +154,23 @@ class RedisCacheBackend(RedisCache):
         count = count or self.MAX_EVENT_COUNT
         return self._cache.xrange(stream_name, start, end, count)
 
+    def xread(
+        self,
+        streams: dict[str, str],
+        count: int | None = None,
+        block: int | None = None,
+    ) -> list[Any]:
+        """
+        Read the entries of several streams after the given IDs.
+
+        :param streams: The IDs to read after, by stream name
+        :param count: Maximum number of entries read per stream
+        :param block: Milliseconds to wait for new entries when there are none
+        :returns: The entries, by stream name
+        """
+        count = count or self.MAX_EVENT_COUNT
+        return self._cache.xread(streams, count, block)
+
     @classmethod
     def from_config(cls, config: dict[str, Any]) -> RedisCacheBackend:
         kwargs = {
@@ -347,6 +364,23 @@ class RedisSentinelCacheBackend(RedisSentinelCache):
         count = count or self.MAX_EVENT_COUNT
         return self._cache.xrange(stream_name, start, end, count)
 
+    def xread(
+        self,
+        streams: dict[str, str],
+        count: int | None = None,
+        block: int | None = None,
+    ) -> list[Any]:
+        """
+        Read the entries of several streams after the given IDs.
+
+        :param streams: The IDs to read after, by stream name
+        :param count: Maximum number of entries read per stream
+        :param block: Milliseconds to wait for new entries when there are none
+        :returns: The entries, by stream name
+        """
+        count = count or self.MAX_EVENT_COUNT
+        return self._cache.xread(streams, count, block)
+
     @classmethod
     def from_config(cls, config: dict[str, Any]) -> RedisSentinelCacheBackend:
         kwargs = {
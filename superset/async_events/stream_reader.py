@@ -0,0 +1,192 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Blocking reads of the async event streams, shared by the requests of a process.
+
+With the ``long_polling`` transport, a request for async events waits until an
+event is added to the stream of its channel instead of returning right away. Rather
+than holding a Redis connection per waiting request, each process runs a single
+thread reading the streams of all the waiting requests with a blocking ``XREAD``,
+and hands the entries to the requests waiting on them.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Any
+
+from superset.async_events.cache_backend import (
+    RedisCacheBackend,
+    RedisSentinelCacheBackend,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def parse_stream_id(entry_id: str | bytes) -> tuple[int, int] | None:
+    """
+    Parse a Redis stream ID, e.g. ``1607477697866-0``, into a comparable tuple.
+
+    :param entry_id: The stream ID
+    :returns: The time and sequence parts of the ID, or None if it's invalid
+    """
+    if isinstance(entry_id, bytes):
+        entry_id = entry_id.decode("utf-8")
+    milliseconds, _, sequence = entry_id.partition("-")
+    try:
+        return int(milliseconds), int(sequence or 0)
+    except ValueError:
+        return None
+
+
+class _Waiter:
+    """
+    A request waiting for the entries of a stream added after an ID.
+    """
+
+    def __init__(self, last_id: tuple[int, int]) -> None:
+        self.last_id = last_id
+        self.entries: list[Any] = []
+        self.event = threading.Event()
+
+
+class AsyncEventStreamReader:
+    """
+    Reads the async event streams with a blocking ``XREAD`` from a single thread.
+
+    Streams are only read while requests are waiting on them, so an idle process
+    doesn't query Redis. A stream starting to be waited on is added to the read
+    after the current blocking read returns, i.e. after at most ``block_ms``.
+    """
+
+    def __init__(
+        self,
+        cache: RedisCacheBackend | RedisSentinelCacheBackend,
+        block_ms: int = 1000,
+        count: int = 100,
+    ) -> None:
+        """
+        :param cache: The backend of the async event streams
+        :param block_ms: Milliseconds each read waits for new entries
+        :param count: Maximum number of entries read per stream
+        """
+        self._cache = cache
+        self.block_ms = block_ms
+        self.count = count
+        self._waiters: dict[str, list[_Waiter]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    def wait(
+        self,
+        stream_name: str,
+        last_id: str | None,
+        timeout: float,
+    ) -> list[Any]:
+        """
+        Wait for entries to be added to a stream.
+
+        :param stream_name: The name of the stream
+        :param last_id: The ID of the last entry received, if any
+        :param timeout: Maximum number of seconds to wait
+        :returns: The entries added after ``last_id``, or an empty list if none were
+            added before the timeout
+        """
+        parsed_id = parse_stream_id(last_id) if last_id else (0, 0)
+        if parsed_id is None:
+            return []
+
+        waiter = _Waiter(parsed_id)
+        with self._lock:
+            self._start()
+            self._waiters[stream_name].append(waiter)
+        self._wakeup.set()
+        try:
+            waiter.event.wait(timeout)
+        finally:
+            with self._lock:
+                waiters = self._waiters[stream_name]
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[stream_name]
+        return waiter.entries
+
+    def _start(self) -> None:
+        # the thread isn't inherited by forked workers, so it's started by the
+        # process using it
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run,
+                name="async-event-stream-reader",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while self._thread is threading.current_thread():
+            with self._lock:
+                streams = {
+                    stream_name: "{}-{}".format(
+                        *min(waiter.last_id for waiter in waiters)
+                    )
+                    for stream_name, waiters in self._waiters.items()
+                }
+                self._wakeup.clear()
+
+            if not streams:
+                self._wakeup.wait()
+                continue
+
+            try:
+                results = self._cache.xread(streams, self.count, self.block_ms)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Unable to read the async event streams", exc_info=True)
+                self._wakeup.wait(self.block_ms / 1000)
+                continue
+
+            self._notify(results or [])
+
+    def _notify(self, results: list[Any]) -> None:
+        with self._lock:
+            for stream_name, entries in results:
+                if isinstance(stream_name, bytes):
+                    stream_name = stream_name.decode("utf-8")
+                for waiter in self._waiters.get(stream_name, []):
+                    if waiter.event.is_set():
+                        continue
+                    waiter.entries = [
+                        entry
+                        for entry in entries
+                        if (parse_stream_id(entry[0]) or (0, 0)) > waiter.last_id
+                    ]
+                    if waiter.entries:
+                        waiter.event.set()
+
+    def shutdown(self) -> None:
+        """
+        Stop the thread once its current read returns.
+        """
+        with self._lock:
+            self._thread = None
+            self._pid = None
+        self._wakeup.set()
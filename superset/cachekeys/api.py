@@ -16,7 +16,7 @@
 # under the License.
 import logging
 
-from flask import request, Response
+from flask import current_app as app, request, Response
 from flask_appbuilder import expose
 from flask_appbuilder.api import safe
 from flask_appbuilder.models.sqla.interface import SQLAInterface
@@ -28,6 +28,7 @@ from superset.cachekeys.schemas import CacheInvalidationRequestSchema
 from superset.connectors.sqla.models import SqlaTable
 from superset.extensions import cache_manager, db, event_logger, stats_logger_manager
 from superset.models.cache import CacheKey
+from superset.utils.cache import bump_cache_generation
 from superset.views.base_api import BaseSupersetModelRestApi, statsd_metrics
 
 logger = logging.getLogger(__name__)
@@ -53,6 +54,9 @@ class CacheRestApi(BaseSupersetModelRestApi):
         """
         Take a list of datasources, find and invalidate the associated cache records
         and remove the database records.
+
+        When ``DATASOURCE_CACHE_GENERATIONS`` is enabled a new cache generation is
+        started for each datasource, invalidating all its cached query results.
         ---
         post:
           summary: Invalidate cache records and remove the database records
@@ -93,6 +97,17 @@ class CacheRestApi(BaseSupersetModelRestApi):
             if ds_obj:
                 datasource_uids.add(ds_obj.uid)
 
+        if app.config["DATASOURCE_CACHE_GENERATIONS"]:
+            for datasource_uid in datasource_uids:
+                bump_cache_generation(datasource_uid)
+            stats_logger_manager.instance.gauge(
+                "invalidated_cache_generations", len(datasource_uids)
+            )
+            logger.info(
+                "Started new cache generations for %s datasources",
+                len(datasource_uids),
+            )
+
         cache_key_objs = (
             db.session.query(CacheKey)
             .filter(CacheKey.datasource_uid.in_(datasource_uids))
@@ -35,7 +35,7 @@ from flask_babel import gettext as __
 
 from superset.common.chart_data import ChartDataResultFormat
 from superset.extensions import event_logger
-from superset.utils import csv, excel
+from superset.utils import arrow, csv, excel
 from superset.utils.core import (
     extract_dataframe_dtypes,
     get_column_names,
@@ -388,6 +388,8 @@ def apply_client_processing(  # noqa: C901
             )
         elif query["result_format"] == ChartDataResultFormat.XLSX:
             df = _read_excel_for_client_processing(data, form_data)
+        elif query["result_format"] == ChartDataResultFormat.ARROW:
+            df, _metadata = arrow.arrow_ipc_to_df(data)
 
         # convert all columns to verbose (label) name
         if datasource:
@@ -469,5 +471,11 @@ def apply_client_processing(  # noqa: C901
                     "index": show_default_index,
                 },
             )
+        elif query["result_format"] == ChartDataResultFormat.ARROW:
+            query["data"] = arrow.df_to_arrow_ipc(
+                processed_df,
+                query["coltypes"],
+                index=show_default_index,
+            )
 
     return result
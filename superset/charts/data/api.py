@@ -57,7 +57,7 @@ from superset.daos.exceptions import DatasourceNotFound
 from superset.exceptions import QueryObjectValidationError, SupersetSecurityException
 from superset.extensions import event_logger
 from superset.models.sql_lab import Query
-from superset.utils import json
+from superset.utils import arrow, json
 from superset.utils.core import (
     create_zip,
     DatasourceType,
@@ -536,6 +536,29 @@ class ChartDataRestApi(ChartRestApi):
                 mimetype="application/zip",
             )
 
+        if result_format == ChartDataResultFormat.ARROW:
+            if not result["queries"]:
+                return self.response_400(_("Empty query result"))
+
+            if len(result["queries"]) == 1:
+                return Response(
+                    result["queries"][0]["data"],
+                    mimetype=arrow.ARROW_STREAM_MIMETYPE,
+                )
+
+            # return multi-query results as one Arrow IPC stream per query
+            files = {
+                f"query_{idx + 1}.arrow": query["data"]
+                for idx, query in enumerate(result["queries"])
+            }
+            return Response(
+                create_zip(files),
+                headers=generate_download_headers(
+                    "zip", self._get_default_export_filename(form_data)
+                ),
+                mimetype="application/zip",
+            )
+
         if result_format == ChartDataResultFormat.JSON:
             queries = result["queries"]
             if security_manager.is_guest_user():
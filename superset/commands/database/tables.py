@@ -33,6 +33,7 @@ from superset.exceptions import SupersetException
 from superset.extensions import db, security_manager
 from superset.models.core import Database
 from superset.utils.core import DatasourceName
+from superset.utils.partition_cache import partition_metadata_cache
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +58,14 @@ class TablesDatabaseCommand(BaseCommand):
         self._catalog_name = self._catalog_name or self._model.get_default_catalog()
         if not self._model.db_engine_spec.supports_schemas:
             self._schema_name = None
+        if self._force:
+            # a forced refresh of the table list also refreshes the partitions
+            # looked up by the ``latest_partition`` macros
+            partition_metadata_cache.refresh(
+                self._model.id,
+                catalog=self._catalog_name,
+                schema=self._schema_name,
+            )
         try:
             tables = security_manager.get_datasources_accessible_by_user(
                 database=self._model,
@@ -16,6 +16,7 @@
 # under the License.
 import logging
 from abc import abstractmethod
+from collections.abc import Iterator
 from functools import partial
 from typing import Any, Optional, TypedDict
 
@@ -86,6 +87,18 @@ class BaseDataReader:
     @abstractmethod
     def file_metadata(self, file: FileStorage) -> FileMetadata: ...
 
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read a file into consecutive DataFrames, used by streaming uploads
+
+        Readers able to read a file in chunks override it, by default the whole file
+        is read into a single DataFrame.
+
+        :return: an iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        yield self.file_to_dataframe(file)
+
     def read(
         self,
         file: FileStorage,
@@ -93,28 +106,63 @@ class BaseDataReader:
         table_name: str,
         schema_name: Optional[str],
     ) -> None:
+        if (
+            current_app.config["UPLOAD_STREAMING"]
+            and database.db_engine_spec.supports_streaming_upload
+        ):
+            self._dataframes_to_database(
+                self.file_to_dataframes(file), database, table_name, schema_name
+            )
+            return
+
         self._dataframe_to_database(
             self.file_to_dataframe(file), database, table_name, schema_name
         )
 
-    def _dataframe_to_database(
+    def _dataframes_to_database(
+        self,
+        dataframes: Iterator[pd.DataFrame],
+        database: Database,
+        table_name: str,
+        schema_name: Optional[str],
+    ) -> None:
+        """
+        Upload DataFrames to database as they are read, the first one creating or
+        replacing the table and the next ones appending to it
+
+        :param dataframes:
+        :throws DatabaseUploadFailed: if there is an error reading or uploading a
+            DataFrame, in which case the DataFrames already uploaded are kept
+        """
+        already_exists = self._options.get("already_exists", "fail")
+        for df in dataframes:
+            self._dataframe_to_database(
+                df, database, table_name, schema_name, already_exists
+            )
+            already_exists = "append"
+
+    def _dataframe_to_database(  # pylint: disable=too-many-arguments
         self,
         df: pd.DataFrame,
         database: Database,
         table_name: str,
         schema_name: Optional[str],
+        already_exists: Optional[str] = None,
     ) -> None:
         """
         Upload DataFrame to database
 
         :param df:
+        :param already_exists: what to do if the table already exists, defaults to
+            the ``already_exists`` option
         :throws DatabaseUploadFailed: if there is an error uploading the DataFrame
         """
         try:
             data_table = Table(table=table_name, schema=schema_name)
             to_sql_kwargs = {
                 "chunksize": READ_CHUNK_SIZE,
-                "if_exists": self._options.get("already_exists", "fail"),
+                "if_exists": already_exists
+                or self._options.get("already_exists", "fail"),
                 "index": self._options.get("dataframe_index", False),
             }
             if self._options.get("index_label") and self._options.get(
@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from io import BytesIO
 from pathlib import Path
 from typing import Any, IO, Optional
@@ -38,6 +38,9 @@ from superset.utils.core import check_is_safe_zip
 
 logger = logging.getLogger(__name__)
 
+# Number of rows of the DataFrames read by streaming uploads
+READ_BATCH_SIZE = 65536
+
 
 class ColumnarReaderOptions(ReaderOptions, total=False):
     columns_read: list[str]
@@ -122,6 +125,53 @@ class ColumnarReader(BaseDataReader):
             self._read_buffer_to_dataframe(buffer) for buffer in self._yield_files(file)
         )
 
+    def _read_buffer_to_dataframes(self, buffer: IO[bytes]) -> Iterator[pd.DataFrame]:
+        """
+        Read a Parquet buffer into DataFrames of a record batch each.
+
+        The indexes stored in the buffer are kept like with ``pd.read_parquet``,
+        and default indexes number the rows of the whole buffer. A buffer without
+        rows is read into a single empty DataFrame, so the table is still created.
+        """
+        try:
+            parquet_file = pq.ParquetFile(buffer)
+            columns = self._options.get("columns_read") or None
+            if columns:
+                pandas_metadata = parquet_file.schema_arrow.pandas_metadata or {}
+                columns = columns + [
+                    column
+                    for column in pandas_metadata.get("index_columns", [])
+                    if isinstance(column, str) and column not in columns
+                ]
+            offset = 0
+            for batch in parquet_file.iter_batches(
+                batch_size=READ_BATCH_SIZE, columns=columns
+            ):
+                df = batch.to_pandas()
+                if isinstance(df.index, pd.RangeIndex):
+                    df.index = pd.RangeIndex(offset, offset + len(df))
+                offset += len(df)
+                yield df
+            if offset == 0:
+                empty_table = parquet_file.schema_arrow.empty_table()
+                yield (
+                    empty_table.select(columns) if columns else empty_table
+                ).to_pandas()
+        except (ArrowException, ValueError) as ex:
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read Columnar file into DataFrames of a record batch each
+
+        :return: an iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        for buffer in self._yield_files(file):
+            yield from self._read_buffer_to_dataframes(buffer)
+
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         column_names = set()
         try:
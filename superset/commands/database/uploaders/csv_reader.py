@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterator
 from importlib import util
 from typing import Any, Optional
 
@@ -347,12 +348,13 @@ class CSVReader(BaseDataReader):
         return custom_types, pandas_types
 
     @staticmethod
-    def _read_csv(  # noqa: C901
-        file: FileStorage,
-        kwargs: dict[str, Any],
-    ) -> pd.DataFrame:
-        encoding = kwargs.get("encoding", DEFAULT_ENCODING)
+    def _prepare_read_csv_kwargs(kwargs: dict[str, Any]) -> Optional[dict[str, str]]:
+        """
+        Select the parsing engine and split the column data types of read_csv kwargs.
 
+        :param kwargs: read_csv kwargs, modified in-place
+        :return: the column data types to cast manually, if any
+        """
         # PyArrow engine doesn't support iterator/chunksize/nrows
         # It also has known issues with date parsing and missing values
         # Default to "c" engine for stability
@@ -376,17 +378,27 @@ class CSVReader(BaseDataReader):
 
         kwargs["low_memory"] = False
 
-        try:
-            types = None
-            if "dtype" in kwargs and kwargs["dtype"]:
-                custom_types, pandas_types = CSVReader._split_types(kwargs["dtype"])
-                if pandas_types:
-                    kwargs["dtype"] = pandas_types
-                else:
-                    kwargs.pop("dtype", None)
+        types = None
+        if "dtype" in kwargs and kwargs["dtype"]:
+            custom_types, pandas_types = CSVReader._split_types(kwargs["dtype"])
+            if pandas_types:
+                kwargs["dtype"] = pandas_types
+            else:
+                kwargs.pop("dtype", None)
 
-                # Custom types for our manual casting
-                types = custom_types if custom_types else None
+            # Custom types for our manual casting
+            types = custom_types if custom_types else None
+        return types
+
+    @staticmethod
+    def _read_csv(  # noqa: C901
+        file: FileStorage,
+        kwargs: dict[str, Any],
+    ) -> pd.DataFrame:
+        encoding = kwargs.get("encoding", DEFAULT_ENCODING)
+
+        try:
+            types = CSVReader._prepare_read_csv_kwargs(kwargs)
 
             if "chunksize" in kwargs:
                 chunks = []
@@ -470,6 +482,68 @@ class CSVReader(BaseDataReader):
         except Exception as ex:
             raise DatabaseUploadFailed(_("Error reading CSV file")) from ex
 
+    @staticmethod
+    def _read_csv_chunks(  # noqa: C901
+        file: FileStorage,
+        kwargs: dict[str, Any],
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV file in chunks of ``kwargs["chunksize"]`` rows, casting the
+        column data types of each chunk.
+
+        :param kwargs: read_csv kwargs, with ``chunksize``
+        :return: an iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading a chunk
+        """
+        encoding = kwargs.get("encoding", DEFAULT_ENCODING)
+        read_chunks = False
+
+        try:
+            types = CSVReader._prepare_read_csv_kwargs(kwargs)
+            total_rows = 0
+            max_rows = kwargs.get("nrows")
+            for chunk in pd.read_csv(filepath_or_buffer=file.stream, **kwargs):
+                if max_rows is not None:
+                    chunk = chunk.iloc[: max_rows - total_rows]
+                total_rows += len(chunk)
+                if types:
+                    chunk = CSVReader._cast_column_types(chunk, types, kwargs)
+
+                read_chunks = True
+                yield chunk
+
+                if max_rows is not None and total_rows >= max_rows:
+                    break
+        except DatabaseUploadFailed:
+            raise
+        except UnicodeDecodeError as ex:
+            # the file can only be read again with another encoding if none of its
+            # chunks were consumed yet
+            if encoding != DEFAULT_ENCODING or read_chunks:
+                raise DatabaseUploadFailed(
+                    message=_("Parsing error: %(error)s", error=str(ex))
+                ) from ex
+
+            file.seek(0)
+            detected_encoding = CSVReader._detect_encoding(file)
+            if detected_encoding != encoding:
+                kwargs["encoding"] = detected_encoding
+                yield from CSVReader._read_csv_chunks(file, kwargs)
+                return
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+        except (
+            pd.errors.ParserError,
+            pd.errors.EmptyDataError,
+            ValueError,
+        ) as ex:
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+        except Exception as ex:
+            raise DatabaseUploadFailed(_("Error reading CSV file")) from ex
+
     def file_to_dataframe(self, file: FileStorage) -> pd.DataFrame:
         """
         Read CSV file into a DataFrame
@@ -482,7 +556,30 @@ class CSVReader(BaseDataReader):
 
         use_chunking = rows_to_read is None or rows_to_read > chunk_size * 2
 
-        kwargs = {
+        kwargs = self._read_csv_kwargs()
+        if use_chunking:
+            kwargs["chunksize"] = chunk_size
+            kwargs["iterator"] = True
+
+        return self._read_csv(file, kwargs)
+
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read CSV file into DataFrames of ``READ_CSV_CHUNK_SIZE`` rows
+
+        :return: an iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        kwargs = self._read_csv_kwargs()
+        kwargs["chunksize"] = current_app.config.get("READ_CSV_CHUNK_SIZE", 1000)
+        kwargs["iterator"] = True
+        return self._read_csv_chunks(file, kwargs)
+
+    def _read_csv_kwargs(self) -> dict[str, Any]:
+        """
+        Return the read_csv kwargs of the reader options.
+        """
+        return {
             "encoding": self._options.get("encoding", DEFAULT_ENCODING),
             "header": self._options.get("header_row", 0),
             "decimal": self._options.get("decimal_character", "."),
@@ -499,7 +596,7 @@ class CSVReader(BaseDataReader):
                 if self._options.get("null_values")  # None if an empty list
                 else None
             ),
-            "nrows": rows_to_read,
+            "nrows": self._options.get("rows_to_read"),
             "parse_dates": self._options.get("column_dates"),
             "sep": self._options.get("delimiter", ","),
             "skip_blank_lines": self._options.get("skip_blank_lines", False),
@@ -513,12 +610,6 @@ class CSVReader(BaseDataReader):
             "cache_dates": True,
         }
 
-        if use_chunking:
-            kwargs["chunksize"] = chunk_size
-            kwargs["iterator"] = True
-
-        return self._read_csv(file, kwargs)
-
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         """
         Get metadata from a CSV file
@@ -18,7 +18,7 @@ import logging
 import urllib.parse
 import urllib.request
 from collections.abc import Sequence
-from contextlib import closing
+from contextlib import closing, nullcontext
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional, TYPE_CHECKING, Union
 from urllib.error import URLError
@@ -26,10 +26,13 @@ from uuid import UUID
 
 import pandas as pd
 from celery.exceptions import SoftTimeLimitExceeded
-from flask import current_app as app
+from flask import current_app as app, g
 
-from superset import db, security_manager
+from superset import db, is_feature_enabled, security_manager
+from superset.charts.client_processing import apply_client_processing
+from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.commands.base import BaseCommand
+from superset.commands.chart.data.get_data_command import ChartDataCommand
 from superset.commands.dashboard.permalink.create import CreateDashboardPermalinkCommand
 from superset.commands.exceptions import CommandException, UpdateFailedError
 from superset.commands.report.alert import AlertCommand
@@ -62,7 +65,12 @@ from superset.daos.report import (
 )
 from superset.dashboards.permalink.types import DashboardPermalinkState
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
-from superset.exceptions import SupersetErrorsException, SupersetException
+from superset.exceptions import (
+    SupersetErrorsException,
+    SupersetException,
+    SupersetSecurityException,
+    SupersetTimeoutException,
+)
 from superset.extensions import feature_flag_manager, machine_auth_provider_factory
 from superset.reports.models import (
     ReportDataFormat,
@@ -84,12 +92,22 @@ from superset.reports.notifications.exceptions import (
 from superset.subjects.types import SubjectType
 from superset.tasks.utils import get_executor
 from superset.utils import json
-from superset.utils.core import HeaderDataType, override_user, recipients_string_to_list
+from superset.utils.core import (
+    create_zip,
+    HeaderDataType,
+    override_user,
+    recipients_string_to_list,
+    timeout,
+)
 from superset.utils.csv import get_chart_csv_data, get_chart_dataframe
 from superset.utils.decorators import logs_context, transaction
 from superset.utils.file import sanitize_title
 from superset.utils.pdf import build_pdf_from_screenshots
-from superset.utils.screenshots import ChartScreenshot, DashboardScreenshot
+from superset.utils.screenshots import (
+    BaseScreenshot,
+    ChartScreenshot,
+    DashboardScreenshot,
+)
 from superset.utils.slack import get_channels_with_search, SlackChannelTypes
 from superset.utils.urls import get_url_path
 
@@ -590,10 +608,11 @@ class BaseReportState:
             ]
         try:
             imges = []
-            for screenshot in screenshots:
-                imge = screenshot.get_screenshot(
-                    user=user, log_context=f"execution_id={self._execution_id}"
-                )
+            for imge in BaseScreenshot.get_screenshots(
+                screenshots,
+                user,
+                log_context=f"execution_id={self._execution_id}",
+            ):
                 if imge is None:
                     raise ReportScheduleScreenshotFailedError(
                         "Screenshot failed; aborting to avoid sending a partial report"
@@ -745,6 +764,67 @@ class BaseReportState:
                 raise URLError(response.getcode())
         return content or None
 
+    @staticmethod
+    def _run_chart_data(
+        request_payload: dict[str, Any],
+        user: "User",
+    ) -> Optional[bytes]:
+        """
+        Run a chart data export in this process, as the report executor.
+
+        Produces the same bytes as the chart data endpoint would for the payload,
+        including the post-processing applied to the chart in the UI, without the
+        HTTP round trip through the webserver.
+
+        :param request_payload: Prepared chart data request payload.
+        :param user: The report executor.
+        :return: The data of the single query, the data of all the queries zipped
+            when there are several, or None when there is no data.
+        :raises SupersetSecurityException: If the executor can't export the data.
+        """
+        with override_user(user):
+            # Jinja macros read the form data of the request being served
+            g.form_data = request_payload
+            query_context = ChartDataQueryContextSchema().load(request_payload)
+            command = ChartDataCommand(query_context)
+            command.validate()
+
+            if is_feature_enabled("GRANULAR_EXPORT_CONTROLS"):
+                has_export_perm = security_manager.can_access(
+                    "can_export_data", "Superset"
+                )
+            else:
+                has_export_perm = security_manager.can_access("can_csv", "Superset")
+            if not has_export_perm:
+                raise SupersetSecurityException(
+                    SupersetError(
+                        message="The report executor can't export chart data",
+                        error_type=SupersetErrorType.CHART_SECURITY_ACCESS_ERROR,
+                        level=ErrorLevel.ERROR,
+                    )
+                )
+
+            result = command.run()
+            if query_context.result_type == ChartDataResultType.POST_PROCESSED:
+                result = apply_client_processing(
+                    result,
+                    request_payload.get("form_data"),
+                    query_context.datasource,
+                )
+
+        encoding = app.config["CSV_EXPORT"].get("encoding", "utf-8")
+        files = {
+            f"query_{idx + 1}.{query_context.result_format}": (
+                query["data"].encode(encoding)
+                if isinstance(query["data"], str)
+                else query["data"]
+            )
+            for idx, query in enumerate(result["queries"])
+        }
+        if len(files) > 1:
+            return create_zip(files).getvalue()
+        return next(iter(files.values()), None) or None
+
     def _get_data(self, result_format: ChartDataResultFormat) -> bytes:
         """
         Fetch tabular chart data (CSV or Excel) as raw bytes.
@@ -776,7 +856,8 @@ class BaseReportState:
 
         start_time: datetime = datetime.now(timezone.utc).replace(tzinfo=None)
         user, username = resolve_executor_user(self._report_schedule)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
+        request_timeout = app.config["ALERT_REPORTS_CSV_REQUEST_TIMEOUT"]
+        get_auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
@@ -788,17 +869,25 @@ class BaseReportState:
                 url = self._get_url(result_format=result_format)
                 data = get_chart_csv_data(
                     chart_url=url,
-                    auth_cookies=auth_cookies,
-                    timeout=app.config["ALERT_REPORTS_CSV_REQUEST_TIMEOUT"],
+                    auth_cookies=get_auth_cookies(user),
+                    timeout=request_timeout,
                 )
+            elif app.config["ALERT_REPORTS_IN_PROCESS_CHART_DATA"]:
+                request_payload = self._get_chart_data_request_payload(result_format)
+                url = f"chart {self._report_schedule.chart_id}"
+                # the request timeout also bounds the query run in the worker
+                with (
+                    timeout(int(request_timeout)) if request_timeout else nullcontext()
+                ):
+                    data = self._run_chart_data(request_payload, user)
             else:
                 request_payload = self._get_chart_data_request_payload(result_format)
                 url = get_url_path("ChartDataRestApi.data")
                 data = self._post_chart_data(
                     chart_url=url,
-                    auth_cookies=auth_cookies,
+                    auth_cookies=get_auth_cookies(user),
                     request_payload=request_payload,
-                    timeout=app.config["ALERT_REPORTS_CSV_REQUEST_TIMEOUT"],
+                    timeout=request_timeout,
                 )
             elapsed_seconds: float = (
                 datetime.now(timezone.utc).replace(tzinfo=None) - start_time
@@ -811,7 +900,7 @@ class BaseReportState:
                 elapsed_seconds,
                 self._execution_id,
             )
-        except SoftTimeLimitExceeded as ex:
+        except (SoftTimeLimitExceeded, SupersetTimeoutException) as ex:
             elapsed_seconds = (
                 datetime.now(timezone.utc).replace(tzinfo=None) - start_time
             ).total_seconds()
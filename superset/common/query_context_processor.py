@@ -19,11 +19,13 @@ from __future__ import annotations
 import copy
 import logging
 import re
+from functools import partial
 from typing import Any, cast, ClassVar, Sequence, TYPE_CHECKING
 
 import pandas as pd
 from flask import current_app
 from flask_babel import gettext as _
+from flask_caching.backends import NullCache
 
 from superset.common.chart_data import ChartDataResultFormat
 from superset.common.db_query_status import QueryStatus
@@ -34,16 +36,22 @@ from superset.common.utils.time_range_utils import get_since_until_from_time_ran
 from superset.constants import CACHE_DISABLED_TIMEOUT, CacheRegion
 from superset.daos.annotation_layer import AnnotationLayerDAO
 from superset.daos.chart import ChartDAO
+from superset.distributed_lock.single_flight import single_flight
 from superset.exceptions import (
     QueryObjectValidationError,
     SupersetException,
 )
 from superset.explorables.base import Explorable
-from superset.extensions import cache_manager, security_manager
+from superset.extensions import cache_manager, security_manager, stats_logger_manager
 from superset.models.helpers import QueryResult
 from superset.superset_typing import AdhocColumn, AdhocMetric, Column
-from superset.utils import csv, excel
-from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils import arrow, csv, excel
+from superset.utils.cache import (
+    generate_cache_key,
+    get_cache_generation,
+    set_and_log_cache,
+)
+from superset.utils.concurrency import load_datasource, run_in_thread_pool
 from superset.utils.core import (
     DatasourceType,
     DTTM_ALIAS,
@@ -52,9 +60,11 @@ from superset.utils.core import (
     get_column_name,
     get_column_names_from_columns,
     get_column_names_from_metrics,
+    get_user_id,
     is_adhoc_column,
     is_adhoc_metric,
 )
+from superset.utils.dates import now_as_float
 from superset.utils.pandas_postprocessing.utils import unescape_separator
 from superset.views.utils import get_viz
 from superset.viz import viz_types
@@ -66,6 +76,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+STALE_REFRESH_KEY_PREFIX = "stale_refresh_"
+
 
 class QueryContextProcessor:
     """
@@ -79,6 +91,8 @@ class QueryContextProcessor:
     def __init__(self, query_context: QueryContext):
         self._query_context = query_context
         self._qc_datasource = query_context.datasource
+        # cache keys of the results served from stale cache entries
+        self._stale_cache_keys: list[str] = []
 
     cache_type: ClassVar[str] = "df"
     enforce_numerical_metrics: ClassVar[bool] = True
@@ -132,21 +146,44 @@ class QueryContextProcessor:
                         )
                     )
 
-                query_result = self.get_query_result(query_obj)
-                annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=force_query,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
-                )
+                def run_query(query_cache: QueryCacheManager) -> QueryCacheManager:
+                    query_result = self.get_query_result(query_obj)
+                    annotation_data = self.get_annotation_data(query_obj)
+                    query_cache.set_query_result(
+                        key=cache_key,
+                        query_result=query_result,
+                        annotation_data=annotation_data,
+                        force_query=force_query,
+                        timeout=self.get_cache_timeout(),
+                        datasource_uid=self._qc_datasource.uid,
+                        region=CacheRegion.DATA,
+                    )
+                    return query_cache
+
+                single_flight_timeout = current_app.config[
+                    "CHART_DATA_SINGLE_FLIGHT_TIMEOUT"
+                ]
+                if (
+                    single_flight_timeout
+                    and not force_query
+                    and not isinstance(cache_manager.data_cache.cache, NullCache)
+                ):
+                    cache = single_flight(
+                        key=cache_key,
+                        load=partial(self._load_cached_query_result, cache_key),
+                        run=partial(run_query, cache),
+                        timeout=single_flight_timeout,
+                        lock_ttl=current_app.config["SUPERSET_WEBSERVER_TIMEOUT"],
+                    )
+                else:
+                    run_query(cache)
             except QueryObjectValidationError as ex:
                 cache.error_message = str(ex)
                 cache.status = QueryStatus.FAILED
 
+        if cache_key and cache.is_stale and not force_query:
+            self._stale_cache_keys.append(cache_key)
+
         # the N-dimensional DataFrame has converted into flat DataFrame
         # by `flatten operator`, "comma" in the column is escaped by `escape_separator`
         # the result DataFrame columns should be unescaped
@@ -218,6 +255,7 @@ class QueryContextProcessor:
             "annotation_data": cache.annotation_data,
             "error": cache.error_message,
             "is_cached": cache.is_cached,
+            "is_stale": cache.is_stale,
             "query": cache.query,
             "status": cache.status,
             "stacktrace": cache.stacktrace,
@@ -229,12 +267,22 @@ class QueryContextProcessor:
             "warning": warning,
         }
 
+    @staticmethod
+    def _load_cached_query_result(cache_key: str) -> QueryCacheManager | None:
+        """
+        Load a query result stored in the data cache, e.g. by a concurrent request.
+        """
+        cache = QueryCacheManager.get(key=cache_key, region=CacheRegion.DATA)
+        return cache if cache.is_loaded else None
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         """
         Returns a QueryObject cache key for objects in self.queries
         """
         datasource = self._qc_datasource
         extra_cache_keys = datasource.get_extra_cache_keys(query_obj.to_dict())
+        if cache_generation := get_cache_generation(datasource.uid):
+            kwargs["cache_generation"] = cache_generation
 
         cache_key = (
             query_obj.cache_key(
@@ -361,6 +409,14 @@ class QueryContextProcessor:
                 )
             return result or ""
 
+        if self._query_context.result_format == ChartDataResultFormat.ARROW:
+            return arrow.df_to_arrow_ipc(
+                df,
+                coltypes,
+                verbose_map=self._qc_datasource.data.get("verbose_map", {}),
+                index=not isinstance(df.index, pd.RangeIndex),
+            )
+
         return df.to_dict(orient="records")
 
     def _prepare_contribution_totals(self) -> tuple[list[int], int | None]:
@@ -447,37 +503,117 @@ class QueryContextProcessor:
                 )
             ]
 
-        query_results = [
-            get_query_results(
-                query_obj.result_type or self._query_context.result_type,
-                self._query_context,
-                query_obj,
-                force_cached,
-            )
-            for query_obj in self._query_context.queries
-        ]
+        query_results = self._get_query_results(force_cached)
+        if self._stale_cache_keys:
+            self._refresh_stale_cache()
 
         return_value = {"queries": query_results}
 
         if cache_query_context:
-            cache_key = self.cache_key()
-            set_and_log_cache(
-                cache_manager.cache,
-                cache_key,
-                {
-                    "data": {
-                        # setting form_data into query context cache value as well
-                        # so that it can be used to reconstruct form_data field
-                        # for query context object when reading from cache
-                        "form_data": self._query_context.form_data,
-                        **self._query_context.cache_values,
-                    },
+            return_value["cache_key"] = self._cache_query_context()  # type: ignore
+
+        return return_value
+
+    def _cache_query_context(self) -> str:
+        """
+        Cache the query context, so that it can be rehydrated from its cache key.
+
+        :returns: The cache key of the query context
+        """
+        cache_key = self.cache_key()
+        set_and_log_cache(
+            cache_manager.cache,
+            cache_key,
+            {
+                "data": {
+                    # setting form_data into query context cache value as well
+                    # so that it can be used to reconstruct form_data field
+                    # for query context object when reading from cache
+                    "form_data": self._query_context.form_data,
+                    **self._query_context.cache_values,
                 },
-                self.get_cache_timeout(),
+            },
+            self.get_cache_timeout(),
+        )
+        return cache_key
+
+    def _refresh_stale_cache(self) -> None:
+        """
+        Enqueue a Celery task refreshing the query context, when some of its results
+        were served from cache entries past their soft expiry.
+
+        Refreshes are deduplicated per cache key: a key is claimed in the data cache
+        until the refresh is done, so concurrent viewers of a stale chart don't
+        enqueue the same refresh again.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.async_queries import refresh_chart_data_cache
+
+        refresh_keys = []
+        try:
+            for cache_key in self._stale_cache_keys:
+                refresh_key = f"{STALE_REFRESH_KEY_PREFIX}{cache_key}"
+                if cache_manager.data_cache.add(
+                    refresh_key,
+                    True,
+                    timeout=current_app.config["SQLLAB_ASYNC_TIME_LIMIT_SEC"],
+                ):
+                    refresh_keys.append(refresh_key)
+            if not refresh_keys:
+                return
+
+            job_metadata: dict[str, Any] = {"user_id": get_user_id()}
+            if guest_user := security_manager.get_current_guest_user_if_guest():
+                job_metadata["guest_token"] = guest_user.guest_token
+            refresh_chart_data_cache.delay(
+                job_metadata, self._cache_query_context(), refresh_keys
             )
-            return_value["cache_key"] = cache_key  # type: ignore
+            stats_logger_manager.instance.incr("chart_data.stale_refresh")
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not refresh stale chart data", exc_info=True)
+            if refresh_keys:
+                cache_manager.data_cache.delete_many(*refresh_keys)
+        finally:
+            self._stale_cache_keys = []
+
+    def _get_query_results(self, force_cached: bool) -> list[dict[str, Any]]:
+        """
+        Return the result payload of every query in the query context, in order.
 
-        return return_value
+        When ``CHART_DATA_MAX_PARALLEL_QUERIES`` is larger than 1 and the context
+        holds more than one query, the queries are executed concurrently in a
+        bounded thread pool, each within a copy of the current Flask context,
+        otherwise they are executed one after another.
+        """
+        queries = self._query_context.queries
+        max_workers = min(
+            current_app.config["CHART_DATA_MAX_PARALLEL_QUERIES"] or 1,
+            len(queries),
+        )
+        start = now_as_float()
+        funcs = [
+            partial(
+                get_query_results,
+                query_obj.result_type or self._query_context.result_type,
+                self._query_context,
+                query_obj,
+                force_cached,
+            )
+            for query_obj in queries
+        ]
+        if max_workers > 1:
+            load_datasource(self._query_context.datasource)
+            query_results = run_in_thread_pool(
+                funcs,
+                max_workers,
+                thread_name_prefix="chart-data-query",
+            )
+            stats_key = "chart_data.queries.parallel"
+        else:
+            query_results = [func() for func in funcs]
+            stats_key = "chart_data.queries.serial"
+        stats_logger_manager.instance.timing(stats_key, now_as_float() - start)
+        return query_results
 
     def get_cache_timeout(self) -> int:
         """
@@ -32,6 +32,7 @@ from superset.models.helpers import QueryResult
 from superset.stats_logger import BaseStatsLogger
 from superset.superset_typing import Column
 from superset.utils.cache import set_and_log_cache
+from superset.utils.cache_codec import decode_dataframe, encode_dataframe
 from superset.utils.core import error_msg_from_exception, get_stacktrace
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,20 @@ class QueryCacheManager:
     def stats_logger(self) -> BaseStatsLogger:
         return current_app.config["STATS_LOGGER"]
 
+    @property
+    def df(self) -> DataFrame:
+        """
+        The dataframe of the query result, decoded on first access when it was
+        read encoded from the cache.
+        """
+        if not isinstance(self._df, DataFrame):
+            self._df = decode_dataframe(self._df)
+        return self._df
+
+    @df.setter
+    def df(self, df: Any) -> None:
+        self._df = df
+
     # pylint: disable=too-many-instance-attributes,too-many-arguments
     def __init__(
         self,
@@ -88,6 +103,7 @@ class QueryCacheManager:
         self.queried_dttm = queried_dttm
         self.bq_memory_limited: bool = False
         self.bq_memory_limited_row_count: int = 0
+        self.is_stale: bool = False
 
     # pylint: disable=too-many-arguments
     def set_query_result(
@@ -135,7 +151,7 @@ class QueryCacheManager:
                 g.bq_memory_limited_row_count = 0
 
             value = {
-                "df": self.df,
+                "df": self._encode_df(self.df),
                 "query": self.query,
                 "applied_template_filters": self.applied_template_filters,
                 "applied_filter_columns": self.applied_filter_columns,
@@ -146,6 +162,7 @@ class QueryCacheManager:
                 "dttm": self.queried_dttm,  # Backwards compatibility
                 "bq_memory_limited": self.bq_memory_limited,
                 "bq_memory_limited_row_count": self.bq_memory_limited_row_count,
+                "stale_after": self._get_stale_after(timeout),
             }
             if self.is_loaded and key and self.status != QueryStatus.FAILED:
                 self.set(
@@ -162,6 +179,41 @@ class QueryCacheManager:
             self.status = QueryStatus.FAILED
             self.stacktrace = get_stacktrace()
 
+    @staticmethod
+    def _encode_df(df: DataFrame) -> Any:
+        """
+        Encode the dataframe of a query result as configured by
+        `DATA_CACHE_DATAFRAME_CODEC`, falling back to the dataframe itself (pickled
+        by the cache backend) when it can't be encoded losslessly.
+        """
+        if current_app.config.get("DATA_CACHE_DATAFRAME_CODEC") != "arrow":
+            return df
+        return (
+            encode_dataframe(
+                df,
+                current_app.config.get("DATA_CACHE_ARROW_COMPRESSION"),
+                current_app.config.get("DATA_CACHE_ARROW_COMPRESSION_LEVEL"),
+            )
+            or df
+        )
+
+    @staticmethod
+    def _get_stale_after(timeout: int | None) -> float | None:
+        """
+        Get the soft expiry of a cache entry, as a POSIX timestamp, after which the
+        entry is still served but flagged as stale and refreshed in the background.
+
+        :param timeout: The (hard) timeout of the cache entry
+        :returns: The soft expiry, or None if the entry never becomes stale
+        """
+        if not (ratio := current_app.config.get("DATA_CACHE_SOFT_TIMEOUT_RATIO")):
+            return None
+        if timeout is None:
+            timeout = current_app.config["CACHE_DEFAULT_TIMEOUT"]
+        if not timeout or timeout < 0:
+            return None
+        return datetime.now(tz=timezone.utc).timestamp() + timeout * ratio
+
     @classmethod
     def get(
         cls,
@@ -192,6 +244,7 @@ class QueryCacheManager:
             logger.debug("CACHE GET - Key: %s, Region: %s", key, region)
             current_app.config["STATS_LOGGER"].incr("loading_from_cache")
             try:
+                # decoded on first access, e.g. not for cache checks
                 query_cache.df = cache_value["df"]
                 query_cache.query = cache_value["query"]
                 query_cache.annotation_data = cache_value.get("annotation_data", {})
@@ -219,6 +272,11 @@ class QueryCacheManager:
                 query_cache.bq_memory_limited_row_count = cache_value.get(
                     "bq_memory_limited_row_count", 0
                 )
+                stale_after = cache_value.get("stale_after")
+                query_cache.is_stale = (
+                    stale_after is not None
+                    and datetime.now(tz=timezone.utc).timestamp() > stale_after
+                )
                 current_app.config["STATS_LOGGER"].incr("loaded_from_cache")
             except KeyError as ex:
                 logger.exception(ex)
@@ -88,6 +88,8 @@ STATS_LOGGER = DummyStatsLogger()
 
 # By default will log events to the metadata database with `DBEventLogger`
 # Note that you can use `StdOutEventLogger` for debugging
+# Note that `BufferedDBEventLogger` writes logs to the metadata database in batches
+# from a background thread, so requests don't wait for the logs to be committed
 # Note that you can write your own event logger by extending `AbstractEventLogger`
 # https://github.com/apache/superset/blob/master/superset/utils/log.py
 EVENT_LOGGER = DBEventLogger()
@@ -721,6 +723,10 @@ DEFAULT_FEATURE_FLAGS: dict[str, bool] = {
     # Enables the tagging system for organizing assets
     # @lifecycle: development
     "TAGGING_SYSTEM": False,
+    # Fetch relative time comparison offsets with a single query over the span of
+    # all shifted windows when the result can be sliced back per offset
+    # @lifecycle: development
+    "TIME_COMPARISON_SINGLE_SCAN": False,
     # =================================================================
     # IN TESTING
     # =================================================================
@@ -1321,6 +1327,27 @@ SCREENSHOT_PLAYWRIGHT_WAIT_EVENT = "domcontentloaded"
 SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT = int(
     timedelta(seconds=60).total_seconds() * 1000
 )
+# Maximum number of dashboard tabs of a report captured at the same time by
+# Playwright, each in its own page of the worker's browser. Set to 1 to capture
+# the tabs one after the other.
+SCREENSHOT_PLAYWRIGHT_TAB_CONCURRENCY = 3
+# Maximum time (in seconds) to capture each dashboard tab of a report, from the
+# start of its capture (the tab starts loading earlier, while the previous tabs
+# are captured). Set to None to only bound each operation
+# with SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT.
+SCREENSHOT_PLAYWRIGHT_TAB_TIMEOUT: int | None = int(
+    timedelta(minutes=3).total_seconds()
+)
+# Maximum number of idle browser contexts kept by each worker process once their
+# screenshot succeeded, to be reused by the next screenshots of the same user. A
+# reused context is already authenticated and has the static assets of Superset in
+# its cache. Set to 0 to create a new context for each screenshot.
+SCREENSHOT_PLAYWRIGHT_CONTEXT_POOL_SIZE = 4
+# Maximum age (in seconds) of a reused browser context. Keep it below the lifetime
+# of the session of the executors.
+SCREENSHOT_PLAYWRIGHT_CONTEXT_MAX_AGE = int(timedelta(minutes=10).total_seconds())
+# Maximum number of screenshots taken with a browser context before it's closed
+SCREENSHOT_PLAYWRIGHT_CONTEXT_MAX_USES = 50
 
 # Tiled screenshot configuration for large dashboards
 SCREENSHOT_TILED_ENABLED = True  # Enable tiled screenshots for large dashboards
@@ -1365,6 +1392,59 @@ DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # 10 * 1024 * 1024 for a 10 MB limit.
 DATA_CACHE_MAX_VALUE_SIZE: int | None = None
 
+# Encoding of the query result dataframes stored in the data cache. With "pickle"
+# (the default) dataframes are pickled by the cache backend as is. With "arrow"
+# they are stored as Arrow IPC streams, compressed with
+# DATA_CACHE_ARROW_COMPRESSION ("lz4", "zstd" or None), which uses less cache memory
+# and is faster to read back for large results. Dataframes Arrow can't roundtrip
+# losslessly (e.g. object columns of mixed types) are still pickled.
+DATA_CACHE_DATAFRAME_CODEC: Literal["pickle", "arrow"] = "pickle"
+DATA_CACHE_ARROW_COMPRESSION: Literal["lz4", "zstd"] | None = "zstd"
+# The level of DATA_CACHE_ARROW_COMPRESSION, or None for the codec default
+DATA_CACHE_ARROW_COMPRESSION_LEVEL: int | None = None
+
+# Stale-while-revalidate for the chart data cache. When set, chart data cache entries
+# become stale after this fraction of their timeout (e.g. 0.8 for 80%): stale entries
+# are still served immediately, flagged with `is_stale` in the response, and a Celery
+# task refreshing the query context is enqueued (once per cache key). The cache
+# timeout still bounds how long an entry can be served. Requires Celery workers and
+# a shared data cache. Set to ``None`` to disable (the default).
+DATA_CACHE_SOFT_TIMEOUT_RATIO: float | None = None
+
+# Maximum number of queries from a single chart data request (e.g. the main query,
+# a totals query and a row count query) that are executed concurrently. The same
+# bound applies to the queries of time comparison offsets that miss the cache; the
+# offsets of queries already running concurrently are queried one after the other,
+# so a request uses at most this number of database connections at a time.
+# Each query runs in a bounded thread pool with its own copy of the app and request
+# context, goes through the same cache lookups, and results are returned in request
+# order. Values of 0 or 1 keep the default serial execution.
+CHART_DATA_MAX_PARALLEL_QUERIES: int = 0
+
+# Coalesce identical chart data queries that miss the cache (single-flight), e.g.
+# when the cache of a popular dashboard expires. The first request acquires a
+# DistributedLock on the cache key and runs the query, while concurrent requests for
+# the same key wait for the result to be cached instead of sending the same query
+# to the database. Waiters are notified through Redis pub/sub when
+# DISTRIBUTED_COORDINATION_CONFIG is configured, and poll the cache otherwise. The
+# value is the maximum time in seconds a request waits before running the query
+# itself. The lock expires after SUPERSET_WEBSERVER_TIMEOUT, or twice this value if
+# longer. Requires a shared data cache (DATA_CACHE_CONFIG). Set to ``None`` to
+# disable (the default).
+CHART_DATA_SINGLE_FLIGHT_TIMEOUT: int | None = None
+
+# Encoder used by ``superset.utils.json.dumps``. Set to "orjson" to serialize chart
+# data, dashboard payloads and API responses with the native orjson encoder
+# (``pip install apache-superset[orjson]``), which is several times faster than the
+# default "simplejson" encoder on large payloads. Objects orjson doesn't serialize
+# natively, including NumPy objects and dataclasses, go through the same serializer
+# as with simplejson, while calls with a custom encoder class or options orjson
+# doesn't support, and objects it can't serialize, fall back to simplejson. The
+# output is equivalent but more compact (no whitespace after separators), except
+# that members of plain Enums are serialized as their value where simplejson
+# rejects them. If orjson is not installed simplejson is always used.
+JSON_ENCODER_BACKEND: Literal["simplejson", "orjson"] = "simplejson"
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -1432,6 +1512,15 @@ EXTENSIONS_PERSISTENT_STORAGE: dict[str, Any] = {
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
+# Fold a per-datasource cache generation, stored in the data cache, into the cache
+# keys of chart data queries. Invalidating the cache of datasources through the
+# `/api/v1/cachekey/invalidate` endpoint then starts a new generation, which orphans
+# the existing entries until they expire, instead of enumerating and deleting them.
+# This makes invalidation O(1) per datasource (e.g. after ETL loads) and doesn't
+# require STORE_CACHE_KEYS_IN_METADATA_DB, which adds a metadata DB write to every
+# cache set. Requires a shared data cache backend such as Redis.
+DATASOURCE_CACHE_GENERATIONS = False
+
 # Cache timeout (in seconds) specifically for native dashboard filter option queries.
 # Native filter queries use `DATA_CACHE_CONFIG` as their backend, but their TTL can be
 # configured independently here because they often require fresher data (e.g., for
@@ -1730,6 +1819,21 @@ SQLLAB_PAYLOAD_MAX_MB = None
 # Set to None to disable the check.
 SQL_MAX_PARSE_LENGTH: int | None = 1_000_000
 
+# Number of parsed SQL scripts kept in memory by each process, so SQL parsed
+# several times while handling a request (e.g. to apply RLS and limits, check for
+# mutations or extract tables) is only parsed once. Cached statements are copied
+# before being handed out, so they can be transformed safely. Set to 0 to disable
+# the cache.
+SQL_PARSE_CACHE_SIZE = 256
+
+# Number of seconds each process keeps an in-memory index of the row level security
+# filters, so the filters of a datasource are resolved without querying the
+# metadata database on every request. The index is reloaded as soon as a filter or
+# subject is changed in the same process, or in any process when the version of the
+# index can be shared through CACHE_CONFIG (e.g. Redis); otherwise changes made by
+# other processes apply once the index expires. Set to None to disable the index.
+RLS_FILTER_INDEX_TTL: int | None = None
+
 # Force refresh while auto-refresh in dashboard
 DASHBOARD_AUTO_REFRESH_MODE: Literal["fetch", "force"] = "force"
 # Dashboard auto refresh intervals
@@ -1947,6 +2051,22 @@ RESULTS_BACKEND: BaseCache | None = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# Compression of the results stored in the results backend: "zlib", "zstd" or
+# "lz4", at RESULTS_BACKEND_COMPRESSION_LEVEL (None for the codec default). zstd and
+# lz4 compress and decompress large results much faster than zlib, zstd with a
+# similar ratio. Results are tagged with their codec, so results written before a
+# change of codec stay readable, but only results compressed with "zlib" can be
+# read by older versions of Superset.
+RESULTS_BACKEND_COMPRESSION: Literal["zlib", "zstd", "lz4"] = "zlib"
+RESULTS_BACKEND_COMPRESSION_LEVEL: int | None = None
+
+# Store the data of async query results in chunks of at most this many rows, each
+# under its own key next to the rest of the payload, instead of in a single
+# value. Pages of large results are then read and decoded without reading the
+# whole result. Requires RESULTS_BACKEND_USE_MSGPACK. Results stored in chunks
+# can't be read by older versions of Superset.
+SQLLAB_RESULTS_BACKEND_CHUNK_ROWS: int | None = None
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -2002,6 +2122,14 @@ REPORTS_CSV_NA_NAMES: list[str] | None = None
 # Smaller values use less memory but may be slower for large files
 READ_CSV_CHUNK_SIZE = 1000
 
+# Write uploaded CSV and columnar files to the database chunk by chunk as they are
+# read, instead of reading the whole file in memory first. The first chunk creates
+# or replaces the table and the next ones are appended to it, so the types of the
+# columns are inferred from the first chunk (set the column data types of the
+# upload to avoid mismatches), and an error in a later chunk leaves the chunks
+# already written in the table. Ignored by databases not supporting it, e.g. Hive.
+UPLOAD_STREAMING = False
+
 # A dictionary of items that gets merged into the Jinja context for
 # SQL Lab. The existing context gets updated with this dictionary,
 # meaning values for existing keys get overwritten by the content of this
@@ -2020,6 +2148,21 @@ JINJA_CONTEXT_ADDONS: dict[str, Callable[..., Any]] = {}
 # basis. Example value = `{"presto": CustomPrestoTemplateProcessor}`
 CUSTOM_TEMPLATE_PROCESSORS: dict[str, type[BaseTemplateProcessor]] = {}
 
+# Number of compiled Jinja templates kept in memory by each process, so templates
+# rendered repeatedly (e.g. virtual datasets and metrics on every chart render) are
+# parsed and compiled only once. Templates are still rendered on every request. Set
+# to 0 to disable the cache.
+JINJA_TEMPLATE_CACHE_SIZE = 512
+
+# Number of seconds the partitions looked up by the `latest_partition` and
+# `latest_sub_partition` Jinja macros are cached by each process, for databases
+# without a `partition_cache_timeout` in their `metadata_cache_timeout`. A newly
+# landed partition is only seen once the cached lookup expires, or once the table
+# list of its schema is force-refreshed: the refresh applies to every process when
+# CACHE_CONFIG is a shared cache, and only to the process handling it otherwise.
+# Set to None (the default) to query the partitions on every render.
+PARTITION_METADATA_CACHE_TIMEOUT: int | None = None
+
 # Roles that are controlled by the API / Superset and should not be changed
 # by humans.
 ROBOT_PERMISSION_ROLES = ["Public", "Gamma", "Alpha", "Admin", "sql_lab"]
@@ -2144,6 +2287,12 @@ def engine_context_manager(  # pylint: disable=unused-argument
 
 ENGINE_CONTEXT_MANAGER = engine_context_manager
 
+# Maximum number of SQLAlchemy engines created on behalf of impersonated users
+# kept by each process. With connection pooling enabled, each of these engines
+# holds its own pool of connections; the least recently used engines are evicted
+# and their idle connections closed.
+DATABASE_USER_ENGINE_CACHE_SIZE = 100
+
 # A callable that allows altering the database connection URL and params
 # on the fly, at runtime. This allows for things like impersonation or
 # arbitrary logic. For instance you can wire different users to
@@ -2454,9 +2603,15 @@ ALERT_REPORTS_QUERY_EXECUTION_MAX_TRIES = 1
 # Socket timeout (in seconds) for the HTTP request that fetches chart data when
 # generating CSV/dataframe report attachments. Without a timeout the request
 # blocks indefinitely if the Superset webserver is unreachable from the worker,
-# which leaves the report schedule stuck in the WORKING state. Set to None to
-# disable (not recommended).
+# which leaves the report schedule stuck in the WORKING state. When the chart data
+# is generated in the worker (ALERT_REPORTS_IN_PROCESS_CHART_DATA), it bounds the
+# chart data query instead. Set to None to disable (not recommended).
 ALERT_REPORTS_CSV_REQUEST_TIMEOUT = 60
+# Generate the CSV/Excel attachments of chart reports by running the chart data
+# query in the worker, as the report executor, instead of requesting it from the
+# Superset webserver. Set to False to request it over HTTP, e.g. when the chart
+# data endpoint is customized.
+ALERT_REPORTS_IN_PROCESS_CHART_DATA = True
 # Custom width for screenshots
 ALERT_REPORTS_MIN_CUSTOM_SCREENSHOT_WIDTH = 600
 ALERT_REPORTS_MAX_CUSTOM_SCREENSHOT_WIDTH = 2400
@@ -2857,10 +3012,21 @@ GLOBAL_ASYNC_QUERIES_JWT_SECRET = CHANGE_ME_GLOBAL_ASYNC_QUERIES_JWT_SECRET
 # Lifetime of the async-query JWT, in seconds. After this period the token
 # expires and a fresh one is issued on the next request.
 GLOBAL_ASYNC_QUERIES_JWT_EXPIRATION_SECONDS = int(timedelta(hours=1).total_seconds())
-GLOBAL_ASYNC_QUERIES_TRANSPORT: Literal["polling", "ws"] = "polling"
+# With the "long_polling" transport, requests for async events wait for new events
+# instead of returning right away, so clients are notified as soon as a job
+# completes. Each web server process reads the event streams of all its waiting
+# requests with a single blocking Redis read, so workers must be able to serve
+# concurrent requests (e.g. gthread or gevent gunicorn workers).
+GLOBAL_ASYNC_QUERIES_TRANSPORT: Literal["polling", "long_polling", "ws"] = "polling"
 GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
     timedelta(milliseconds=500).total_seconds() * 1000
 )
+# Maximum number of seconds a long polling request waits for new events.
+GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT = int(timedelta(seconds=25).total_seconds())
+# Number of milliseconds each blocking read of the event streams waits for new
+# events. Streams of requests starting to wait are read once the current read
+# returns, so this bounds how late their first events can be delivered.
+GLOBAL_ASYNC_QUERIES_LONG_POLLING_BLOCK_MS = 1000
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
 
 # Global async queries cache backend configuration options:
@@ -147,7 +147,10 @@ extra_description = markdown(
     '**"metadata_cache_timeout": {"schema_cache_timeout": 600, '
     '"table_cache_timeout": 600}**. '
     "If unset, cache will not be enabled for the functionality. "
-    "A timeout of 0 indicates that the cache never expires.<br/>"
+    "A timeout of 0 indicates that the cache never expires. "
+    "The ``partition_cache_timeout`` applies to the partitions looked up by "
+    "the ``latest_partition`` macros and defaults to the "
+    "``PARTITION_METADATA_CACHE_TIMEOUT`` config.<br/>"
     "3. The ``schemas_allowed_for_file_upload`` is a comma separated list "
     "of schemas that CSVs are allowed to upload to. "
     'Specify it as **"schemas_allowed_for_file_upload": '
@@ -169,7 +172,13 @@ extra_description = markdown(
     "samples/preview, datetime format detection) that an engine rejects with "
     "a read-limit error should fail outright instead of being retried once "
     "with the engine's bounded-read override. Only affects engines that "
-    "implement such an override.",
+    "implement such an override.<br/>"
+    "10. The ``connection_pool`` object enables connection pooling, reusing "
+    "connections across queries instead of opening one for each query. Specify "
+    'it as **"connection_pool": {"pool_size": 5, "max_overflow": 10, '
+    '"pool_timeout": 30, "pool_recycle": 3600, "pool_pre_ping": true}**, '
+    "where every key is optional. When impersonating users, each user gets a "
+    "separate pool.",
     True,
 )
 get_export_ids_schema = {
@@ -261,7 +270,15 @@ def masked_encrypted_extra_validator(value: str) -> None:
     encrypted_extra_validator(value)
 
 
-def extra_validator(value: str) -> str:
+class DatabaseConnectionPoolSchema(Schema):
+    pool_size = fields.Integer(validate=Range(min=1))
+    max_overflow = fields.Integer(validate=Range(min=-1))
+    pool_timeout = fields.Float(validate=Range(min=0))
+    pool_recycle = fields.Integer(validate=Range(min=-1))
+    pool_pre_ping = fields.Boolean()
+
+
+def extra_validator(value: str) -> str:  # noqa: C901
     """
     Validate that extra is a valid JSON string, and that metadata_params
     keys are on the call signature for SQLAlchemy Metadata
@@ -310,6 +327,7 @@ def extra_validator(value: str) -> str:
                 "schema_cache_timeout",
                 "table_cache_timeout",
                 "catalog_cache_timeout",
+                "partition_cache_timeout",
             ):
                 # An absent key is unset (valid). When the key is present the
                 # value must be a non-negative integer. A present ``null`` and
@@ -334,6 +352,9 @@ def extra_validator(value: str) -> str:
                             )
                         ]
                     )
+
+        if "connection_pool" in extra_:
+            DatabaseConnectionPoolSchema().load(extra_["connection_pool"])
     return value
 
 
@@ -982,6 +1003,7 @@ class ImportV1DatabaseExtraSchema(Schema):
     per_user_caching = fields.Boolean(required=False)
     version = fields.String(required=False, allow_none=True)
     schema_options = fields.Dict(keys=fields.Str(), values=fields.Raw())
+    connection_pool = fields.Nested(DatabaseConnectionPoolSchema, required=False)
 
 
 class ImportV1DatabaseSchema(Schema):
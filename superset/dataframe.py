@@ -19,6 +19,7 @@
 import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from superset.utils.core import JS_MAX_INTEGER
@@ -37,6 +38,25 @@ def _convert_big_integers(val: Any) -> Any:
     return str(val) if isinstance(val, int) and abs(val) > JS_MAX_INTEGER else val
 
 
+def _box_native(val: Any) -> Any:
+    """
+    Convert a NumPy scalar to the equivalent native Python object.
+
+    Datetimes and timedeltas are converted to their pandas types, as their
+    ``item`` may return integers of nanoseconds.
+
+    :param val: the value to convert
+    :returns: the native value, or the value itself if it isn't a NumPy scalar
+    """
+    if isinstance(val, np.datetime64):
+        return pd.Timestamp(val)
+    if isinstance(val, np.timedelta64):
+        return pd.Timedelta(val)
+    if isinstance(val, np.generic):
+        return val.item()
+    return val
+
+
 def _is_na(val: Any) -> bool:
     """
     Check if a value is NA/NaN for scalar values only.
@@ -53,6 +73,43 @@ def _is_na(val: Any) -> bool:
         return False
 
 
+def _column_to_values(column: pd.Series) -> list[Any]:
+    """
+    Convert a DataFrame column to a list of JSON friendly values.
+
+    Numeric, boolean and datetime columns are converted in bulk, with masks
+    locating the NA values and integers over ``JS_MAX_INTEGER``; only object and
+    extension columns are processed value by value.
+
+    :param column: the column to convert
+    :returns: the values of the column, as native Python objects
+    """
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        array = column.to_numpy()
+        values = array.tolist()
+        if dtype.kind == "f":
+            for idx in np.flatnonzero(np.isnan(array)):
+                values[idx] = None
+        elif dtype.kind in "iu":
+            mask = array > JS_MAX_INTEGER
+            if dtype.kind == "i":
+                mask |= array < -JS_MAX_INTEGER
+            for idx in np.flatnonzero(mask):
+                values[idx] = str(values[idx])
+        return values
+
+    if dtype.kind in "mM":
+        array = column.astype(object).to_numpy()
+        array[column.isna().to_numpy()] = None
+        return array.tolist()
+
+    return [
+        None if _is_na(val) else _convert_big_integers(_box_native(val))
+        for val in column
+    ]
+
+
 def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
     """
     Convert a DataFrame to a set of records.
@@ -60,6 +117,9 @@ def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
     NaN values are converted to None for JSON compatibility.
     This handles division by zero and other operations that produce NaN.
 
+    The DataFrame is converted one column at a time, which is much faster than
+    processing each value of ``DataFrame.to_dict`` for large results.
+
     :param dframe: the DataFrame to convert
     :returns: a list of dictionaries reflecting each single row of the DataFrame
     """
@@ -67,12 +127,6 @@ def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
         logger.warning(
             "DataFrame columns are not unique, some columns will be omitted."
         )
-    records = dframe.to_dict(orient="records")
-
-    for record in records:
-        for key in record:
-            record[key] = (
-                None if _is_na(record[key]) else _convert_big_integers(record[key])
-            )
-
-    return records
+    columns = dframe.columns.tolist()
+    values = [_column_to_values(dframe.iloc[:, idx]) for idx in range(len(columns))]
+    return [dict(zip(columns, row, strict=True)) for row in zip(*values, strict=True)]
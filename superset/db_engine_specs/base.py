@@ -39,6 +39,7 @@ from urllib.parse import urlencode, urljoin
 from uuid import UUID, uuid4
 
 import pandas as pd
+import pyarrow as pa
 import requests
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
@@ -566,6 +567,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # if True, database will be listed as option in the upload file form
     supports_file_upload = True
 
+    # Whether uploaded files can be written in chunks with ``df_to_sql``, the first
+    # chunk creating or replacing the table and the next ones appending to it
+    supports_streaming_upload = True
+
     # Whether the engine supports SQL GROUPING SETS / ROLLUP / CUBE. When True,
     # consumers (e.g. the pivot table's non-additive totals) can collapse the
     # per-rollup-level queries into a single GROUPING SETS query instead of
@@ -1316,6 +1321,50 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def fetch_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        """
+        Fetch the results of a cursor as an Arrow table.
+
+        Some DB-API drivers can return results as Arrow record batches, which lets
+        the result set be built without converting every value to a Python object
+        first. Engine specs whose driver supports it override this method; the
+        default returns None, in which case rows are fetched with `fetch_data`.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query, or None if the driver can't return Arrow data
+        """
+        return None
+
+    @classmethod
+    def read_arrow_batches(
+        cls,
+        reader: pa.RecordBatchReader,
+        limit: int | None = None,
+    ) -> pa.Table:
+        """
+        Read the Arrow record batches returned by a cursor into a table.
+
+        When the limit is applied by fetching (`LimitMethod.FETCH_MANY`), batches
+        are only read until the limit is reached.
+
+        :param reader: Reader of the record batches returned by the cursor
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query
+        """
+        if not (cls.limit_method == LimitMethod.FETCH_MANY and limit):
+            return reader.read_all()
+
+        batches: list[pa.RecordBatch] = []
+        num_rows = 0
+        for batch in reader:
+            batches.append(batch)
+            num_rows += batch.num_rows
+            if num_rows >= limit:
+                break
+        return pa.Table.from_batches(batches, schema=reader.schema).slice(0, limit)
+
     @classmethod
     def fetch_data_with_cursor(
         cls,
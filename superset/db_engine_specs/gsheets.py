@@ -145,6 +145,8 @@ class GSheetsEngineSpec(ShillelaghEngineSpec):
     }
 
     supports_file_upload = True
+    # ``df_to_sql`` doesn't support appending to a sheet
+    supports_streaming_upload = False
 
     # OAuth 2.0
     supports_oauth2 = True
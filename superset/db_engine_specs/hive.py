@@ -101,6 +101,8 @@ class HiveEngineSpec(PrestoEngineSpec):
     # verified against this query pattern, so fall back to one query per
     # rollup level instead of assuming native support.
     supports_grouping_sets: bool = False
+    # ``df_to_sql`` doesn't support appending to a table
+    supports_streaming_upload = False
 
     metadata = {
         "description": (
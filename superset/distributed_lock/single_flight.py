@@ -0,0 +1,199 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Single-flight coalescing of identical work across workers."""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from contextlib import ExitStack
+from typing import Any, Callable, TYPE_CHECKING, TypeVar
+
+import redis
+
+from superset.distributed_lock import DistributedLock
+from superset.exceptions import (
+    AcquireDistributedLockFailedException,
+    LockAlreadyHeldException,
+)
+from superset.extensions import stats_logger_manager
+
+if TYPE_CHECKING:
+    from redis.client import PubSub
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SINGLE_FLIGHT_NAMESPACE = "single_flight"
+SINGLE_FLIGHT_CHANNEL_PREFIX = "single_flight:"
+
+# Interval between checks of the cache (and of the lock) while waiting
+DEFAULT_POLL_INTERVAL = 0.5
+
+
+def _get_redis_client() -> "redis.Redis[Any] | None":
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.distributed_lock.base import get_redis_client
+
+    return get_redis_client()
+
+
+def _subscribe(redis_client: "redis.Redis[Any]", channel: str) -> PubSub | None:
+    try:
+        pubsub = redis_client.pubsub()
+        pubsub.subscribe(channel)
+        return pubsub
+    except redis.RedisError as ex:
+        logger.warning("Could not subscribe to %s: %s", channel, ex)
+        return None
+
+
+def _notify(redis_client: "redis.Redis[Any] | None", channel: str) -> None:
+    if redis_client is None:
+        return
+    try:
+        redis_client.publish(channel, "done")
+    except redis.RedisError as ex:
+        logger.warning("Could not publish to %s: %s", channel, ex)
+
+
+def _wait(pubsub: PubSub | None, timeout: float) -> bool:
+    """
+    Wait for a notification, returning whether one was received.
+    """
+    if pubsub is not None:
+        try:
+            return (
+                pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+                is not None
+            )
+        except redis.RedisError as ex:
+            logger.warning("Error waiting for a single-flight notification: %s", ex)
+    time.sleep(timeout)
+    return False
+
+
+def _lead(
+    stack: ExitStack,
+    load: Callable[[], T | None],
+    run: Callable[[], T],
+    redis_client: "redis.Redis[Any] | None",
+    channel: str,
+) -> T:
+    try:
+        # the result may have been stored since it was last checked
+        if (result := load()) is not None:
+            return result
+        stats_logger_manager.instance.incr("single_flight.run")
+        return run()
+    finally:
+        # release the lock before waking up the waiters
+        stack.close()
+        _notify(redis_client, channel)
+
+
+def single_flight(
+    key: str,
+    load: Callable[[], T | None],
+    run: Callable[[], T],
+    timeout: float,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    lock_ttl: int | None = None,
+) -> T:
+    """
+    Coalesce identical work across threads, processes and workers.
+
+    The first caller for a key acquires a ``DistributedLock`` and runs ``run``,
+    which is expected to store its result where ``load`` finds it (e.g. a cache).
+    Concurrent callers wait for the result and return it from ``load`` instead of
+    running the same work again. They are woken up through Redis pub/sub when
+    ``DISTRIBUTED_COORDINATION_CONFIG`` is configured, and poll otherwise.
+
+    Waiters try to acquire the lock again only when notified that the first caller
+    finished without storing a result, e.g. because the work failed, so that one of
+    them takes over, and once after ``timeout``: if the first caller is gone they
+    take over, otherwise they run the work themselves. Callers that can't reach the
+    lock backend run the work right away.
+
+    :param key: The key identifying the work, e.g. a cache key
+    :param load: Returns the stored result, or None if not available yet
+    :param run: Runs the work, storing and returning its result
+    :param timeout: Maximum time in seconds to wait for the result
+    :param poll_interval: Maximum time in seconds between checks of the result
+    :param lock_ttl: TTL of the lock in seconds, which should cover the time the
+        work takes. It is at least twice ``timeout``, so that the lock doesn't
+        expire while the waiters still wait for it
+    :returns: The result of the work
+    """
+    channel = f"{SINGLE_FLIGHT_CHANNEL_PREFIX}{key}"
+    redis_client = _get_redis_client()
+    # subscribe before checking the lock, so that a notification sent in between
+    # can't be missed
+    pubsub = _subscribe(redis_client, channel) if redis_client is not None else None
+    deadline = time.monotonic() + timeout
+    ttl_seconds = max(lock_ttl or 0, 2 * math.ceil(timeout))
+    stats_logger = stats_logger_manager.instance
+
+    try:
+        # the lock is only tried before waiting, on notifications and after the
+        # timeout: with the database backend each attempt is a write to the
+        # metadata database
+        timed_out = False
+        while True:
+            with ExitStack() as stack:
+                try:
+                    stack.enter_context(
+                        DistributedLock(
+                            SINGLE_FLIGHT_NAMESPACE,
+                            ttl_seconds=ttl_seconds,
+                            key=key,
+                        )
+                    )
+                except LockAlreadyHeldException:
+                    pass
+                except AcquireDistributedLockFailedException as ex:
+                    logger.warning("Could not coalesce %s: %s", key, ex)
+                    return run()
+                else:
+                    return _lead(stack, load, run, redis_client, channel)
+
+            if timed_out:
+                break
+
+            timed_out = True
+            while (remaining := deadline - time.monotonic()) > 0:
+                notified = _wait(pubsub, min(poll_interval, remaining))
+                if (result := load()) is not None:
+                    stats_logger.incr("single_flight.coalesced")
+                    return result
+                if notified:
+                    # the lock was released without storing a result
+                    timed_out = False
+                    break
+
+        logger.warning("Timed out waiting for %s, running it", key)
+        stats_logger.incr("single_flight.timeout")
+        return run()
+    finally:
+        if pubsub is not None:
+            try:
+                pubsub.unsubscribe()
+                pubsub.close()
+            except redis.RedisError as ex:
+                logger.debug("Error closing pub/sub: %s", ex)
@@ -1140,6 +1140,12 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
 
         register_session_invalidation_events(appbuilder.sm.user_model)
 
+        # Reload the RLS filter index of every process when filters or subjects
+        # are changed.
+        from superset.security.rls_index import register_rls_index_events
+
+        register_rls_index_events()
+
         @self.superset_app.context_processor
         def get_common_bootstrap_data() -> dict[str, Any]:
             # Import here to avoid circular imports
@@ -20,14 +20,23 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache, partial
-from typing import Any, Callable, cast, TYPE_CHECKING, TypedDict, Union
+from types import CodeType
+from typing import Any, Callable, cast, Hashable, TYPE_CHECKING, TypedDict, Union
 
+from cachetools import LRUCache
 from flask import current_app, g, has_request_context, request
 from flask_babel import gettext as _
-from jinja2 import DebugUndefined, Environment, TemplateSyntaxError, UndefinedError
+from jinja2 import (
+    DebugUndefined,
+    Environment,
+    Template,
+    TemplateSyntaxError,
+    UndefinedError,
+)
 from jinja2.exceptions import SecurityError
 from jinja2.sandbox import SandboxedEnvironment
 from sqlalchemy.engine.interfaces import Dialect
@@ -56,6 +65,7 @@ from superset.utils.core import (
     get_username,
     merge_extra_filters,
 )
+from superset.utils.partition_cache import partition_metadata_cache
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import SqlaTable
@@ -750,6 +760,64 @@ class SupersetSandboxedEnvironment(SandboxedEnvironment):
         return super().is_safe_attribute(obj, attr, value)
 
 
+class CompiledTemplateCache:
+    """
+    LRU cache of compiled Jinja templates, shared by the template processors.
+
+    Parsing and compiling a template is much more expensive than rendering it, and
+    the same templates are rendered again and again. Template processors create an
+    environment per request, so the cache holds the compiled code of the templates,
+    which is bound to the environment of the request when the template is loaded.
+    """
+
+    def __init__(self) -> None:
+        self._cache: LRUCache[tuple[Hashable, str], CodeType] = LRUCache(maxsize=0)
+        self._lock = threading.Lock()
+
+    def get_template(
+        self,
+        env: Environment,
+        environment_key: Hashable,
+        source: str,
+    ) -> Template:
+        """
+        Load a template, compiling it only if it isn't cached.
+
+        :param env: The environment of the template
+        :param environment_key: A key identifying how the environment compiles
+            templates, shared by environments compiling templates identically
+        :param source: The template source
+        :returns: The template, bound to the environment
+        """
+        maxsize = current_app.config["JINJA_TEMPLATE_CACHE_SIZE"]
+        if not maxsize:
+            return env.from_string(source)
+
+        key = (environment_key, source)
+        with self._lock:
+            if self._cache.maxsize != maxsize:
+                self._cache = LRUCache(maxsize=maxsize)
+            code = self._cache.get(key)
+
+        stats_logger = current_app.config["STATS_LOGGER"]
+        if code is None:
+            stats_logger.incr("jinja_template_cache.miss")
+            code = env.compile(source)
+            with self._lock:
+                self._cache[key] = code
+        else:
+            stats_logger.incr("jinja_template_cache.hit")
+
+        return env.template_class.from_code(env, code, env.make_globals(None))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+compiled_template_cache = CompiledTemplateCache()
+
+
 class BaseTemplateProcessor:
     """
     Base class for database-specific jinja context
@@ -780,11 +848,12 @@ class BaseTemplateProcessor:
         self._applied_filters = applied_filters
         self._removed_filters = removed_filters
         self._context: dict[str, Any] = {}
+        self._dialect = database.get_dialect()
         self.env: Environment = SupersetSandboxedEnvironment(undefined=DebugUndefined)
         self.set_context(**kwargs)
 
         # custom filters
-        self.env.filters["where_in"] = WhereInMacro(database.get_dialect())
+        self.env.filters["where_in"] = WhereInMacro(self._dialect)
         self.env.filters["to_datetime"] = to_datetime
 
     def set_context(self, **kwargs: Any) -> None:
@@ -797,6 +866,28 @@ class BaseTemplateProcessor:
         """
         return self._context.copy()
 
+    def get_environment_key(self) -> Hashable:
+        """
+        Returns a key identifying how the environment compiles templates.
+
+        Compiled templates are shared by the processors with the same key. Filters
+        may be evaluated when compiling templates, so the key includes the dialect
+        of the ``where_in`` filter. Processors whose environment depends on more
+        than their class and dialect must extend the key.
+        """
+        return (type(self), type(self.env), type(self._dialect))
+
+    def get_template(self, sql: str) -> Template:
+        """
+        Returns the compiled template of a SQL template, from the compiled template
+        cache when possible.
+        """
+        return compiled_template_cache.get_template(
+            self.env,
+            self.get_environment_key(),
+            sql,
+        )
+
     def process_template(self, sql: str, **kwargs: Any) -> str:
         """Processes a sql template
 
@@ -805,7 +896,7 @@ class BaseTemplateProcessor:
         "SELECT '2017-01-01T00:00:00'"
         """
         try:
-            template = self.env.from_string(sql)
+            template = self.get_template(sql)
         except (
             TemplateSyntaxError,
             SecurityError,
@@ -986,9 +1077,16 @@ class PrestoTemplateProcessor(JinjaTemplateProcessor):
         from superset.db_engine_specs.presto import PrestoEngineSpec
 
         table_name, schema = self._schema_table(table_name, self._schema)
-        return cast(PrestoEngineSpec, self._database.db_engine_spec).latest_partition(
-            database=self._database, table=Table(table_name, schema)
-        )[1]
+        table = Table(table_name, schema)
+        db_engine_spec = cast(PrestoEngineSpec, self._database.db_engine_spec)
+        return partition_metadata_cache.get(
+            self._database,
+            table,
+            "latest_partitions",
+            lambda: db_engine_spec.latest_partition(
+                database=self._database, table=table
+            )[1],
+        )
 
     def latest_sub_partition(self, table_name: str, **kwargs: Any) -> Any:
         table_name, schema = self._schema_table(table_name, self._schema)
@@ -996,10 +1094,15 @@ class PrestoTemplateProcessor(JinjaTemplateProcessor):
         # pylint: disable=import-outside-toplevel
         from superset.db_engine_specs.presto import PrestoEngineSpec
 
-        return cast(
-            PrestoEngineSpec, self._database.db_engine_spec
-        ).latest_sub_partition(
-            database=self._database, table=Table(table_name, schema), **kwargs
+        table = Table(table_name, schema)
+        db_engine_spec = cast(PrestoEngineSpec, self._database.db_engine_spec)
+        return partition_metadata_cache.get(
+            self._database,
+            table,
+            ("latest_sub_partition", json.dumps(kwargs, sort_keys=True, default=str)),
+            lambda: db_engine_spec.latest_sub_partition(
+                database=self._database, table=table, **kwargs
+            ),
         )
 
     latest_partition = first_latest_partition
@@ -1013,7 +1116,7 @@ class SparkTemplateProcessor(HiveTemplateProcessor):
     engine = "spark"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self.env.from_string(sql)
+        template = self.get_template(sql)
         kwargs.update(self._context)
 
         # Backwards compatibility if migrating from Hive.
@@ -1026,7 +1129,7 @@ class TrinoTemplateProcessor(PrestoTemplateProcessor):
     engine = "trino"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self.env.from_string(sql)
+        template = self.get_template(sql)
         kwargs.update(self._context)
 
         # Backwards compatibility if migrating from Presto.
@@ -23,9 +23,11 @@ from __future__ import annotations
 
 import builtins
 import logging
+import os
 import textwrap
 import threading
 from ast import literal_eval
+from collections import OrderedDict
 from contextlib import closing, contextmanager, nullcontext, suppress
 from copy import deepcopy
 from datetime import datetime
@@ -36,6 +38,7 @@ from urllib.parse import quote
 
 import numpy
 import pandas as pd
+import pyarrow as pa
 import sqlalchemy as sqla
 import sshtunnel
 from flask import current_app as app, g, has_app_context
@@ -87,6 +90,7 @@ from superset.superset_typing import (
 from superset.utils import cache as cache_util, core as utils, json
 from superset.utils.backports import StrEnum
 from superset.utils.core import get_query_source_from_request, get_username
+from superset.utils.engine_pool import get_pool_engine_kwargs
 from superset.utils.oauth2 import (
     check_for_oauth2,
     get_oauth2_access_token,
@@ -101,10 +105,46 @@ logger = logging.getLogger(__name__)
 # Lock-guarded against the gunicorn-threaded check-then-set race on first
 # access. Cache is per-process, per-(URL + final engine_kwargs), so a
 # password rotation, host change, or DB_CONNECTION_MUTATOR producing
-# different kwargs naturally falls through to a fresh engine.
-_ENGINE_CACHE: dict[tuple[int, str, str], Engine] = {}
+# different kwargs naturally falls through to a fresh engine. Ordered from the
+# least to the most recently used, to bound the engines of impersonated users.
+_ENGINE_CACHE: OrderedDict[tuple[int, str, str, str | None], Engine] = OrderedDict()
 _ENGINE_CACHE_LOCK = threading.Lock()
 
+
+def reset_engine_pools() -> None:
+    """
+    Reset the connection pools of the cached engines in a forked process.
+
+    Pooled connections inherited from the parent process share its sockets, so
+    the child drops them without closing them (which would also close them for
+    the parent) and opens its own. This runs after every fork, e.g. in Celery
+    prefork workers or gunicorn workers forked from a preloaded app.
+    """
+    global _ENGINE_CACHE_LOCK  # pylint: disable=global-statement
+
+    # the child only runs the forking thread: the lock is replaced rather than
+    # acquired, as it stays locked forever if another thread held it at fork time
+    _ENGINE_CACHE_LOCK = threading.Lock()
+    for engine in list(_ENGINE_CACHE.values()):
+        engine.dispose(close=False)
+
+
+def _pop_user_engines(max_size: int) -> list[Engine]:
+    """
+    Remove the least recently used engines of impersonated users from the cache,
+    keeping at most ``max_size`` of them. Must be called with the cache lock held.
+
+    :returns: The removed engines, to be disposed
+    """
+    user_keys = [key for key in _ENGINE_CACHE if key[3] is not None]
+    return [
+        _ENGINE_CACHE.pop(key) for key in user_keys[: max(len(user_keys) - max_size, 0)]
+    ]
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_engine_pools)
+
 if TYPE_CHECKING:
     from superset_core.queries.types import AsyncQueryHandle, QueryOptions, QueryResult
 
@@ -468,6 +508,14 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
     def table_cache_timeout(self) -> int | None:
         return self.metadata_cache_timeout.get("table_cache_timeout")
 
+    @property
+    def partition_cache_enabled(self) -> bool:
+        return "partition_cache_timeout" in self.metadata_cache_timeout
+
+    @property
+    def partition_cache_timeout(self) -> int | None:
+        return self.metadata_cache_timeout.get("partition_cache_timeout")
+
     @property
     def default_schemas(self) -> list[str]:
         return self.get_extra().get("default_schemas", [])
@@ -635,7 +683,20 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
 
         extra = self.get_extra(source)
         engine_kwargs = extra.get("engine_params", {})
-        if nullpool:
+        # Databases opting into connection pooling get a pooled engine in place
+        # of the default ``NullPool`` one. The pool lives as long as the cached
+        # engine, so private engines and engines going through an SSH tunnel
+        # (whose local port changes on every call) are never pooled.
+        pool_config = extra.get("connection_pool")
+        if (
+            nullpool
+            and pool_config
+            and cacheable
+            and self.id is not None
+            and not self.ssh_tunnel
+        ):
+            engine_kwargs.update(get_pool_engine_kwargs(self.id, pool_config))
+        elif nullpool:
             engine_kwargs["poolclass"] = NullPool
         connect_args = engine_kwargs.setdefault("connect_args", {})
 
@@ -703,16 +764,24 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
         # mutate the engine's event listeners (``get_sqla_engine`` with
         # prequeries) pass ``cacheable=False`` for a private engine: listener
         # registration on a shared engine races with concurrent connection
-        # checkouts iterating the same unlocked listener deque.
-        cache_key: tuple[int, str, str] | None = None
+        # checkouts iterating the same unlocked listener deque. The effective
+        # user is part of the key when impersonating, so pooled connections
+        # opened on behalf of a user are never handed to another one, even when
+        # the engine spec impersonates without changing the URL or arguments.
+        # As these engines (and their pools) multiply with users and refreshed
+        # OAuth2 tokens, only the ``DATABASE_USER_ENGINE_CACHE_SIZE`` most
+        # recently used ones are kept.
+        cache_key: tuple[int, str, str, str | None] | None = None
         if cacheable and self.id is not None:
             cache_key = (
                 self.id,
                 str(sqlalchemy_url),
                 repr(sorted(engine_kwargs.items())),
+                effective_username if self.impersonate_user else None,
             )
             with _ENGINE_CACHE_LOCK:
                 if cached := _ENGINE_CACHE.get(cache_key):
+                    _ENGINE_CACHE.move_to_end(cache_key)
                     return cached
         try:
             if "future" not in engine_kwargs:
@@ -721,8 +790,17 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
         except Exception as ex:
             raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
         if cache_key is not None:
+            evicted: list[Engine] = []
             with _ENGINE_CACHE_LOCK:
                 _ENGINE_CACHE[cache_key] = engine
+                if cache_key[3] is not None:
+                    evicted = _pop_user_engines(
+                        app.config["DATABASE_USER_ENGINE_CACHE_SIZE"]
+                    )
+            # close the idle connections of the pools of the evicted engines,
+            # connections in use are closed when they are returned
+            for evicted_engine in evicted:
+                evicted_engine.dispose()
         return engine
 
     def add_database_to_signature(
@@ -881,7 +959,7 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
         catalog: str | None = None,
         schema: str | None = None,
         fetch_last_result: bool = False,
-    ) -> tuple[Any, list[tuple[Any, ...]] | None, DbapiDescription | None]:
+    ) -> tuple[Any, list[tuple[Any, ...]] | pa.Table | None, DbapiDescription | None]:
         """
         Internal method to execute SQL with mutation and logging.
 
@@ -933,7 +1011,9 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
 
                 # Fetch results from last statement if requested
                 if fetch_last_result and i == len(script.statements) - 1:
-                    rows = self.db_engine_spec.fetch_data(cursor)
+                    rows = self.db_engine_spec.fetch_arrow(cursor)
+                    if rows is None:
+                        rows = self.db_engine_spec.fetch_data(cursor)
                     # Some asynchronous DB-API drivers expose placeholder metadata
                     # until fetching waits for the operation to finish.
                     description = cursor.description
@@ -1002,7 +1082,7 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
     def load_into_dataframe(
         self,
         description: DbapiDescription,
-        data: list[tuple[Any, ...]],
+        data: list[tuple[Any, ...]] | pa.Table,
     ) -> pd.DataFrame:
         result_set = SupersetResultSet(
             data,
@@ -1568,16 +1648,20 @@ def _evict_engine_cache(
     """Evict all cached engines for a database when it is updated or deleted.
 
     URL/kwargs changes already produce a new cache key, so stale engines are
-    never served to callers.  This eviction step is purely to reclaim memory:
-    without it, old engines for a renamed host or rotated password would linger
-    in _ENGINE_CACHE until the process restarted.
+    never served to callers.  This eviction step is purely to reclaim resources:
+    without it, old engines for a renamed host or rotated password (and the
+    connections of pooled engines) would linger in _ENGINE_CACHE until the
+    process restarted.
     """
     if target.id is None:
         return
     with _ENGINE_CACHE_LOCK:
         stale = [k for k in _ENGINE_CACHE if k[0] == target.id]
-        for k in stale:
-            _ENGINE_CACHE.pop(k, None)
+        engines = [_ENGINE_CACHE.pop(k) for k in stale]
+    # close the idle connections of pooled engines; connections in use are
+    # closed when they are returned
+    for engine in engines:
+        engine.dispose()
 
 
 sqla.event.listen(Database, "after_update", _evict_engine_cache)
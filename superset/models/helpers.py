@@ -28,6 +28,7 @@ import uuid
 from collections.abc import Hashable, Iterator
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from typing import (
     Any,
     Callable,
@@ -123,11 +124,13 @@ from superset.superset_typing import (
     QueryObjectDict,
 )
 from superset.utils import core as utils, json
+from superset.utils.concurrency import load_datasource, run_in_thread_pool
 from superset.utils.core import (
     DateColumn,
     DTTM_ALIAS,
     FilterOperator,
     GenericDataType,
+    get_base_axis_columns,
     get_base_axis_labels,
     get_column_name,
     get_column_names,
@@ -163,6 +166,7 @@ class ValidationResultDict(TypedDict):
 
 if TYPE_CHECKING:
     from superset.common.query_object import QueryObject
+    from superset.common.utils.query_cache_manager import QueryCacheManager
     from superset.connectors.sqla.models import SqlMetric, TableColumn
     from superset.db_engine_specs import BaseEngineSpec
     from superset.models.core import Database
@@ -179,6 +183,24 @@ OFFSET_JOIN_COLUMN_SUFFIX = "__offset_join_column_"
 R_SUFFIX = "__right_suffix"
 
 
+# pandas frequencies of the fixed-length time grains, used to check if a
+# timestamp falls on a time grain boundary
+_TIME_GRAIN_FREQUENCIES = {
+    TimeGrain.SECOND: "s",
+    TimeGrain.FIVE_SECONDS: "5s",
+    TimeGrain.THIRTY_SECONDS: "30s",
+    TimeGrain.MINUTE: "min",
+    TimeGrain.FIVE_MINUTES: "5min",
+    TimeGrain.TEN_MINUTES: "10min",
+    TimeGrain.FIFTEEN_MINUTES: "15min",
+    TimeGrain.THIRTY_MINUTES: "30min",
+    TimeGrain.HALF_HOUR: "30min",
+    TimeGrain.HOUR: "h",
+    TimeGrain.SIX_HOURS: "6h",
+    TimeGrain.DAY: "D",
+}
+
+
 def _as_wall_clock(series: pd.Series) -> pd.Series:
     """
     Return a datetime series as local wall-clock readings, dropping any
@@ -189,6 +211,35 @@ def _as_wall_clock(series: pd.Series) -> pd.Series:
     return series
 
 
+def _is_time_grain_boundary(dttm: datetime, time_grain: str | None) -> bool:
+    """
+    Return whether a time grain bucket starts at the given timestamp.
+
+    Without a time grain every timestamp is its own bucket. Time grains that are
+    not known to truncate to a fixed calendar boundary are never aligned.
+    """
+    if not time_grain:
+        return True
+
+    timestamp = pd.Timestamp(dttm)
+    if freq := _TIME_GRAIN_FREQUENCIES.get(time_grain):
+        return timestamp == timestamp.floor(freq)
+
+    if timestamp != timestamp.normalize():
+        return False
+    if time_grain in (TimeGrain.WEEK, TimeGrain.WEEK_STARTING_MONDAY):
+        return timestamp.dayofweek == 0
+    if time_grain == TimeGrain.WEEK_STARTING_SUNDAY:
+        return timestamp.dayofweek == 6
+    if time_grain == TimeGrain.MONTH:
+        return timestamp.day == 1
+    if time_grain in (TimeGrain.QUARTER, TimeGrain.QUARTER_YEAR):
+        return timestamp.day == 1 and timestamp.month in (1, 4, 7, 10)
+    if time_grain == TimeGrain.YEAR:
+        return timestamp.day == 1 and timestamp.month == 1
+    return False
+
+
 class CachedTimeOffset(TypedDict):
     """Result type for time offset processing"""
 
@@ -197,6 +248,20 @@ class CachedTimeOffset(TypedDict):
     cache_keys: list[str | None]
 
 
+class _TimeOffsetQuery(NamedTuple):
+    """A time offset whose result is missing from the cache"""
+
+    # position of the offset in the queries of the CachedTimeOffset
+    position: int
+    offset: str
+    query_object: QueryObject
+    query_object_dct: dict[str, Any]
+    metrics_mapping: dict[str, str]
+    is_date_range_offset: bool
+    cache: QueryCacheManager
+    cache_key: str | None
+
+
 # Keys used to filter QueryObjectDict for get_sqla_query parameters
 SQLA_QUERY_KEYS = {
     "apply_fetch_values_predicate",
@@ -1991,6 +2056,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         queries: list[str] = []
         cache_keys: list[str | None] = []
         offset_dfs: dict[str, pd.DataFrame] = {}
+        pending_queries: list[_TimeOffsetQuery] = []
 
         outer_from_dttm, outer_to_dttm = get_since_until_from_query_object(query_object)
         if not outer_from_dttm or not outer_to_dttm:
@@ -2226,43 +2292,64 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                     query_object_clone_dct["row_limit"] = app.config["ROW_LIMIT"]
                 query_object_clone_dct["row_offset"] = 0
 
-            # Call the unified query method on the datasource
-            result = self.query(query_object_clone_dct)
-
-            queries.append(result.query)
+            # the query and dataframe are filled in once the query has run, keeping
+            # the order of the offsets for the queries and the joins
+            queries.append("")
             cache_keys.append(None)
-
-            offset_metrics_df = result.df
-            if offset_metrics_df.empty:
-                offset_metrics_df = pd.DataFrame(
-                    {
-                        col: [np.nan]
-                        for col in join_keys + list(metrics_mapping.values())
-                    }
-                )
-            else:
-                # 1. normalize df, set dttm column
-                offset_metrics_df = self.normalize_df(
-                    offset_metrics_df, query_object_clone
+            offset_dfs[offset] = pd.DataFrame()
+            pending_queries.append(
+                _TimeOffsetQuery(
+                    position=len(queries) - 1,
+                    offset=offset,
+                    # the clone is reused by the next offsets
+                    query_object=copy.copy(query_object_clone),
+                    query_object_dct=query_object_clone_dct,
+                    metrics_mapping=metrics_mapping,
+                    is_date_range_offset=is_date_range_offset,
+                    cache=cache,
+                    cache_key=cache_key,
                 )
+            )
 
-                # 2. rename extra query columns
-                offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
+        results = None
+        if len(pending_queries) > 1 and self._can_single_scan_time_offsets(
+            df, query_object, pending_queries, time_grain
+        ):
+            results = self._run_single_scan_time_offsets(
+                pending_queries, join_keys, time_grain, cache_timeout_fn
+            )
 
-            # cache df and query if caching is enabled
-            if cache_key and cache_timeout_fn:
-                value = {
-                    "df": offset_metrics_df,
-                    "query": result.query,
-                }
-                cache.set(
-                    key=cache_key,
-                    value=value,
-                    timeout=cache_timeout_fn(),
-                    datasource_uid=self.uid,
-                    region=CacheRegion.DATA,
+        if results is None:
+            # Offsets missing from the cache are queried concurrently when
+            # CHART_DATA_MAX_PARALLEL_QUERIES allows it
+            funcs = [
+                partial(
+                    self._run_time_offset_query,
+                    pending,
+                    join_keys,
+                    cache_timeout_fn,
+                )
+                for pending in pending_queries
+            ]
+            max_workers = min(
+                app.config.get("CHART_DATA_MAX_PARALLEL_QUERIES") or 1,
+                len(funcs),
+            )
+            if max_workers > 1:
+                load_datasource(self)
+                results = run_in_thread_pool(
+                    funcs,
+                    max_workers,
+                    thread_name_prefix="time-offset-query",
                 )
-            offset_dfs[offset] = offset_metrics_df
+            else:
+                results = [func() for func in funcs]
+
+        for pending, (query, offset_metrics_df) in zip(
+            pending_queries, results, strict=True
+        ):
+            queries[pending.position] = query
+            offset_dfs[pending.offset] = offset_metrics_df
 
         if offset_dfs:
             df = self.join_offset_dfs(
@@ -2276,6 +2363,256 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
 
         return CachedTimeOffset(df=df, queries=queries, cache_keys=cache_keys)
 
+    def _run_time_offset_query(
+        self,
+        pending: _TimeOffsetQuery,
+        join_keys: list[str],
+        cache_timeout_fn: Callable[[], int] | None,
+    ) -> tuple[str, pd.DataFrame]:
+        """
+        Run the query of a single time offset and cache its result.
+
+        :param pending: The time offset to query
+        :param join_keys: The columns used to join onto the main dataframe
+        :param cache_timeout_fn: Optional function to get cache timeout
+        :return: The executed query and the renamed offset dataframe
+        """
+        # Call the unified query method on the datasource
+        result = self.query(pending.query_object_dct)
+
+        offset_metrics_df = result.df
+        if not offset_metrics_df.empty:
+            # normalize df, set dttm column
+            offset_metrics_df = self.normalize_df(
+                offset_metrics_df, pending.query_object
+            )
+
+        return result.query, self._cache_time_offset_df(
+            pending, offset_metrics_df, result.query, join_keys, cache_timeout_fn
+        )
+
+    def _cache_time_offset_df(
+        self,
+        pending: _TimeOffsetQuery,
+        offset_metrics_df: pd.DataFrame,
+        query: str,
+        join_keys: list[str],
+        cache_timeout_fn: Callable[[], int] | None,
+    ) -> pd.DataFrame:
+        """
+        Rename the metrics of a normalized time offset dataframe and cache it.
+
+        :param pending: The queried time offset
+        :param offset_metrics_df: The normalized dataframe of the offset
+        :param query: The query the dataframe was fetched with
+        :param join_keys: The columns used to join onto the main dataframe
+        :param cache_timeout_fn: Optional function to get cache timeout
+        :return: The renamed offset dataframe
+        """
+        if offset_metrics_df.empty:
+            offset_metrics_df = pd.DataFrame(
+                {
+                    col: [np.nan]
+                    for col in join_keys + list(pending.metrics_mapping.values())
+                }
+            )
+        else:
+            # rename extra query columns
+            offset_metrics_df = offset_metrics_df.rename(
+                columns=pending.metrics_mapping
+            )
+
+        # cache df and query if caching is enabled
+        if pending.cache_key and cache_timeout_fn:
+            value = {
+                "df": offset_metrics_df,
+                "query": query,
+            }
+            pending.cache.set(
+                key=pending.cache_key,
+                value=value,
+                timeout=cache_timeout_fn(),
+                datasource_uid=self.uid,
+                region=CacheRegion.DATA,
+            )
+        return offset_metrics_df
+
+    def _can_single_scan_time_offsets(
+        self,
+        df: pd.DataFrame,
+        query_object: QueryObject,
+        pending_queries: list[_TimeOffsetQuery],
+        time_grain: str | None,
+    ) -> bool:
+        """
+        Whether the time offsets can be fetched with a single, widened query.
+
+        The results of the offset queries can be sliced out of one query over
+        the span of all shifted windows when every offset is relative, the
+        result is grouped by a temporal column that is not shifted by the
+        dataset and is the column of the time range filter (so that slicing the
+        result by the x-axis selects the rows each offset query would have
+        filtered), and the shifted windows start and end on time grain
+        boundaries: every time bucket of the widened query is then either
+        entirely inside or entirely outside of an offset window, so the
+        aggregates of the buckets inside a window are the same as the ones the
+        offset query would have returned, whether the metrics are additive or
+        not. Windows with gaps between them are not merged, as the widened
+        query would then scan more rows than the individual queries.
+
+        :param df: The main dataframe
+        :param query_object: The main query object
+        :param pending_queries: The time offsets missing from the cache
+        :param time_grain: The time grain of the query
+        :return: Whether the single scan can be used
+        """
+        if not feature_flag_manager.is_feature_enabled("TIME_COMPARISON_SINGLE_SCAN"):
+            return False
+
+        index = (get_base_axis_labels(query_object.columns) or [DTTM_ALIAS])[0]
+        if (
+            getattr(self, "offset", 0)
+            or query_object.time_shift
+            or query_object.grouping_sets
+            or query_object.is_rowcount
+            or not dataframe_utils.is_datetime_series(df.get(index))
+        ):
+            return False
+
+        # the x-axis must be the time range column itself, not a Custom SQL
+        # expression or another column, for its buckets to match the windows
+        x_axis = next(iter(get_base_axis_columns(query_object.columns)), None)
+        temporal_filters = [
+            flt
+            for flt in query_object.filter
+            if flt.get("op") == FilterOperator.TEMPORAL_RANGE
+        ]
+        if (
+            x_axis is None
+            or not is_adhoc_column(x_axis)
+            or x_axis["sqlExpression"] != x_axis["label"]
+            or not temporal_filters
+            or temporal_filters[0].get("col") != x_axis["label"]
+        ):
+            return False
+
+        windows: list[tuple[datetime, datetime]] = []
+        for pending in pending_queries:
+            from_dttm = pending.query_object.from_dttm
+            to_dttm = pending.query_object.to_dttm
+            if (
+                pending.is_date_range_offset
+                or not from_dttm
+                or not to_dttm
+                or not _is_time_grain_boundary(from_dttm, time_grain)
+                or not _is_time_grain_boundary(to_dttm, time_grain)
+            ):
+                return False
+            windows.append((from_dttm, to_dttm))
+
+        span = max(to_dttm for _from, to_dttm in windows) - min(
+            from_dttm for from_dttm, _to in windows
+        )
+        return span <= sum(
+            (to_dttm - from_dttm for from_dttm, to_dttm in windows),
+            timedelta(),
+        )
+
+    def _run_single_scan_time_offsets(
+        self,
+        pending_queries: list[_TimeOffsetQuery],
+        join_keys: list[str],
+        time_grain: str | None,
+        cache_timeout_fn: Callable[[], int] | None,
+    ) -> list[tuple[str, pd.DataFrame]] | None:
+        """
+        Fetch all time offsets with one query over the span of their windows.
+
+        The widened result is sliced into one dataframe per offset window,
+        which is renamed and cached under the offset's own cache key, exactly
+        like the result of an individual offset query. ``None`` is returned,
+        so that the offsets are queried individually, when the time range filter
+        can't be widened, when the query fails or when a row limit might have
+        truncated the result.
+
+        :param pending_queries: The time offsets missing from the cache
+        :param join_keys: The columns used to join onto the main dataframe
+        :param time_grain: The time grain of the query
+        :param cache_timeout_fn: Optional function to get cache timeout
+        :return: The query and dataframe of every offset, or ``None``
+        """
+        first = pending_queries[0].query_object
+        from_dttm = min(
+            cast(datetime, pending.query_object.from_dttm)
+            for pending in pending_queries
+        )
+        to_dttm = max(
+            cast(datetime, pending.query_object.to_dttm) for pending in pending_queries
+        )
+
+        # the temporal filters of the offset queries are set to the shifted window
+        index = (get_base_axis_labels(first.columns) or [DTTM_ALIAS])[0]
+        filters = copy.deepcopy(first.filter)
+        widened = False
+        for flt in filters:
+            if (
+                flt.get("op") == FilterOperator.TEMPORAL_RANGE
+                and flt.get("col") == index
+            ):
+                flt["val"] = f"{from_dttm} : {to_dttm}"
+                widened = True
+        if not widened:
+            return None
+
+        row_limit = pending_queries[0].query_object_dct.get("row_limit")
+        widened_dct = {
+            **pending_queries[0].query_object_dct,
+            "from_dttm": from_dttm,
+            "to_dttm": to_dttm,
+            "filter": filters,
+            "row_limit": row_limit * len(pending_queries) if row_limit else row_limit,
+        }
+
+        result = self.query(widened_dct)
+        if result.status == QueryStatus.FAILED or (
+            row_limit and len(result.df.index) >= widened_dct["row_limit"]
+        ):
+            return None
+
+        widened_df = result.df
+        if not widened_df.empty:
+            widened_df = self.normalize_df(widened_df, first)
+
+        offset_dfs = []
+        for pending in pending_queries:
+            if widened_df.empty:
+                offset_dfs.append(widened_df)
+                continue
+            timestamps = _as_wall_clock(widened_df[index])
+            offset_df = widened_df[
+                (timestamps >= pending.query_object.from_dttm)
+                & (timestamps < pending.query_object.to_dttm)
+            ].reset_index(drop=True)
+            if row_limit and len(offset_df.index) > row_limit:
+                # the offset query would have been truncated
+                return None
+            offset_dfs.append(offset_df)
+
+        logger.debug(
+            "Fetched %d time offsets with a single query at the %s time grain",
+            len(pending_queries),
+            time_grain,
+        )
+        return [
+            (
+                result.query,
+                self._cache_time_offset_df(
+                    pending, offset_df, result.query, join_keys, cache_timeout_fn
+                ),
+            )
+            for pending, offset_df in zip(pending_queries, offset_dfs, strict=True)
+        ]
+
     @staticmethod
     def get_time_grain(query_object: QueryObject) -> Any | None:
         if (
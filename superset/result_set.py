@@ -18,6 +18,8 @@
 
 import datetime
 import logging
+from collections.abc import Iterable
+from operator import itemgetter
 from typing import Any, Optional
 
 import numpy as np
@@ -72,6 +74,14 @@ def stringify_values(array: NDArray[Any]) -> NDArray[Any]:
 
     with np.nditer(result, flags=["refs_ok"], op_flags=[["readwrite"]]) as it:
         for obj in it:
+            # fast path for the most common values, converted the same way below
+            val = obj.item()
+            if val is None or type(val) is str:
+                continue
+            if type(val) is int:
+                obj[...] = str(val)
+                continue
+
             if na_obj := pd.isna(obj):
                 # pandas <NA> type cannot be converted to string
                 obj[na_obj] = None
@@ -174,19 +184,17 @@ def normalize_cursor_description_names(
 
 
 class SupersetResultSet:
-    def __init__(  # pylint: disable=too-many-locals  # noqa: C901
+    def __init__(
         self,
-        data: DbapiResult,
+        data: DbapiResult | pa.Table,
         cursor_description: DbapiDescription,
         db_engine_spec: type[BaseEngineSpec],
     ):
         self.db_engine_spec = db_engine_spec
-        data = data or []
+        data = [] if data is None else data
         column_names: list[str] = []
-        pa_data: list[pa.Array] = []
+        pa_data: list[pa.Array | pa.ChunkedArray]
         deduped_cursor_desc: list[tuple[Any, ...]] = []
-        numpy_dtype: list[tuple[str, ...]] = []
-        stringified_arr: NDArray[Any]
         # Track columns with nested/JSON data to preserve them as objects
         self._nested_columns: dict[str, list[Any]] = {}
 
@@ -208,74 +216,17 @@ class SupersetResultSet:
                     column_names, cursor_description, strict=False
                 )
             ]
+        elif isinstance(data, pa.Table):
+            column_names = dedup(
+                normalize_cursor_description_names(
+                    [(name,) for name in data.column_names]
+                )
+            )
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
-
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        columns = np.array(data, dtype=numpy_dtype)
-
-        for column in column_names:
-            col_values = columns[column].tolist()
-            if db_engine_spec.requires_column_value_normalization:
-                col_values = db_engine_spec.normalize_column_values(col_values)
-            try:
-                pa_data.append(pa.array(col_values))
-            except (
-                pa.lib.ArrowInvalid,
-                pa.lib.ArrowTypeError,
-                pa.lib.ArrowNotImplementedError,
-                ValueError,
-                TypeError,  # this is super hackey,
-                # https://issues.apache.org/jira/browse/ARROW-7855
-            ):
-                # Check if original data has nested types (lists/dicts)
-                # before stringifying, since stringification removes
-                # the nested structure that the second loop relies on
-                # to detect via pa.types.is_nested().
-                original_values = columns[column].tolist()
-                if any(
-                    isinstance(v, (list, dict))
-                    for v in original_values
-                    if v is not None
-                ):
-                    self._nested_columns[column] = original_values
-                # attempt serialization of values as strings
-                stringified_arr = stringify_values(columns[column])
-                pa_data.append(pa.array(stringified_arr.tolist()))
-
-        if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
-                if pa.types.is_nested(pa_data[i].type):
-                    # Preserve nested/JSON data as Python objects for use in
-                    # templates like Handlebars. Store original values before
-                    # stringifying for PyArrow compatibility.
-                    # See: https://github.com/apache/superset/issues/25125
-                    self._nested_columns[column] = columns[column].tolist()
-                    stringified_arr = stringify_values(columns[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
-
-                elif pa.types.is_temporal(pa_data[i].type):
-                    # workaround for bug converting
-                    # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
-                    # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(columns[column])
-                    if sample and isinstance(sample, datetime.datetime):
-                        try:
-                            if sample.tzinfo:
-                                tz = sample.tzinfo
-                                series = pd.Series(columns[column])
-                                series = pd.to_datetime(
-                                    series, utc=True, errors="coerce"
-                                )
-                                pa_data[i] = pa.Array.from_pandas(
-                                    series,
-                                    type=pa.timestamp("ns", tz=tz),
-                                )
-                        except Exception as ex:  # pylint: disable=broad-except
-                            logger.exception(ex)
+        if isinstance(data, pa.Table):
+            pa_data = self._convert_arrow_table(data, column_names)
+        else:
+            pa_data = self._convert_rows(data, column_names)
 
         if not pa_data:
             column_names = []
@@ -298,6 +249,112 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    def _convert_rows(
+        self,
+        data: DbapiResult,
+        column_names: list[str],
+    ) -> list[pa.Array]:
+        """
+        Convert the rows returned by a DB-API cursor to Arrow arrays, one per column.
+
+        Rows are transposed to columns once. Arrow infers the type of each column
+        natively; only the columns it can't convert are stringified value by value.
+        """
+        # only do expensive recasting if datatype is not standard list of tuples
+        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
+            data = [tuple(row) for row in data]
+
+        pa_data: list[pa.Array] = []
+        for idx, column in enumerate(column_names):
+            values = list(map(itemgetter(idx), data))
+            pa_data.append(self._convert_column(column, values))
+        return pa_data
+
+    def _convert_column(self, column: str, values: list[Any]) -> pa.Array:
+        """
+        Convert the values of a column to an Arrow array.
+
+        Nested values (lists, dicts) are stringified, keeping the original values to
+        restore them as Python objects in the dataframe.
+        """
+        col_values = values
+        if self.db_engine_spec.requires_column_value_normalization:
+            col_values = self.db_engine_spec.normalize_column_values(col_values)
+        try:
+            array = pa.array(col_values)
+        except (
+            pa.lib.ArrowInvalid,
+            pa.lib.ArrowTypeError,
+            pa.lib.ArrowNotImplementedError,
+            ValueError,
+            TypeError,  # this is super hackey,
+            # https://issues.apache.org/jira/browse/ARROW-7855
+        ):
+            # Check if original data has nested types (lists/dicts)
+            # before stringifying, since stringification removes
+            # the nested structure.
+            if any(isinstance(v, (list, dict)) for v in values if v is not None):
+                self._nested_columns[column] = values
+            # attempt serialization of values as strings
+            return self._stringify_column(values)
+
+        if pa.types.is_nested(array.type):
+            # Preserve nested/JSON data as Python objects for use in
+            # templates like Handlebars. Store original values before
+            # stringifying for PyArrow compatibility.
+            # See: https://github.com/apache/superset/issues/25125
+            self._nested_columns[column] = values
+            return self._stringify_column(values)
+
+        if pa.types.is_temporal(array.type):
+            # workaround for bug converting
+            # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
+            # related: https://issues.apache.org/jira/browse/ARROW-5248
+            sample = self.first_nonempty(values)
+            if sample and isinstance(sample, datetime.datetime):
+                try:
+                    if sample.tzinfo:
+                        tz = sample.tzinfo
+                        series = pd.Series(values, dtype=object)
+                        series = pd.to_datetime(series, utc=True, errors="coerce")
+                        array = pa.Array.from_pandas(
+                            series,
+                            type=pa.timestamp("ns", tz=tz),
+                        )
+                except Exception as ex:  # pylint: disable=broad-except
+                    logger.exception(ex)
+
+        return array
+
+    @staticmethod
+    def _stringify_column(values: list[Any]) -> pa.Array:
+        array = np.fromiter(values, dtype=object, count=len(values))
+        return pa.array(stringify_values(array).tolist())
+
+    def _convert_arrow_table(
+        self,
+        table: pa.Table,
+        column_names: list[str],
+    ) -> list[pa.ChunkedArray]:
+        """
+        Convert the Arrow table returned by a driver supporting
+        ``BaseEngineSpec.fetch_arrow`` to the columns of the result set.
+
+        Columns are kept as is, except for the types the row-based path never
+        produces: dictionary encoded columns are decoded, and nested columns are
+        stringified (keeping their values as Python objects, as for rows).
+        """
+        pa_data: list[pa.ChunkedArray] = []
+        for column_name, column in zip(column_names, table.columns, strict=True):
+            if pa.types.is_dictionary(column.type):
+                column = column.cast(column.type.value_type)
+            if pa.types.is_nested(column.type):
+                values = column.to_pylist()
+                self._nested_columns[column_name] = values
+                column = pa.chunked_array([self._stringify_column(values)])
+            pa_data.append(column)
+        return pa_data
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
@@ -306,7 +363,7 @@ class SupersetResultSet:
             return "INT"
         if pa.types.is_floating(pa_dtype):
             return "FLOAT"
-        if pa.types.is_string(pa_dtype):
+        if pa.types.is_string(pa_dtype) or pa.types.is_large_string(pa_dtype):
             return "STRING"
         if pa.types.is_temporal(pa_dtype):
             return "DATETIME"
@@ -320,7 +377,7 @@ class SupersetResultSet:
             return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
 
     @staticmethod
-    def first_nonempty(items: NDArray[Any]) -> Any:
+    def first_nonempty(items: Iterable[Any]) -> Any:
         return next((i for i in items if i), None)
 
     def is_temporal(self, db_type_str: Optional[str]) -> bool:
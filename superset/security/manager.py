@@ -86,6 +86,7 @@ from superset.security.guest_token import (
     GuestTokenUser,
     GuestUser,
 )
+from superset.security.rls_index import IndexedRLSFilter, rls_index_cache, RLSIndex
 from superset.sql.parse import process_jinja_sql, Table
 from superset.tasks.utils import get_current_user
 from superset.utils import json
@@ -4386,6 +4387,9 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             if cache_key in cache:
                 return cache[cache_key]
 
+        if isinstance(table.id, int) and (index := self.get_rls_index()):
+            return index.get_filters(table.id, self._get_rls_subject_ids())
+
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterSubjects,
@@ -4461,6 +4465,10 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if username is None:
             return
 
+        # filters are resolved in memory by get_rls_filters() with the index
+        if self.get_rls_index():
+            return
+
         if not hasattr(g, "_rls_filter_cache"):
             g._rls_filter_cache = {}
 
@@ -4540,6 +4548,69 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         for tid in uncached_ids:
             g._rls_filter_cache[(username, tid)] = grouped.get(tid, [])
 
+    def get_rls_index(self) -> RLSIndex | None:
+        """
+        Return the cross-request index of the RLS filters, loading it if outdated.
+
+        :returns: The index, or None if ``RLS_FILTER_INDEX_TTL`` isn't set
+        """
+        return rls_index_cache.get(self._load_rls_index)
+
+    def _load_rls_index(self) -> RLSIndex:
+        # pylint: disable=import-outside-toplevel
+        from superset.connectors.sqla.models import (
+            RLSFilterSubjects,
+            RLSFilterTables,
+            RowLevelSecurityFilter,
+        )
+
+        table_ids: dict[int, list[int]] = defaultdict(list)
+        for rls_filter_id, table_id in self.session.query(
+            RLSFilterTables.c.rls_filter_id,
+            RLSFilterTables.c.table_id,
+        ):
+            table_ids[rls_filter_id].append(table_id)
+
+        subject_ids: dict[int, set[int]] = defaultdict(set)
+        for rls_filter_id, subject_id in self.session.query(
+            RLSFilterSubjects.c.rls_filter_id,
+            RLSFilterSubjects.c.subject_id,
+        ):
+            subject_ids[rls_filter_id].add(subject_id)
+
+        return RLSIndex(
+            (
+                IndexedRLSFilter(
+                    row=_RLSFilterRow(id=id_, group_key=group_key, clause=clause),
+                    filter_type=filter_type,
+                    subject_ids=frozenset(subject_ids[id_]),
+                ),
+                table_ids[id_],
+            )
+            for id_, filter_type, group_key, clause in self.session.query(
+                RowLevelSecurityFilter.id,
+                RowLevelSecurityFilter.filter_type,
+                RowLevelSecurityFilter.group_key,
+                RowLevelSecurityFilter.clause,
+            )
+        )
+
+    @staticmethod
+    def _get_rls_subject_ids() -> list[int]:
+        """
+        Return the subject IDs of the current user, cached for the request.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.subjects.utils import get_current_user_subject_ids
+
+        cache = g.setdefault("_rls_subject_ids", {})
+        username = get_username()
+        if username is None:
+            return get_current_user_subject_ids()
+        if username not in cache:
+            cache[username] = get_current_user_subject_ids()
+        return cache[username]
+
     def get_rls_sorted(
         self, table: "BaseDatasource | Explorable"
     ) -> list["RowLevelSecurityFilter"]:
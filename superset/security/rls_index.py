@@ -0,0 +1,218 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Cross-request index of the row level security filters.
+
+Resolving the RLS filters of a datasource queries the filters, their tables and
+their subjects on every request. When ``RLS_FILTER_INDEX_TTL`` is set, each process
+instead loads all the filters once into an index mapping tables to their filters,
+and resolves the filters of a datasource for the subjects of the current user in
+memory.
+
+The index is versioned. Committing a change to an RLS filter or a subject bumps
+the version of the process, and a version shared through ``cache_manager.cache``
+so other processes reload their index too. Without a shared cache, changes made by
+other processes are picked up when the index expires, after
+``RLS_FILTER_INDEX_TTL`` seconds.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from flask import current_app, g
+from sqlalchemy import event
+from sqlalchemy.orm import object_session, Session
+
+from superset.utils.core import RowLevelSecurityFilterType
+
+logger = logging.getLogger(__name__)
+
+#: Cache key of the RLS index version shared by all processes.
+RLS_INDEX_VERSION_KEY = "superset_rls_index_version"
+
+#: Session ``info`` key flagging a transaction that changed RLS filters or subjects.
+RLS_INDEX_DIRTY_KEY = "rls_index_dirty"
+
+
+@dataclass(frozen=True)
+class IndexedRLSFilter:
+    """
+    An RLS filter, with the subjects it applies to (or exempts, for base filters).
+    """
+
+    row: Any
+    filter_type: str
+    subject_ids: frozenset[int]
+
+
+class RLSIndex:
+    """
+    The RLS filters of all tables, resolved in memory for a set of subjects.
+    """
+
+    def __init__(
+        self,
+        filters: Iterable[tuple[IndexedRLSFilter, Iterable[int]]],
+    ) -> None:
+        """
+        :param filters: The filters, with the IDs of the tables they apply to
+        """
+        self._filters_by_table: dict[int, list[IndexedRLSFilter]] = defaultdict(list)
+        for rls_filter, table_ids in filters:
+            for table_id in table_ids:
+                self._filters_by_table[table_id].append(rls_filter)
+
+    def get_filters(self, table_id: int, subject_ids: Iterable[int]) -> list[Any]:
+        """
+        Return the filters of a table applying to any of the given subjects.
+
+        Regular filters apply to their subjects, base filters apply to everyone
+        except their subjects.
+
+        :param table_id: The ID of the table
+        :param subject_ids: The IDs of the subjects of the user
+        :returns: A new list of the filters
+        """
+        subject_ids = set(subject_ids)
+        return [
+            rls_filter.row
+            for rls_filter in self._filters_by_table.get(table_id, [])
+            if bool(rls_filter.subject_ids & subject_ids)
+            == (rls_filter.filter_type == RowLevelSecurityFilterType.REGULAR)
+        ]
+
+
+class RLSIndexCache:
+    """
+    Holds the RLS index of the process, reloading it when its version changes.
+    """
+
+    def __init__(self) -> None:
+        self._index: RLSIndex | None = None
+        self._version: tuple[int, str | None] | None = None
+        self._loaded_at = 0.0
+        self._local_version = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_shared_version() -> str | None:
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        # read the shared version once per request
+        if "_rls_index_shared_version" not in g:
+            try:
+                g._rls_index_shared_version = cache_manager.cache.get(
+                    RLS_INDEX_VERSION_KEY
+                )
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Unable to read the RLS index version", exc_info=True)
+                g._rls_index_shared_version = None
+        return g._rls_index_shared_version
+
+    def get(self, load: Callable[[], RLSIndex]) -> RLSIndex | None:
+        """
+        Return the RLS index, loading it if it's outdated.
+
+        :param load: A function loading the index from the database
+        :returns: The index, or None if the index is disabled
+        """
+        ttl = current_app.config["RLS_FILTER_INDEX_TTL"]
+        if ttl is None:
+            return None
+
+        stats_logger = current_app.config["STATS_LOGGER"]
+        with self._lock:
+            version = (self._local_version, self._get_shared_version())
+            if (
+                self._index is not None
+                and self._version == version
+                and time.monotonic() - self._loaded_at < ttl
+            ):
+                return self._index
+
+            # other threads wait for the index being loaded instead of loading it
+            # again
+            stats_logger.incr("rls_index.load")
+            self._index = load()
+            self._version = version
+            self._loaded_at = time.monotonic()
+            return self._index
+
+    def invalidate(self) -> None:
+        """
+        Bump the version of the index, in this process and in the shared cache.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        with self._lock:
+            self._local_version += 1
+            self._index = None
+        try:
+            cache_manager.cache.set(RLS_INDEX_VERSION_KEY, uuid.uuid4().hex, timeout=0)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Unable to bump the RLS index version", exc_info=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._index = None
+            self._version = None
+
+
+rls_index_cache = RLSIndexCache()
+
+
+def _mark_dirty(_mapper: Any, _connection: Any, target: Any) -> None:
+    if session := object_session(target):
+        session.info[RLS_INDEX_DIRTY_KEY] = True
+
+
+def _invalidate_on_commit(session: Session) -> None:
+    # the version is bumped once the changes are committed, otherwise other
+    # processes could reload the index before they are visible. The flag of a
+    # rolled back transaction is kept, which only causes an extra reload.
+    if session.info.pop(RLS_INDEX_DIRTY_KEY, False):
+        rls_index_cache.invalidate()
+
+
+def register_rls_index_events() -> None:
+    """
+    Register the listeners bumping the RLS index version on changes to the RLS
+    filters and subjects.
+
+    Idempotent: safe to call on every app initialization (e.g. across tests).
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.connectors.sqla.models import RowLevelSecurityFilter
+    from superset.subjects.models import Subject
+
+    for model in (RowLevelSecurityFilter, Subject):
+        for identifier in ("after_insert", "after_update", "after_delete"):
+            if not event.contains(model, identifier, _mark_dirty):
+                event.listen(model, identifier, _mark_dirty)
+
+    if not event.contains(Session, "after_commit", _invalidate_on_commit):
+        event.listen(Session, "after_commit", _invalidate_on_commit)
@@ -54,9 +54,9 @@ from superset.sql.execution.executor import (
     execute_sql_with_cursor,
 )
 from superset.sql.parse import SQLScript
-from superset.sqllab.utils import write_ipc_buffer
+from superset.sqllab.utils import compress_results, write_ipc_buffer
 from superset.utils import json
-from superset.utils.core import override_user, zlib_compress
+from superset.utils.core import override_user
 from superset.utils.dates import now_as_float
 from superset.utils.decorators import stats_timing
 
@@ -260,7 +260,7 @@ def _store_results_in_backend(
         if cache_timeout is None:
             cache_timeout = app.config["CACHE_DEFAULT_TIMEOUT"]
 
-        compressed = zlib_compress(serialized_payload)
+        compressed = compress_results(serialized_payload)
         logger.debug("*** serialized payload size: %i", len(serialized_payload))
         logger.debug("*** compressed payload size: %i", len(compressed))
 
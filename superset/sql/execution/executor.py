@@ -271,7 +271,9 @@ def execute_sql_with_cursor(
         # Fetch results from ALL statements
         description = cursor.description
         if description:
-            rows = database.db_engine_spec.fetch_data(cursor)
+            rows = database.db_engine_spec.fetch_arrow(cursor)
+            if rows is None:
+                rows = database.db_engine_spec.fetch_data(cursor)
             result_set = SupersetResultSet(
                 rows,
                 description,
@@ -1200,9 +1202,9 @@ class SQLExecutor:
                 blob = results_backend.get(query.results_key)
                 if blob:
                     try:
-                        from superset.utils.core import zlib_decompress
+                        from superset.utils.compression import decompress
 
-                        payload = msgpack.loads(zlib_decompress(blob))
+                        payload = msgpack.loads(decompress(blob, decode=False))
 
                         statements = [
                             StatementResult(
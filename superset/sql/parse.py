@@ -21,12 +21,14 @@ import copy
 import enum
 import logging
 import re
+import threading
 import urllib.parse
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import Any, Generic, Optional, TYPE_CHECKING, TypeVar
 
 import sqlglot
+from cachetools import LRUCache
 from flask import current_app, has_app_context
 from jinja2 import nodes, Template
 from sqlglot import exp
@@ -711,6 +713,119 @@ class BaseSQLStatement(Generic[InternalRepresentation]):
         return self.format()
 
 
+@dataclass(frozen=True)
+class ParseCacheInfo:
+    """
+    Statistics of the parsed scripts cache.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ParsedScriptCache:
+    """
+    LRU cache of the statements parsed by sqlglot, keyed by script and engine.
+
+    The same SQL is often parsed several times while handling a single request (to
+    apply RLS, limits, check for mutations, extract tables, etc.), and parsing long
+    scripts is expensive. The cache holds the parsed statements and returns deep
+    copies of them, so callers are free to transform the ASTs they get. Scripts that
+    fail to parse are not cached.
+
+    The size of the cache is read from ``SQL_PARSE_CACHE_SIZE``; a size of 0
+    disables it.
+    """
+
+    def __init__(self) -> None:
+        self._cache: LRUCache[tuple[str, Any, str], list[exp.Expression]] = LRUCache(
+            maxsize=0
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _get_maxsize() -> int:
+        # pylint: disable=import-outside-toplevel
+        from superset import config
+
+        if has_app_context():
+            return current_app.config.get(
+                "SQL_PARSE_CACHE_SIZE",
+                config.SQL_PARSE_CACHE_SIZE,
+            )
+        return config.SQL_PARSE_CACHE_SIZE
+
+    def get(
+        self,
+        script: str,
+        engine: str,
+        dialect: Any,
+        parse: Callable[[], list[exp.Expression]],
+    ) -> list[exp.Expression]:
+        """
+        Return the parsed statements of a script, parsing it only if not cached.
+
+        :param script: The SQL script
+        :param engine: The engine of the script
+        :param dialect: The sqlglot dialect used to parse the script
+        :param parse: A function parsing the script when it isn't cached
+        :returns: A copy of the parsed statements
+        """
+        maxsize = self._get_maxsize()
+        if not maxsize:
+            return parse()
+
+        key = (engine, dialect, script)
+        with self._lock:
+            if self._cache.maxsize != maxsize:
+                self._cache = LRUCache(maxsize=maxsize)
+            statements = self._cache.get(key)
+            if statements is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        if statements is None:
+            self._incr("sql_parse_cache.miss")
+            statements = parse()
+            with self._lock:
+                self._cache[key] = statements
+        else:
+            self._incr("sql_parse_cache.hit")
+
+        # sqlglot returns ``None`` for empty statements
+        return [statement and statement.copy() for statement in statements]
+
+    @staticmethod
+    def _incr(key: str) -> None:
+        if has_app_context():
+            current_app.config["STATS_LOGGER"].incr(key)
+
+    def info(self) -> ParseCacheInfo:
+        """
+        Return the statistics of the cache.
+        """
+        with self._lock:
+            return ParseCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self._cache.maxsize,
+                currsize=self._cache.currsize,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = 0
+
+
+parsed_script_cache = ParsedScriptCache()
+
+
 class SQLStatement(BaseSQLStatement[exp.Expression]):
     """
     A SQL statement.
@@ -810,6 +925,21 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
 
     @classmethod
     def _parse(cls, script: str, engine: str) -> list[exp.Expression]:
+        """
+        Parse a script, reusing the statements of a previous parse when cached.
+
+        Each call returns new copies of the statements, so they can be modified.
+        """
+        _check_script_length(script, engine)
+        return parsed_script_cache.get(
+            script,
+            engine,
+            SQLGLOT_DIALECTS.get(engine),
+            lambda: cls._parse_script(script, engine),
+        )
+
+    @classmethod
+    def _parse_script(cls, script: str, engine: str) -> list[exp.Expression]:
         """
         Parse helper.
 
@@ -818,7 +948,6 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         supports backticks natively. This handles cases like "Other" database type
         where users may have MySQL-compatible syntax with backtick-quoted table names.
         """
-        _check_script_length(script, engine)
         dialect = SQLGLOT_DIALECTS.get(engine)
         try:
             statements = sqlglot.parse(script, dialect=dialect)
@@ -60,12 +60,16 @@ from superset.result_set import SupersetResultSet
 from superset.sql.execution.executor import build_statement_blocks
 from superset.sql.parse import BaseSQLStatement, CTASMethod, SQLScript, Table
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.sqllab.utils import write_ipc_buffer
+from superset.sqllab.utils import (
+    compress_results,
+    get_results_chunk_key,
+    write_ipc_buffer,
+    write_ipc_chunks,
+)
 from superset.utils import json
 from superset.utils.core import (
     override_user,
     QuerySource,
-    zlib_compress,
 )
 from superset.utils.dates import now_as_float
 from superset.utils.decorators import stats_timing
@@ -301,7 +305,9 @@ def execute_query(  # pylint: disable=too-many-statements, too-many-locals  # no
                     str(query.to_dict()),
                 )
                 increased_limit = None if query.limit is None else query.limit + 1
-                data = db_engine_spec.fetch_data(cursor, increased_limit)
+                data = db_engine_spec.fetch_arrow(cursor, increased_limit)
+                if data is None:
+                    data = db_engine_spec.fetch_data(cursor, increased_limit)
                 if query.limit is None or len(data) <= query.limit:
                     query.limiting_factor = LimitingFactor.NOT_LIMITED
                 else:
@@ -574,9 +580,25 @@ def execute_sql_statements(  # noqa: C901
     query.end_time = now_as_float()
 
     use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
-    data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
-        result_set, db_engine_spec, use_arrow_data, expand_data
+    chunk_rows = (
+        app.config["SQLLAB_RESULTS_BACKEND_CHUNK_ROWS"] if use_arrow_data else None
     )
+    data: Union[bytes, str, None]
+    if chunk_rows:
+        # the data is stored in chunks next to the payload, and expanded when
+        # loading it from the results backend
+        data = None
+        selected_columns = all_columns = result_set.columns
+        expanded_columns = []
+    else:
+        (
+            data,
+            selected_columns,
+            all_columns,
+            expanded_columns,
+        ) = _serialize_and_expand_data(
+            result_set, db_engine_spec, use_arrow_data, expand_data
+        )
 
     # TODO: data should be saved separately from metadata (likely in Parquet)
     payload.update(
@@ -602,13 +624,26 @@ def execute_sql_statements(  # noqa: C901
             with stats_timing(
                 "sqllab.query.results_backend_write_serialization", stats_logger
             ):
+                chunks = (
+                    write_ipc_chunks(result_set.pa_table, chunk_rows)
+                    if chunk_rows
+                    else []
+                )
+                if chunk_rows:
+                    payload["data_chunks"] = {
+                        "rows": result_set.size,
+                        "chunk_rows": chunk_rows,
+                        "chunks": len(chunks),
+                    }
                 serialized_payload = _serialize_payload(
                     payload, cast(bool, results_backend_use_msgpack)
                 )
 
                 # Check the size of the serialized payload
                 if sql_lab_payload_max_mb := app.config.get("SQLLAB_PAYLOAD_MAX_MB"):
-                    serialized_payload_size = sys.getsizeof(serialized_payload)
+                    serialized_payload_size = sys.getsizeof(serialized_payload) + sum(
+                        len(chunk) for chunk in chunks
+                    )
                     max_bytes = sql_lab_payload_max_mb * BYTES_IN_MB
 
                     if serialized_payload_size > max_bytes:
@@ -625,14 +660,22 @@ def execute_sql_statements(  # noqa: C901
             if cache_timeout is None:
                 cache_timeout = app.config["CACHE_DEFAULT_TIMEOUT"]
 
-            compressed = zlib_compress(serialized_payload)
+            compressed = compress_results(serialized_payload)
             logger.debug(
                 "*** serialized payload size: %i", getsizeof(serialized_payload)
             )
             logger.debug("*** compressed payload size: %i", getsizeof(compressed))
 
-            # Store results in backend and check if write succeeded
-            write_success = results_backend.set(key, compressed, cache_timeout)
+            # Store results in backend and check if write succeeded. Chunks are
+            # written first, so the payload is never readable without them.
+            write_success = all(
+                results_backend.set(
+                    get_results_chunk_key(key, index),
+                    compress_results(chunk),
+                    cache_timeout,
+                )
+                for index, chunk in enumerate(chunks)
+            ) and results_backend.set(key, compressed, cache_timeout)
             if not write_success:
                 # Backend write failed - log error and don't set results_key
                 logger.error(
@@ -677,6 +720,7 @@ def execute_sql_statements(  # noqa: C901
     db.session.commit()
 
     if return_results:
+        payload.pop("data_chunks", None)
         # since we're returning results we need to create non-arrow data
         if use_arrow_data:
             (
@@ -503,7 +503,12 @@ class SqlLabRestApi(BaseSupersetApi):
         params = kwargs["rison"]
         key = params.get("key")
         rows = params.get("rows")
-        result = SqlExecutionResultsCommand(key=key, rows=rows).run()
+        result = SqlExecutionResultsCommand(
+            key=key,
+            rows=rows,
+            offset=params.get("offset", 0),
+            limit=params.get("limit"),
+        ).run()
 
         # Using pessimistic json serialization since some database drivers can return
         # unserializeable types at times
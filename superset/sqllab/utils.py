@@ -19,11 +19,13 @@ from __future__ import annotations
 from typing import Any
 
 import pyarrow as pa
+from flask import current_app as app
 
 from superset import db, is_feature_enabled
 from superset.common.db_query_status import QueryStatus
 from superset.daos.database import DatabaseDAO
 from superset.models.sql_lab import TabState
+from superset.utils.compression import compress
 
 DATABASE_KEYS = [
     "allow_file_upload",
@@ -81,6 +83,63 @@ def write_ipc_buffer(table: pa.Table) -> pa.Buffer:
     return sink.getvalue()
 
 
+def compress_results(data: bytes | str) -> bytes:
+    """
+    Compress a value stored in the results backend with the configured codec.
+    """
+    return compress(
+        data,
+        app.config["RESULTS_BACKEND_COMPRESSION"],
+        app.config["RESULTS_BACKEND_COMPRESSION_LEVEL"],
+    )
+
+
+def write_ipc_chunks(table: pa.Table, chunk_rows: int) -> list[bytes]:
+    """
+    Split a table into Arrow IPC streams of at most ``chunk_rows`` rows each.
+
+    An empty table is written as a single empty chunk, keeping its schema.
+
+    :param table: The table to split
+    :param chunk_rows: The maximum number of rows of a chunk
+    :returns: The IPC streams of the chunks
+    """
+    return [
+        write_ipc_buffer(table.slice(offset, chunk_rows)).to_pybytes()
+        for offset in range(0, max(table.num_rows, 1), chunk_rows)
+    ]
+
+
+def get_results_chunk_key(key: str, index: int) -> str:
+    """
+    Return the results backend key of a chunk of the results stored under ``key``.
+    """
+    return f"{key}/{index}"
+
+
+def get_results_chunk_range(
+    manifest: dict[str, int],
+    offset: int = 0,
+    limit: int | None = None,
+) -> range:
+    """
+    Return the indexes of the chunks holding the requested rows of a result.
+
+    At least one chunk is always returned, so the schema of the result is known
+    even when no rows are requested.
+
+    :param manifest: The ``data_chunks`` manifest of the stored results
+    :param offset: The index of the first row
+    :param limit: The maximum number of rows, or None for all remaining rows
+    :returns: The chunk indexes
+    """
+    chunk_rows = manifest["chunk_rows"]
+    end = manifest["rows"] if limit is None else min(offset + limit, manifest["rows"])
+    first = min(offset // chunk_rows, manifest["chunks"] - 1)
+    last = max(first + 1, -(-end // chunk_rows))
+    return range(first, min(last, manifest["chunks"]))
+
+
 def bootstrap_sqllab_data(user_id: int | None) -> dict[str, Any]:
     tabs_state: list[Any] = []
     active_tab: Any = None
@@ -146,6 +146,44 @@ def load_chart_data_into_cache(
             raise
 
 
+@celery_app.task(name="refresh_chart_data_cache", soft_time_limit=query_timeout)
+def refresh_chart_data_cache(
+    job_metadata: dict[str, Any],
+    query_context_cache_key: str,
+    refresh_keys: list[str],
+) -> None:
+    """
+    Refresh the cached results of a query context that were served stale.
+
+    :param job_metadata: The user the query context is refreshed as
+    :param query_context_cache_key: The cache key of the query context
+    :param refresh_keys: The keys deduplicating the refresh, released once done
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.charts.data.query_context_cache_loader import (
+        QueryContextCacheLoader,
+    )
+    from superset.commands.chart.data.get_data_command import ChartDataCommand
+
+    try:
+        with override_user(_load_user_from_job_metadata(job_metadata), force=False):
+            form_data = QueryContextCacheLoader.load(query_context_cache_key)
+            set_form_data(form_data)
+            query_context = _create_query_context_from_form(form_data)
+            query_context.force = True
+            command = ChartDataCommand(query_context)
+            command.validate()
+            command.run()
+    except SoftTimeLimitExceeded:
+        logger.warning("A timeout occurred while refreshing stale chart data")
+        raise
+    except Exception:
+        logger.warning("Error refreshing stale chart data", exc_info=True)
+        raise
+    finally:
+        cache_manager.data_cache.delete_many(*refresh_keys)
+
+
 @celery_app.task(name="load_explore_json_into_cache", soft_time_limit=query_timeout)
 def load_explore_json_into_cache(  # pylint: disable=too-many-locals
     job_metadata: dict[str, Any],
@@ -0,0 +1,124 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from superset.result_set import stringify_values
+from superset.sqllab.utils import write_ipc_buffer
+from superset.utils import json
+from superset.utils.core import extract_dataframe_dtypes, GenericDataType
+
+logger = logging.getLogger(__name__)
+
+ARROW_STREAM_MIMETYPE = "application/vnd.apache.arrow.stream"
+
+# Keys of the schema metadata describing the columns of a chart data result
+COLNAMES_METADATA_KEY = b"superset:colnames"
+COLTYPES_METADATA_KEY = b"superset:coltypes"
+VERBOSE_LABELS_METADATA_KEY = b"superset:verbose_labels"
+
+
+def _to_arrow_array(column: pd.Series) -> pa.Array:
+    """
+    Convert a dataframe column to an Arrow array, stringifying its values when
+    Arrow can't infer a type for them (e.g. mixed types in an object column).
+    """
+    try:
+        return pa.array(column, from_pandas=True)
+    except (pa.lib.ArrowInvalid, pa.lib.ArrowTypeError, TypeError):
+        logger.debug("Stringifying values of column %s", column.name)
+        return pa.array(
+            stringify_values(np.array(column.to_numpy(dtype=object))),
+            type=pa.string(),
+            from_pandas=True,
+        )
+
+
+def df_to_arrow_ipc(
+    df: pd.DataFrame,
+    coltypes: list[GenericDataType],
+    verbose_map: dict[str, str] | None = None,
+    index: bool = False,
+) -> bytes:
+    """
+    Serialize a dataframe as an Arrow IPC stream.
+
+    The column names, generic column types and verbose labels of the result are
+    stored in the schema metadata, as JSON encoded lists aligned with the
+    columns of the stream.
+
+    :param df: The dataframe to serialize
+    :param coltypes: The generic data types of the columns of the dataframe
+    :param verbose_map: The verbose labels of the dataset columns and metrics
+    :param index: Whether to write the index as the leading column(s), their
+        types are inferred from the levels of the index
+    :returns: The Arrow IPC stream
+    """
+    if index:
+        coltypes = [
+            *extract_dataframe_dtypes(df.index.to_frame(index=False)),
+            *coltypes,
+        ]
+        df = df.reset_index()
+    colnames = [
+        " ".join(str(name) for name in column).strip()
+        if isinstance(column, tuple)
+        else str(column)
+        for column in df.columns
+    ]
+    verbose_map = verbose_map or {}
+    table = pa.Table.from_arrays(
+        [_to_arrow_array(df.iloc[:, idx]) for idx in range(len(df.columns))],
+        names=colnames,
+    )
+    table = table.replace_schema_metadata(
+        {
+            COLNAMES_METADATA_KEY: json.dumps(colnames),
+            COLTYPES_METADATA_KEY: json.dumps([int(coltype) for coltype in coltypes]),
+            VERBOSE_LABELS_METADATA_KEY: json.dumps(
+                [verbose_map.get(colname, colname) for colname in colnames]
+            ),
+        }
+    )
+    return write_ipc_buffer(table).to_pybytes()
+
+
+def arrow_ipc_to_df(data: bytes) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """
+    Read an Arrow IPC stream written by :func:`df_to_arrow_ipc`.
+
+    :param data: The Arrow IPC stream
+    :returns: The dataframe and the decoded schema metadata
+    """
+    table = pa.ipc.open_stream(data).read_all()
+    metadata = {
+        key.decode("utf-8").removeprefix("superset:"): json.loads(value)
+        for key, value in (table.schema.metadata or {}).items()
+        if key
+        in (
+            COLNAMES_METADATA_KEY,
+            COLTYPES_METADATA_KEY,
+            VERBOSE_LABELS_METADATA_KEY,
+        )
+    }
+    return table.to_pandas(), metadata
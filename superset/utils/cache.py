@@ -19,6 +19,7 @@ from __future__ import annotations
 import inspect
 import logging
 import pickle
+import uuid
 from datetime import datetime, timedelta, timezone
 from functools import wraps
 from typing import Any, Callable
@@ -32,6 +33,7 @@ from superset import db
 from superset.constants import CACHE_DISABLED_TIMEOUT
 from superset.extensions import cache_manager
 from superset.models.cache import CacheKey
+from superset.utils.cache_codec import EncodedDataFrame
 from superset.utils.cache_manager import configurable_hash_method
 from superset.utils.hashing import hash_from_dict
 from superset.utils.json import json_int_dttm_ser
@@ -54,6 +56,90 @@ def generate_cache_key(values_dict: dict[str, Any], key_prefix: str = "") -> str
     return cache_key
 
 
+def _cache_generation_key(datasource_uid: str) -> str:
+    return f"cache_generation_{datasource_uid}"
+
+
+def get_generation(cache: Cache, key: str) -> str | None:
+    """
+    Return the current generation stored under a key of a shared cache.
+
+    A missing generation (never set, or evicted from the cache) is replaced by a new
+    one rather than reset, so entries cached under an evicted generation can't be
+    served again.
+
+    :param cache: The cache holding the generation
+    :param key: The cache key of the generation
+    :returns: The generation, or None if the cache is disabled or unavailable
+    """
+    if isinstance(cache.cache, NullCache):
+        return None
+
+    try:
+        if generation := cache.get(key):
+            return generation
+        # another worker may start the generation concurrently, the first one wins
+        cache.add(key, uuid.uuid4().hex, timeout=0)
+        return cache.get(key)
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Could not get the cache generation %s", key, exc_info=True)
+        return None
+
+
+def bump_generation(cache: Cache, key: str) -> None:
+    """
+    Start a new generation under a key of a shared cache.
+
+    :param cache: The cache holding the generation
+    :param key: The cache key of the generation
+    """
+    cache.set(key, uuid.uuid4().hex, timeout=0)
+
+
+def get_cache_generation(datasource_uid: str) -> str | None:
+    """
+    Return the current cache generation of a datasource, to be folded into the
+    cache keys of its queries.
+
+    :param datasource_uid: The datasource UID
+    :returns: The cache generation, or None if cache generations are disabled
+    """
+    if not app.config.get("DATASOURCE_CACHE_GENERATIONS"):
+        return None
+
+    return get_generation(
+        cache_manager.data_cache, _cache_generation_key(datasource_uid)
+    )
+
+
+def bump_cache_generation(datasource_uid: str) -> None:
+    """
+    Start a new cache generation for a datasource, invalidating all the cached
+    query results of the datasource in O(1). The orphaned entries expire with their
+    timeout.
+
+    :param datasource_uid: The datasource UID
+    """
+    if not app.config.get("DATASOURCE_CACHE_GENERATIONS"):
+        return
+
+    bump_generation(cache_manager.data_cache, _cache_generation_key(datasource_uid))
+
+
+def _get_value_size(value: dict[str, Any]) -> int:
+    """
+    Get the serialized size of a cache value, counting the encoded length of the
+    dataframes it holds rather than pickling them a second time.
+    """
+    encoded = {
+        key: item for key, item in value.items() if isinstance(item, EncodedDataFrame)
+    }
+    rest = {key: item for key, item in value.items() if key not in encoded}
+    return len(pickle.dumps(rest, protocol=pickle.HIGHEST_PROTOCOL)) + sum(
+        len(item) for item in encoded.values()
+    )
+
+
 def set_and_log_cache(
     cache_instance: Cache,
     cache_key: str,
@@ -86,7 +172,7 @@ def set_and_log_cache(
         # is None (the default), in which case no serialization overhead is incurred.
         max_value_size = app.config.get("DATA_CACHE_MAX_VALUE_SIZE")
         if max_value_size is not None:
-            value_size = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+            value_size = _get_value_size(value)
             if value_size > max_value_size:
                 logger.warning(
                     "Skipping cache set for key %s: serialized value size %d bytes "
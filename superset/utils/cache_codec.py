@@ -0,0 +1,143 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compact encoding of the dataframes stored in the data cache.
+
+Cache backends pickle the values they store, and pickling a dataframe is slow
+and produces large payloads for wide results. Dataframes are instead stored as
+(compressed) Arrow IPC streams, wrapped in an :class:`EncodedDataFrame` that is
+cheap to pickle and only decoded when the cached result is read.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+from pandas.api.types import is_object_dtype
+
+from superset.utils.compression import get_arrow_codec
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EncodedDataFrame:
+    """
+    A dataframe serialized as an Arrow IPC stream.
+    """
+
+    data: bytes
+    compression: str | None
+    num_rows: int
+    num_columns: int
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def decode(self) -> pd.DataFrame:
+        return pa.ipc.open_stream(pa.py_buffer(self.data)).read_all().to_pandas()
+
+
+def _roundtrips_from_object(column: pa.ChunkedArray) -> bool:
+    """
+    Whether Arrow reads back an ``object`` column as the same Python values.
+
+    Arrow converts object columns of e.g. ints or datetimes to the matching
+    numpy dtype when reading them back, so only the types read back as Python
+    objects are encoded.
+    """
+    arrow_type = column.type
+    if pa.types.is_boolean(arrow_type):
+        # booleans without nulls are read back as a numpy bool column
+        return column.null_count > 0
+    return (
+        pa.types.is_string(arrow_type)
+        or pa.types.is_large_string(arrow_type)
+        or pa.types.is_binary(arrow_type)
+        or pa.types.is_large_binary(arrow_type)
+        or pa.types.is_decimal(arrow_type)
+        or pa.types.is_date32(arrow_type)
+        or pa.types.is_null(arrow_type)
+    )
+
+
+def encode_dataframe(
+    df: pd.DataFrame,
+    compression: str | None = None,
+    compression_level: int | None = None,
+) -> EncodedDataFrame | None:
+    """
+    Encode a dataframe as an Arrow IPC stream.
+
+    Only dataframes that Arrow can roundtrip losslessly are encoded: those with
+    unique string column names, a range index, and object columns holding
+    strings, bytes, decimals, dates or nullable booleans.
+
+    :param df: The dataframe to encode
+    :param compression: The Arrow IPC compression codec, ``lz4`` or ``zstd``
+    :param compression_level: The compression level, or None for the codec default
+    :returns: The encoded dataframe, or None if it can't be encoded losslessly
+    """
+    if (
+        not isinstance(df.index, pd.RangeIndex)
+        or not df.columns.is_unique
+        or not all(isinstance(column, str) for column in df.columns)
+    ):
+        return None
+
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.lib.ArrowException, TypeError, ValueError):
+        logger.debug("Dataframe can't be converted to Arrow", exc_info=True)
+        return None
+
+    if any(
+        is_object_dtype(dtype) and not _roundtrips_from_object(table.column(idx))
+        for idx, dtype in enumerate(df.dtypes)
+    ):
+        return None
+
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(
+        compression=(
+            get_arrow_codec(compression, compression_level) if compression else None
+        )
+    )
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return EncodedDataFrame(
+        data=sink.getvalue().to_pybytes(),
+        compression=compression,
+        num_rows=table.num_rows,
+        num_columns=table.num_columns,
+    )
+
+
+def decode_dataframe(value: Any) -> Any:
+    """
+    Decode a dataframe read from the cache, if it was encoded.
+
+    :param value: The cached dataframe, encoded or not
+    :returns: The dataframe
+    """
+    if isinstance(value, EncodedDataFrame):
+        return value.decode()
+    return value
@@ -0,0 +1,103 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compression of the values stored in the results backend and caches.
+
+Values are compressed with zlib, or with the zstd and lz4 codecs bundled with
+PyArrow, which are much faster than zlib on large payloads. zstd and lz4 values
+start with a header naming their codec and holding their uncompressed size, so
+values compressed with different codecs can be read back without knowing how
+they were written. Values without a header are zlib streams, as written by
+previous versions.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from typing import Literal
+
+import pyarrow as pa
+
+CompressionCodec = Literal["zlib", "zstd", "lz4"]
+
+# The magic bytes are not a valid zlib header, so they can't be mistaken for the
+# start of a zlib stream.
+MAGIC = b"SPC\x01"
+CODEC_IDS: dict[str, bytes] = {"zstd": b"z", "lz4": b"l"}
+CODEC_NAMES = {codec_id: name for name, codec_id in CODEC_IDS.items()}
+HEADER = struct.Struct(f"<{len(MAGIC)}scQ")
+
+
+def get_arrow_codec(codec: str, level: int | None = None) -> pa.Codec:
+    """
+    Return the PyArrow codec for a compression codec name and level.
+
+    :param codec: The codec name, ``zstd`` or ``lz4``
+    :param level: The compression level, or None for the codec default
+    :returns: The PyArrow codec
+    """
+    return pa.Codec(codec, compression_level=level)
+
+
+def compress(
+    data: bytes | str,
+    codec: CompressionCodec = "zlib",
+    level: int | None = None,
+) -> bytes:
+    """
+    Compress a value with the given codec.
+
+    >>> decompress(compress('{"test": 1}', "zstd"))
+    '{"test": 1}'
+
+    :param data: The value to compress, strings are encoded as UTF-8
+    :param codec: The codec, ``zlib``, ``zstd`` or ``lz4``
+    :param level: The compression level, or None for the codec default
+    :returns: The compressed value
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if codec == "zlib":
+        return zlib.compress(data) if level is None else zlib.compress(data, level)
+    if codec not in CODEC_IDS:
+        raise ValueError(f"Unsupported compression codec: {codec}")
+
+    header = HEADER.pack(MAGIC, CODEC_IDS[codec], len(data))
+    return header + get_arrow_codec(codec, level).compress(data, asbytes=True)
+
+
+def decompress(blob: bytes | str, decode: bool | None = True) -> bytes | str:
+    """
+    Decompress a value compressed with any of the supported codecs.
+
+    :param blob: The compressed value
+    :param decode: Whether to decode the value as UTF-8
+    :returns: The decompressed value
+    """
+    if isinstance(blob, str):
+        blob = blob.encode("utf-8")
+    if blob.startswith(MAGIC):
+        _, codec_id, size = HEADER.unpack_from(blob)
+        decompressed = get_arrow_codec(CODEC_NAMES[codec_id]).decompress(
+            memoryview(blob)[HEADER.size :],
+            size,
+            asbytes=True,
+        )
+    else:
+        decompressed = zlib.decompress(blob)
+    return decompressed.decode("utf-8") if decode else decompressed
@@ -0,0 +1,130 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Sequence, TypeVar
+
+from flask import (
+    copy_current_request_context,
+    current_app,
+    g,
+    has_app_context,
+    has_request_context,
+)
+from sqlalchemy import inspect
+
+T = TypeVar("T")
+
+# Relationships of a datasource used to run its queries
+DATASOURCE_QUERY_RELATIONSHIPS = ("columns", "metrics", "database")
+
+_local = threading.local()
+
+
+def load_datasource(datasource: Any) -> None:
+    """
+    Load the attributes of a datasource (and of its database) used to run its
+    queries.
+
+    The datasource belongs to the session of the calling thread, which isn't
+    thread-safe, so its expired attributes and lazy relationships are loaded
+    before its queries run in ``run_in_thread_pool`` rather than from several
+    threads.
+
+    :param datasource: The datasource, ignored if it isn't a mapped object
+    """
+    for obj, relationships in (
+        (datasource, DATASOURCE_QUERY_RELATIONSHIPS),
+        (getattr(datasource, "database", None), ()),
+    ):
+        if (state := inspect(obj, raiseerr=False)) is None:
+            continue
+        keys = {attr.key for attr in state.mapper.column_attrs}
+        for key in state.unloaded & keys.union(relationships):
+            getattr(obj, key)
+
+
+def run_in_thread_pool(
+    funcs: Sequence[Callable[[], T]],
+    max_workers: int,
+    thread_name_prefix: str = "",
+) -> list[T]:
+    """
+    Run callables concurrently in a bounded thread pool and return their results.
+
+    Flask contexts are local to the thread that handles the request, so each
+    callable runs inside its own copy of the current request context (or a new
+    app context when called outside of a request), with the attributes of ``g``
+    restored from the calling thread. This way security checks, RLS and Jinja
+    templating behave the same as they would in the calling thread.
+
+    Results are returned in the order of ``funcs``; if several callables fail,
+    the exception of the first one (in that order) is raised.
+
+    Calls nested in a callable run serially in its thread, so that nested pools
+    (e.g. the time comparison queries of concurrent chart data queries) don't
+    multiply the number of threads and database connections of a request.
+
+    :param funcs: The callables to run, taking no arguments
+    :param max_workers: The maximum number of threads
+    :param thread_name_prefix: Prefix for the names of the worker threads
+    :returns: The results of the callables, in order
+    """
+    if getattr(_local, "in_pool", False):
+        return [func() for func in funcs]
+
+    def in_pool(func: Callable[[], T]) -> Callable[[], T]:
+        def run() -> T:
+            _local.in_pool = True
+            try:
+                return func()
+            finally:
+                _local.in_pool = False
+
+        return run
+
+    if not has_app_context():
+        with ThreadPoolExecutor(max_workers, thread_name_prefix) as executor:
+            futures = [executor.submit(in_pool(func)) for func in funcs]
+            return [future.result() for future in futures]
+
+    # pylint: disable=protected-access
+    app = current_app._get_current_object()
+    g_copy = g._get_current_object().__dict__.copy()
+
+    def wrap(func: Callable[[], T]) -> Callable[[], T]:
+        def run() -> T:
+            for key, value in g_copy.items():
+                setattr(g, key, value)
+            return in_pool(func)()
+
+        if has_request_context():
+            # the request context is copied once per callable, a copy can only be
+            # pushed in a single thread
+            return copy_current_request_context(run)
+
+        def run_in_app_context() -> T:
+            with app.app_context():
+                return run()
+
+        return run_in_app_context
+
+    with ThreadPoolExecutor(max_workers, thread_name_prefix) as executor:
+        futures = [executor.submit(wrap(func)) for func in funcs]
+        return [future.result() for future in futures]
@@ -0,0 +1,100 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Connection pooling for analytical databases.
+
+Engines are created with a ``NullPool`` by default, so every query opens a new
+connection to the database. Databases that opt in through the
+``connection_pool`` key of their ``extra`` get a ``QueuePool`` instead, which
+reports how long checkouts wait for a connection and how many connections are
+in use to the ``STATS_LOGGER``.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from sqlalchemy.pool import QueuePool
+
+from superset.extensions import stats_logger_manager
+
+# Defaults for the pool parameters that are not set in the ``connection_pool``
+# of a database. Connections to analytical databases are often dropped by load
+# balancers when idle, so they are recycled after an hour and pinged before use.
+DEFAULT_POOL_PARAMETERS: dict[str, Any] = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_timeout": 30,
+    "pool_recycle": 3600,
+    "pool_pre_ping": True,
+}
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    A ``QueuePool`` that reports its checkout wait time and usage.
+
+    Metrics are prefixed with the pool logging name, which is preserved when the
+    pool is recreated on ``Engine.dispose()``.
+    """
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            stats_logger = stats_logger_manager.instance
+            stats_logger.timing(
+                f"{self.logging_name}.checkout_wait",
+                (time.perf_counter() - start) * 1000,
+            )
+            self._report_usage()
+
+    def _do_return_conn(self, conn: Any) -> None:
+        super()._do_return_conn(conn)
+        self._report_usage()
+
+    def _report_usage(self) -> None:
+        stats_logger = stats_logger_manager.instance
+        stats_logger.gauge(f"{self.logging_name}.checked_out", self.checkedout())
+        stats_logger.gauge(
+            f"{self.logging_name}.connections",
+            self.checkedin() + self.checkedout(),
+        )
+
+
+def get_pool_engine_kwargs(
+    database_id: int,
+    pool_config: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Return the ``create_engine`` arguments for a pooled engine.
+
+    :param database_id: The ID of the database, used to name its metrics
+    :param pool_config: The ``connection_pool`` of the database ``extra``
+    :returns: The engine arguments configuring the pool
+    """
+    parameters = {
+        key: pool_config.get(key, default)
+        for key, default in DEFAULT_POOL_PARAMETERS.items()
+    }
+    return {
+        **parameters,
+        "poolclass": InstrumentedQueuePool,
+        "pool_logging_name": f"database.{database_id}.pool",
+    }
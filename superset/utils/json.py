@@ -17,6 +17,7 @@
 import copy
 import decimal
 import logging
+import re
 import uuid
 from datetime import date, datetime, time, timedelta
 from typing import Any, Callable, Dict, Optional, Union
@@ -24,6 +25,7 @@ from typing import Any, Callable, Dict, Optional, Union
 import numpy as np
 import pandas as pd
 import simplejson
+from flask import current_app, has_app_context
 from flask_babel.speaklater import LazyString
 from jsonpath_ng import parse
 from jsonpath_ng.jsonpath import Child, Fields, Root
@@ -32,9 +34,16 @@ from simplejson import JSONDecodeError
 from superset.constants import PASSWORD_MASK
 from superset.utils.dates import datetime_to_epoch, EPOCH
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logging.getLogger("MARKDOWN").setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
+NON_ASCII_REGEX = re.compile(r"[^\x00-\x7f]")
+
 
 class DashboardEncoder(simplejson.JSONEncoder):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -185,6 +194,94 @@ def validate_json(obj: Union[bytes, bytearray, str]) -> None:
             raise
 
 
+def _escape_non_ascii(match: re.Match[str]) -> str:
+    """
+    Escape a non-ASCII character as ``\\uXXXX``, using a surrogate pair outside of
+    the Basic Multilingual Plane, as simplejson does with ``ensure_ascii``.
+    """
+    code = ord(match.group())
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
+
+
+# The serializers supported by the orjson encoder, and whether dates and times can
+# be serialized natively by orjson (which formats them as ISO 8601 strings).
+ORJSON_SERIALIZERS: dict[Callable[[Any], Any], bool] = {
+    json_iso_dttm_ser: True,
+    pessimistic_json_iso_dttm_ser: True,
+    json_int_dttm_ser: False,
+}
+
+
+def _orjson_dumps(
+    obj: Any,
+    default: Callable[[Any], Any],
+    sort_keys: bool,
+    indent: Union[str, int, None],
+    ensure_ascii: bool,
+) -> str:
+    """
+    Dumps an object to JSON with orjson.
+
+    Objects orjson doesn't serialize natively go through ``default``, except for
+    Decimals, named tuples and float subclasses, which are serialized the way
+    simplejson does. NumPy objects and dataclasses aren't serialized natively by
+    orjson, which would format datetime64 arrays as strings and accept the objects
+    simplejson rejects, e.g. float32. Enum members can't go through ``default``
+    and are serialized as their value, which simplejson only does for members of
+    ``str``, ``int`` or ``float`` enums.
+
+    :raises orjson.JSONEncodeError: If the object cannot be serialized
+    """
+
+    def orjson_default(value: Any) -> Any:
+        if isinstance(value, decimal.Decimal):
+            return orjson.Fragment(str(value))
+        if isinstance(value, tuple) and hasattr(value, "_asdict"):
+            return value._asdict()
+        if isinstance(value, float):
+            # e.g. np.float64
+            return float(value)
+        return default(value)
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+    if not ORJSON_SERIALIZERS[default]:
+        option |= orjson.OPT_PASSTHROUGH_DATETIME
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+
+    results_string = orjson.dumps(obj, default=orjson_default, option=option).decode()
+    if ensure_ascii and not results_string.isascii():
+        results_string = NON_ASCII_REGEX.sub(_escape_non_ascii, results_string)
+    return results_string
+
+
+def _can_use_orjson(
+    default: Optional[Callable[[Any], Any]],
+    ignore_nan: bool,
+    indent: Union[str, int, None],
+    separators: Union[tuple[str, str], None],
+    cls: Union[type[simplejson.JSONEncoder], None],
+) -> bool:
+    """
+    Whether the orjson encoder is enabled and supports the options of a dumps call.
+    """
+    return (
+        orjson is not None
+        and has_app_context()
+        and current_app.config.get("JSON_ENCODER_BACKEND") == "orjson"
+        and default in ORJSON_SERIALIZERS
+        and ignore_nan
+        and indent in (None, 2)
+        and separators is None
+        and cls is None
+    )
+
+
 def dumps(  # pylint: disable=too-many-arguments
     obj: Any,
     default: Optional[Callable[[Any], Any]] = json_iso_dttm_ser,
@@ -200,6 +297,10 @@ def dumps(  # pylint: disable=too-many-arguments
     """
     Dumps object to compatible JSON format
 
+    The encoder is configured with ``JSON_ENCODER_BACKEND``; when set to "orjson",
+    calls using one of the default serializers and options supported by orjson are
+    serialized by it, falling back to simplejson on failure.
+
     :param obj: The serializable object
     :param default: function that should return a serializable version of obj
     :param allow_nan: when set to True NaN values will be serialized
@@ -214,6 +315,20 @@ def dumps(  # pylint: disable=too-many-arguments
     :returns: String object in the JSON compatible form
     """
 
+    if _can_use_orjson(default, ignore_nan, indent, separators, cls):
+        try:
+            return _orjson_dumps(
+                obj,
+                default,  # type: ignore[arg-type]
+                sort_keys,
+                indent,
+                ensure_ascii,
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers over 64 bits or objects the serializer rejects, let
+            # simplejson serialize them or raise its usual error
+            logger.debug("Falling back to simplejson", exc_info=True)
+
     results_string = ""
     dumps_kwargs: Dict[str, Any] = {
         "default": default,
@@ -16,17 +16,22 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import logging
+import os
+import queue
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any, Callable, cast, Literal
 
-from flask import g, has_request_context, request
+from flask import current_app, Flask, g, has_request_context, request
 from flask_appbuilder.const import API_URI_RIS_KEY
 from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.exc import SQLAlchemyError
@@ -372,21 +377,19 @@ def get_event_logger_from_cfg_value(cfg_value: Any) -> AbstractEventLogger:
 class DBEventLogger(AbstractEventLogger):
     """Event logger that commits logs to Superset DB"""
 
-    def log(  # pylint: disable=too-many-arguments,too-many-locals
-        self,
+    @staticmethod
+    def get_log_rows(  # pylint: disable=too-many-arguments
         user_id: int | None,
         action: str,
         dashboard_id: int | None,
         duration_ms: int | None,
         slice_id: int | None,
         referrer: str | None,
-        *args: Any,
         **kwargs: Any,
-    ) -> None:
-        # pylint: disable=import-outside-toplevel
-        from superset import db
-        from superset.models.core import Log
-
+    ) -> list[dict[str, Any]]:
+        """
+        Return the values of the ``Log`` rows of an event, one per record.
+        """
         records = kwargs.get("records", [])
         curated_payload = kwargs.get("curated_payload")
 
@@ -395,23 +398,53 @@ class DBEventLogger(AbstractEventLogger):
         if not records and curated_payload:
             records = [curated_payload]
 
-        logs = []
+        rows = []
         for record in records:
             json_string: str | None
             try:
                 json_string = json.dumps(record)
             except Exception:  # pylint: disable=broad-except
                 json_string = None
-            log = Log(
-                action=action,
-                json=json_string,
-                dashboard_id=dashboard_id or record.get("dashboard_id"),
-                slice_id=slice_id or record.get("slice_id"),
-                duration_ms=duration_ms,
-                referrer=referrer,
-                user_id=user_id,
+            rows.append(
+                {
+                    "action": action,
+                    "json": json_string,
+                    "dashboard_id": dashboard_id or record.get("dashboard_id"),
+                    "slice_id": slice_id or record.get("slice_id"),
+                    "duration_ms": duration_ms,
+                    "referrer": referrer,
+                    "user_id": user_id,
+                }
             )
-            logs.append(log)
+        return rows
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+        from superset.models.core import Log
+
+        logs = [
+            Log(**row)
+            for row in self.get_log_rows(
+                user_id,
+                action,
+                dashboard_id,
+                duration_ms,
+                slice_id,
+                referrer,
+                **kwargs,
+            )
+        ]
         try:
             db.session.bulk_save_objects(logs)
             db.session.commit()  # pylint: disable=consider-using-transaction
@@ -431,6 +464,157 @@ class DBEventLogger(AbstractEventLogger):
                 )
 
 
+class BufferedDBEventLogger(DBEventLogger):
+    """
+    Event logger that writes logs to Superset DB in batches, from a background thread.
+
+    Logs are queued in memory, so requests don't wait for a commit to the metadata
+    database. The thread inserts them with a connection of its own, when
+    ``batch_size`` logs are queued or every ``flush_interval`` seconds, and the logs
+    still queued are written when the process exits. Once ``max_queue_size`` logs are
+    queued new logs are dropped, and counted in the ``event_logger.dropped`` metric.
+
+        EVENT_LOGGER = BufferedDBEventLogger(batch_size=500, flush_interval=5)
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 5,
+        shutdown_timeout: float = 10,
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.shutdown_timeout = shutdown_timeout
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._registered_atexit = False
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        rows = self.get_log_rows(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            **kwargs,
+        )
+        if not rows:
+            return
+
+        log_queue = self._start()
+        dttm = datetime.utcnow()
+        for row in rows:
+            try:
+                log_queue.put_nowait({**row, "dttm": dttm})
+            except queue.Full:
+                stats_logger_manager.instance.incr("event_logger.dropped")
+
+    def _start(self) -> queue.Queue[dict[str, Any] | None]:
+        """
+        Start the thread writing the logs, unless it's already running.
+
+        The thread is started on the first log of each process, so that forked
+        workers run their own thread and queue.
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._queue = queue.Queue(maxsize=self.max_queue_size)
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self._queue, current_app._get_current_object()),  # pylint: disable=protected-access
+                    name="BufferedDBEventLogger",
+                    daemon=True,
+                )
+                self._thread.start()
+                if not self._registered_atexit:
+                    atexit.register(self.shutdown)
+                    self._registered_atexit = True
+            return self._queue
+
+    def _run(
+        self,
+        log_queue: queue.Queue[dict[str, Any] | None],
+        app: Flask,
+    ) -> None:
+        stopped = False
+        while not stopped:
+            rows: list[dict[str, Any]] = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(rows) < self.batch_size:
+                try:
+                    row = log_queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if row is None:
+                    stopped = True
+                    break
+                rows.append(row)
+
+            if rows:
+                with app.app_context():
+                    self._flush(rows, log_queue.qsize())
+
+    def _flush(self, rows: list[dict[str, Any]], queue_size: int) -> None:
+        stats_logger = stats_logger_manager.instance
+        stats_logger.gauge("event_logger.queue_size", queue_size)
+        start = time.perf_counter()
+        try:
+            self.write(rows)
+        except Exception:  # pylint: disable=broad-except
+            # the thread must keep running, the logs of the batch are lost
+            logger.exception(
+                "BufferedDBEventLogger failed to write %d log(s)", len(rows)
+            )
+            stats_logger.incr("event_logger.write_error")
+        else:
+            stats_logger.timing(
+                "event_logger.write", (time.perf_counter() - start) * 1000
+            )
+
+    @staticmethod
+    def write(rows: list[dict[str, Any]]) -> None:
+        """
+        Insert a batch of logs, in a transaction separate from the session.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+        from superset.models.core import Log
+
+        with db.engine.begin() as connection:
+            connection.execute(Log.__table__.insert(), rows)
+
+    def shutdown(self) -> None:
+        """
+        Write the queued logs and stop the thread.
+        """
+        with self._lock:
+            thread = self._thread
+            if thread is None or self._pid != os.getpid() or not thread.is_alive():
+                return
+            try:
+                self._queue.put(None, timeout=self.shutdown_timeout)
+            except queue.Full:
+                return
+        thread.join(timeout=self.shutdown_timeout)
+
+
 class StdOutEventLogger(AbstractEventLogger):
     """Event logger that prints to stdout for debugging purposes"""
 
@@ -0,0 +1,248 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Cache of the partition metadata used by the ``latest_partition`` macros.
+
+The ``latest_partition`` and ``latest_sub_partition`` Jinja macros query the
+partitions of a table every time a template is rendered, so a dashboard with many
+charts on a partitioned table runs the same metadata query once per chart. The
+cache keeps the result of these lookups per database, catalog, schema and table,
+and lets a single caller run the query when several ask for the same partition
+concurrently. Lookups on databases querying on behalf of the user (impersonation
+or OAuth2) are cached per user, as their grants may differ.
+
+The results are cached in memory by each process, under a generation of the
+database kept in the shared cache (``CACHE_CONFIG``), so that a refresh of the
+partitions of a database is seen by every process. Without a shared cache a
+refresh only applies to the process handling it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Hashable, TYPE_CHECKING
+
+from cachetools import LRUCache
+from flask import current_app
+
+from superset.sql.parse import Table
+from superset.utils.core import get_username
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+
+logger = logging.getLogger(__name__)
+
+# Number of partition lookups kept in memory by each process.
+PARTITION_METADATA_CACHE_SIZE = 1024
+
+PartitionCacheKey = tuple[
+    int, str | None, str | None, str, Hashable, str | None, str | None
+]
+
+
+def _generation_key(database_id: int) -> str:
+    return f"partition_cache_generation_{database_id}"
+
+
+def get_partition_cache_generation(database_id: int) -> str | None:
+    """
+    Return the generation of the cached partitions of a database, shared by all
+    processes through ``CACHE_CONFIG``.
+
+    :param database_id: The ID of the database
+    :returns: The generation, or None without a shared cache
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import cache_manager
+    from superset.utils.cache import get_generation
+
+    return get_generation(cache_manager.cache, _generation_key(database_id))
+
+
+def bump_partition_cache_generation(database_id: int) -> None:
+    """
+    Start a new generation of the cached partitions of a database, so that every
+    process queries them again.
+
+    :param database_id: The ID of the database
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import cache_manager
+    from superset.utils.cache import bump_generation
+
+    bump_generation(cache_manager.cache, _generation_key(database_id))
+
+
+def get_partition_cache_timeout(database: Database) -> int | None:
+    """
+    Return how long the partitions of a database are cached.
+
+    The ``partition_cache_timeout`` of the database ``metadata_cache_timeout`` is
+    used when set, then the ``PARTITION_METADATA_CACHE_TIMEOUT`` config. A timeout
+    of 0 means the partitions never expire.
+
+    :param database: The database
+    :returns: The timeout in seconds, or None if partitions aren't cached
+    """
+    if database.partition_cache_enabled:
+        return database.partition_cache_timeout
+    return current_app.config["PARTITION_METADATA_CACHE_TIMEOUT"]
+
+
+class PartitionMetadataCache:
+    """
+    Per-process cache of partition lookups, with a timeout per database.
+
+    Failed lookups are not cached. When a lookup is already running for a key, other
+    callers wait for its result instead of querying the database again, for up to
+    ``SUPERSET_WEBSERVER_TIMEOUT`` before running the lookup themselves.
+    """
+
+    def __init__(self, maxsize: int = PARTITION_METADATA_CACHE_SIZE) -> None:
+        self._cache: LRUCache[PartitionCacheKey, tuple[float | None, Any]] = LRUCache(
+            maxsize=maxsize
+        )
+        self._pending: dict[PartitionCacheKey, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        database: Database,
+        table: Table,
+        lookup: Hashable,
+        fetch: Callable[[], Any],
+    ) -> Any:
+        """
+        Return the result of a partition lookup, fetching it only if not cached.
+
+        :param database: The database of the table
+        :param table: The partitioned table
+        :param lookup: A key identifying the lookup, e.g. its macro and arguments
+        :param fetch: A function querying the partitions when they aren't cached
+        :returns: The result of the lookup
+        """
+        timeout = get_partition_cache_timeout(database)
+        if timeout is None or database.id is None:
+            return fetch()
+
+        # the partitions visible to a user depend on their grants when the
+        # database is queried on their behalf
+        username = (
+            get_username()
+            if database.impersonate_user or database.is_oauth2_enabled()
+            else None
+        )
+        key = (
+            database.id,
+            table.catalog,
+            table.schema,
+            table.table,
+            lookup,
+            username,
+            get_partition_cache_generation(database.id),
+        )
+        stats_logger = current_app.config["STATS_LOGGER"]
+        while True:
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry is not None:
+                    expires_at, value = entry
+                    if expires_at is None or expires_at > time.monotonic():
+                        stats_logger.incr("partition_metadata_cache.hit")
+                        return value
+                    del self._cache[key]
+
+                pending = self._pending.get(key)
+                if pending is None:
+                    pending = self._pending[key] = threading.Event()
+                    break
+
+            # another caller is fetching the partitions, wait for its result and
+            # fetch them again only if it failed
+            stats_logger.incr("partition_metadata_cache.coalesced")
+            if not pending.wait(current_app.config["SUPERSET_WEBSERVER_TIMEOUT"]):
+                stats_logger.incr("partition_metadata_cache.timeout")
+                return fetch()
+
+        stats_logger.incr("partition_metadata_cache.miss")
+        try:
+            value = fetch()
+            with self._lock:
+                expires_at = time.monotonic() + timeout if timeout else None
+                self._cache[key] = (expires_at, value)
+            return value
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.set()
+
+    def refresh(
+        self,
+        database_id: int,
+        catalog: str | None = None,
+        schema: str | None = None,
+        table: str | None = None,
+    ) -> None:
+        """
+        Evict the cached partitions of a database, optionally of a single catalog,
+        schema or table, so they are queried again on the next render.
+
+        Entries cached without a catalog or schema are evicted for any catalog or
+        schema, since they were looked up in the database defaults. Other processes
+        query all the partitions of the database again, as the generation of the
+        database is bumped in the shared cache.
+
+        :param database_id: The ID of the database
+        :param catalog: Only evict the partitions of tables in this catalog
+        :param schema: Only evict the partitions of tables in this schema
+        :param table: Only evict the partitions of tables with this name
+        """
+
+        def matches(key: PartitionCacheKey) -> bool:
+            return (
+                key[0] == database_id
+                and all(
+                    expected is None or actual is None or actual == expected
+                    for expected, actual in zip(
+                        (catalog, schema), key[1:3], strict=True
+                    )
+                )
+                and (table is None or key[3] == table)
+            )
+
+        with self._lock:
+            for key in [key for key in self._cache if matches(key)]:
+                del self._cache[key]
+
+        try:
+            bump_partition_cache_generation(database_id)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning(
+                "Could not refresh the partitions of database %s in other processes",
+                database_id,
+                exc_info=True,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+partition_metadata_cache = PartitionMetadataCache()
@@ -278,7 +278,7 @@ def take_tiled_screenshot(  # noqa: C901
     page: "Page",
     element_name: str,
     tile_height: int,
-    load_wait: int = 60,
+    load_wait: float = 60,
     animation_wait: int = 0,
     log_context: str | None = None,
 ) -> bytes | None:
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import base64
 import logging
+from collections.abc import Sequence
 from datetime import datetime
 from enum import Enum
 from io import BytesIO
@@ -252,6 +253,41 @@ class BaseScreenshot:
                 driver.destroy()
         return self.screenshot
 
+    @staticmethod
+    def get_screenshots(
+        screenshots: Sequence[BaseScreenshot],
+        user: User,
+        log_context: str | None = None,
+    ) -> list[bytes | None]:
+        """
+        Take several screenshots of the same kind and window size.
+
+        With Playwright, the pages are loaded concurrently in the browser of the
+        process. Stops at the first failed screenshot: its result and the results
+        of the following screenshots are None.
+        """
+        if len(screenshots) > 1:
+            driver = screenshots[0].driver(user=user)
+            if isinstance(driver, WebDriverPlaywright):
+                images = driver.get_screenshots(
+                    [screenshot.url for screenshot in screenshots],
+                    screenshots[0].element,
+                    user,
+                    log_context=log_context,
+                )
+                for screenshot, image in zip(screenshots, images, strict=True):
+                    screenshot.screenshot = image
+                return images
+
+        images: list[bytes | None] = [None] * len(screenshots)
+        for index, screenshot in enumerate(screenshots):
+            images[index] = screenshot.get_screenshot(
+                user=user, log_context=log_context
+            )
+            if images[index] is None:
+                break
+        return images
+
     def get_cache_key(
         self,
         window_size: bool | WindowSize | None = None,
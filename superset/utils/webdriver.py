@@ -21,9 +21,12 @@ import atexit
 import logging
 import time
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Hashable
+from dataclasses import dataclass
 from enum import Enum
 from time import sleep
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 from flask import current_app as app
 from packaging import version
@@ -127,6 +130,16 @@ def check_playwright_availability() -> bool:
 PLAYWRIGHT_AVAILABLE = check_playwright_availability()
 
 
+@dataclass
+class _PooledContext:
+    """A browser context of the pool, with its key and usage."""
+
+    context: Any
+    key: Hashable
+    created_at: float
+    uses: int = 0
+
+
 class _PlaywrightBrowserManager:
     """Manages a long-lived Playwright browser instance per worker process.
 
@@ -134,11 +147,19 @@ class _PlaywrightBrowserManager:
     so a single browser instance per process is safe and avoids the overhead
     of launching/destroying Chromium on every screenshot task. Each task
     creates a lightweight, isolated browser context instead of a full browser.
+
+    Contexts can also be pooled: a context released after a successful
+    screenshot is kept, with its cookies and HTTP cache, and handed to the next
+    screenshot with the same key (e.g. the same user and viewport), skipping
+    authentication and the download of the static assets.
     """
 
     def __init__(self) -> None:
         self._playwright: Any = None
         self._browser: Any = None
+        # idle contexts, least recently released first
+        self._idle_contexts: list[_PooledContext] = []
+        self._leased_contexts: dict[int, _PooledContext] = {}
 
     def get_browser(self, browser_args: list[str]) -> Any:
         """Return a reusable browser, creating one if needed."""
@@ -150,7 +171,86 @@ class _PlaywrightBrowserManager:
         self._browser = self._playwright.chromium.launch(args=browser_args)
         return self._browser
 
+    def get_context(
+        self,
+        key: Hashable,
+        create: Callable[[], Any],
+        max_age: float,
+    ) -> Any:
+        """
+        Return an idle context of the pool with the key, or a new context.
+
+        Idle contexts older than ``max_age`` seconds are closed instead of being
+        reused. The context must be given back with ``release_context``.
+
+        :param key: The key of the context, contexts are only reused by the key
+            they were created with
+        :param create: A function creating a new context of the browser
+        :param max_age: Maximum age of a reused context, in seconds
+        """
+        now = time.monotonic()
+        pooled = None
+        for idle in reversed(self._idle_contexts):
+            if now - idle.created_at >= max_age:
+                self._idle_contexts.remove(idle)
+                self._close_context(idle.context)
+            elif pooled is None and idle.key == key:
+                pooled = idle
+        if pooled is not None:
+            self._idle_contexts.remove(pooled)
+        else:
+            context = create()
+            pooled = _PooledContext(context, key, created_at=time.monotonic())
+        pooled.uses += 1
+        self._leased_contexts[id(pooled.context)] = pooled
+        return pooled.context
+
+    def release_context(
+        self,
+        context: Any,
+        reuse: bool,
+        pool_size: int,
+        max_uses: int,
+    ) -> None:
+        """
+        Give back a context returned by ``get_context``, keeping it in the pool
+        unless it can't be reused.
+
+        :param context: The context
+        :param reuse: Whether the context is healthy, e.g. its last screenshot
+            succeeded
+        :param pool_size: Maximum number of idle contexts kept, the least
+            recently released ones are closed first
+        :param max_uses: Maximum number of screenshots taken with a context
+        """
+        pooled = self._leased_contexts.pop(id(context), None)
+        if pooled is None or not reuse or pooled.uses >= max_uses:
+            self._close_context(context)
+            return
+
+        try:
+            for page in context.pages:
+                page.close()
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Unable to reset a pooled browser context", exc_info=True)
+            self._close_context(context)
+            return
+
+        self._idle_contexts.append(pooled)
+        while len(self._idle_contexts) > pool_size:
+            self._close_context(self._idle_contexts.pop(0).context)
+
+    @staticmethod
+    def _close_context(context: Any) -> None:
+        try:
+            context.close()
+        except Exception:  # noqa: S110
+            pass
+
     def _cleanup(self) -> None:
+        # the contexts are closed with their browser
+        self._idle_contexts = []
+        self._leased_contexts = {}
         if self._browser is not None:
             try:
                 self._browser.close()
@@ -288,7 +388,7 @@ class WebDriverPlaywright(WebDriverProxy):
     def _wait_for_charts_ready(
         page: Page,
         url: str,
-        load_wait: int,
+        load_wait: float,
         element_name: str,
         log_context: str | None = None,
         screenshot_started_at: float | None = None,
@@ -415,7 +515,7 @@ class WebDriverPlaywright(WebDriverProxy):
             raise
         logger.debug("All chart holders ready at url: %s%s", url, context_suffix)
 
-    def get_screenshot(  # pylint: disable=too-many-locals, too-many-statements  # noqa: C901
+    def get_screenshot(
         self,
         url: str,
         element_name: str,
@@ -432,230 +532,404 @@ class WebDriverPlaywright(WebDriverProxy):
             )
             return None
 
+        context, page = self._new_page(user)
+        screenshot = None
+        try:
+            self._navigate(page, url)
+            screenshot = self._capture(
+                page,
+                url,
+                element_name,
+                user=user,
+                log_context=log_context,
+                screenshot_started_at=screenshot_started_at,
+            )
+            return screenshot
+        finally:
+            self._release_context(context, reuse=screenshot is not None)
+
+    def get_screenshots(
+        self,
+        urls: list[str],
+        element_name: str,
+        user: User | None = None,
+        log_context: str | None = None,
+    ) -> list[bytes | None]:
+        """
+        Return the screenshots of several pages, loading up to
+        ``SCREENSHOT_PLAYWRIGHT_TAB_CONCURRENCY`` of them at the same time.
+
+        The Playwright sync API drives pages from a single thread, so the pages
+        are captured one after the other while the next ones already load in the
+        browser. Each page is captured within ``SCREENSHOT_PLAYWRIGHT_TAB_TIMEOUT``
+        of the start of its capture, and the results keep the order of the
+        URLs. Stops at the first failed screenshot: its result and the results
+        of the following pages are None.
+        """
+        concurrency = max(1, app.config["SCREENSHOT_PLAYWRIGHT_TAB_CONCURRENCY"])
+        screenshots: list[bytes | None] = [None] * len(urls)
+        loading: deque[tuple[int, BrowserContext, Page, float]] = deque()
+
+        def capture_next() -> bytes | None:
+            index, context, page, started_at = loading.popleft()
+            try:
+                screenshots[index] = self._capture_tab(
+                    page, urls[index], element_name, user, log_context, started_at
+                )
+            finally:
+                self._release_context(context, reuse=screenshots[index] is not None)
+            return screenshots[index]
+
+        try:
+            for index, url in enumerate(urls):
+                if len(loading) >= concurrency and capture_next() is None:
+                    return screenshots
+                context, page = self._new_page(user)
+                loading.append((index, context, page, time.monotonic()))
+                self._navigate(page, url, wait=False)
+            while loading:
+                if capture_next() is None:
+                    return screenshots
+        finally:
+            for _, context, _, _ in loading:
+                self._release_context(context, reuse=False)
+        return screenshots
+
+    def _capture_tab(  # pylint: disable=too-many-arguments
+        self,
+        page: Page,
+        url: str,
+        element_name: str,
+        user: User | None,
+        log_context: str | None,
+        started_at: float,
+    ) -> bytes | None:
+        """
+        Capture a page loading since ``started_at``, within the tab timeout.
+
+        The timeout starts with the capture rather than with the navigation, as
+        the tabs are captured one after the other.
+        """
+        deadline = None
+        if (tab_timeout := app.config["SCREENSHOT_PLAYWRIGHT_TAB_TIMEOUT"]) is not None:
+            deadline = time.monotonic() + tab_timeout
+        self._bound_waits(page, url, deadline)
+        self._wait_for_load(page, url)
+        return self._capture(
+            page,
+            url,
+            element_name,
+            user=user,
+            log_context=log_context,
+            screenshot_started_at=started_at,
+            headstart_started_at=started_at,
+            deadline=deadline,
+        )
+
+    @staticmethod
+    def _bound_waits(
+        page: Page,
+        url: str,
+        deadline: float | None,
+        wait: float = float("inf"),
+    ) -> float:
+        """
+        Bound the next operations of the page by the time left before
+        ``deadline``, and return ``wait`` (in seconds) capped by that time.
+
+        :raises PlaywrightTimeout: If the deadline has passed
+        """
+        if deadline is None:
+            return wait
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise PlaywrightTimeout(f"Timed out capturing url {url}")
+        page.set_default_timeout(
+            min(remaining * 1000, app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"])
+        )
+        return min(wait, remaining)
+
+    def _new_page(self, user: User | None) -> tuple[BrowserContext, Page]:
+        """
+        Open a page in a context of the browser of the process, authenticated as
+        the user.
+
+        With ``SCREENSHOT_PLAYWRIGHT_CONTEXT_POOL_SIZE``, the context is reused
+        from a previous screenshot of the user when possible. It must be given
+        back with ``_release_context``.
+        """
         browser_args = app.config["WEBDRIVER_OPTION_ARGS"]
         browser = _browser_manager.get_browser(browser_args)
         pixel_density = app.config["WEBDRIVER_WINDOW"].get("pixel_density", 1)
+
+        def new_context() -> BrowserContext:
+            context = browser.new_context(
+                bypass_csp=True,
+                viewport={
+                    "height": self._window[1],
+                    "width": self._window[0],
+                },
+                device_scale_factor=pixel_density,
+            )
+            try:
+                context.set_default_timeout(
+                    app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"]
+                )
+                if user:
+                    self.auth(user, context)
+            except Exception:
+                context.close()
+                raise
+            return context
+
+        if app.config.get("SCREENSHOT_PLAYWRIGHT_CONTEXT_POOL_SIZE", 0) > 0:
+            context = _browser_manager.get_context(
+                (user.username if user else None, self._window, pixel_density),
+                new_context,
+                max_age=app.config["SCREENSHOT_PLAYWRIGHT_CONTEXT_MAX_AGE"],
+            )
+        else:
+            context = new_context()
+        try:
+            return context, context.new_page()
+        except Exception:
+            self._release_context(context, reuse=False)
+            raise
+
+    @staticmethod
+    def _release_context(context: BrowserContext, reuse: bool) -> None:
+        """
+        Close a context opened by ``_new_page``, or keep it in the pool of
+        contexts if it can be reused.
+        """
+        pool_size = app.config.get("SCREENSHOT_PLAYWRIGHT_CONTEXT_POOL_SIZE", 0)
+        if pool_size > 0:
+            _browser_manager.release_context(
+                context,
+                reuse=reuse,
+                pool_size=pool_size,
+                max_uses=app.config["SCREENSHOT_PLAYWRIGHT_CONTEXT_MAX_USES"],
+            )
+        else:
+            context.close()
+
+    @staticmethod
+    def _navigate(page: Page, url: str, wait: bool = True) -> None:
+        """
+        Navigate to the URL, waiting for ``SCREENSHOT_PLAYWRIGHT_WAIT_EVENT`` unless
+        ``wait`` is False, in which case the event is awaited later with
+        ``_wait_for_load``.
+        """
+        wait_event = app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"]
+        try:
+            page.goto(url, wait_until=wait_event if wait else "commit")
+        except PlaywrightTimeout:
+            logger.exception(
+                "Web event %s not detected. Page %s might not have been fully loaded",  # noqa: E501
+                wait_event,
+                url,
+            )
+
+    @staticmethod
+    def _wait_for_load(page: Page, url: str) -> None:
+        wait_event = app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"]
+        if wait_event == "commit":
+            return
+        try:
+            page.wait_for_load_state(wait_event)
+        except PlaywrightTimeout:
+            logger.exception(
+                "Web event %s not detected. Page %s might not have been fully loaded",  # noqa: E501
+                wait_event,
+                url,
+            )
+
+    def _capture(  # pylint: disable=too-many-locals, too-many-statements  # noqa: C901
+        self,
+        page: Page,
+        url: str,
+        element_name: str,
+        user: User | None = None,
+        log_context: str | None = None,
+        screenshot_started_at: float | None = None,
+        headstart_started_at: float | None = None,
+        deadline: float | None = None,
+    ) -> bytes | None:
+        """
+        Take the screenshot of the element of a loaded page.
+
+        :param headstart_started_at: When the page started loading, to only wait
+            for what's left of ``SCREENSHOT_SELENIUM_HEADSTART``. By default the
+            whole headstart is waited for.
+        :param deadline: ``time.monotonic()`` value by which the screenshot must
+            be taken, checked before each wait. By default only each wait is
+            bounded.
+        """
         viewport_height = self._window[1]
         viewport_width = self._window[0]
-        context = browser.new_context(
-            bypass_csp=True,
-            viewport={
-                "height": viewport_height,
-                "width": viewport_width,
-            },
-            device_scale_factor=pixel_density,
-        )
-        context.set_default_timeout(app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"])
-        if user:
-            self.auth(user, context)
-        page = context.new_page()
         img: bytes | None = None
+        selenium_headstart: float = app.config["SCREENSHOT_SELENIUM_HEADSTART"]
+        if headstart_started_at is not None:
+            selenium_headstart = max(
+                0.0, selenium_headstart - (time.monotonic() - headstart_started_at)
+            )
+        selenium_headstart = self._bound_waits(
+            page, url, deadline, selenium_headstart
+        )
+        logger.debug("Sleeping for %i seconds", selenium_headstart)
+        page.wait_for_timeout(selenium_headstart * 1000)
+        element: Locator
         try:
             try:
-                page.goto(
-                    url,
-                    wait_until=app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"],
+                # page didn't load
+                logger.debug(
+                    "Wait for the presence of %s at url: %s", element_name, url
                 )
+                element = page.locator(f".{element_name}")
+                self._bound_waits(page, url, deadline)
+                element.wait_for()
             except PlaywrightTimeout:
-                logger.exception(
-                    "Web event %s not detected. Page %s might not have been fully loaded",  # noqa: E501
-                    app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"],
-                    url,
-                )
+                logger.exception("Timed out requesting url %s", url)
+                raise
 
-            selenium_headstart = app.config["SCREENSHOT_SELENIUM_HEADSTART"]
-            logger.debug("Sleeping for %i seconds", selenium_headstart)
-            page.wait_for_timeout(selenium_headstart * 1000)
-            element: Locator
+            slice_container_elems: list[Locator] = []
+            rendered_chart_count = 0
             try:
-                try:
-                    # page didn't load
-                    logger.debug(
-                        "Wait for the presence of %s at url: %s", element_name, url
-                    )
-                    element = page.locator(f".{element_name}")
-                    element.wait_for()
-                except PlaywrightTimeout:
-                    logger.exception("Timed out requesting url %s", url)
-                    raise
-
-                slice_container_elems: list[Locator] = []
-                rendered_chart_count = 0
-                try:
-                    # chart containers didn't render
-                    logger.debug("Wait for chart containers to draw at url: %s", url)
-                    slice_container_locator = page.locator(".chart-container")
-                    # One-time snapshot: containers mounting after this point
-                    # are neither waited on nor counted, so the progress
-                    # numbers below describe the snapshot, not the final DOM.
-                    slice_container_elems = slice_container_locator.all()
-                    for slice_container_elem in slice_container_elems:
-                        slice_container_elem.wait_for()
-                        rendered_chart_count += 1
-                except PlaywrightTimeout:
-                    # Customer-side chart loading is often just slow, not a
-                    # Superset bug, so this is a WARNING (matching the other
-                    # locate-wait timeouts below) rather than an ERROR -- but
-                    # it still fails the screenshot; see the `raise` below.
+                # chart containers didn't render
+                logger.debug("Wait for chart containers to draw at url: %s", url)
+                slice_container_locator = page.locator(".chart-container")
+                # One-time snapshot: containers mounting after this point
+                # are neither waited on nor counted, so the progress
+                # numbers below describe the snapshot, not the final DOM.
+                slice_container_elems = slice_container_locator.all()
+                for slice_container_elem in slice_container_elems:
+                    self._bound_waits(page, url, deadline)
+                    slice_container_elem.wait_for()
+                    rendered_chart_count += 1
+            except PlaywrightTimeout:
+                # Customer-side chart loading is often just slow, not a
+                # Superset bug, so this is a WARNING (matching the other
+                # locate-wait timeouts below) rather than an ERROR -- but
+                # it still fails the screenshot; see the `raise` below.
+                logger.warning(
+                    "Timed out waiting for chart containers to draw at url %s "
+                    "(%s of %s chart containers rendered before the timeout)",
+                    url,
+                    rendered_chart_count,
+                    len(slice_container_elems),
+                    exc_info=True,
+                )
+                raise
+            selenium_animation_wait = app.config["SCREENSHOT_SELENIUM_ANIMATION_WAIT"]
+            if app.config["SCREENSHOT_REPLACE_UNEXPECTED_ERRORS"]:
+                unexpected_errors = WebDriverPlaywright.find_unexpected_errors(page)
+                if unexpected_errors:
                     logger.warning(
-                        "Timed out waiting for chart containers to draw at url %s "
-                        "(%s of %s chart containers rendered before the timeout)",
+                        "%i errors found in the screenshot. URL: %s. Errors are: %s",  # noqa: E501
+                        len(unexpected_errors),
                         url,
-                        rendered_chart_count,
-                        len(slice_container_elems),
-                        exc_info=True,
+                        unexpected_errors,
                     )
-                    raise
-                selenium_animation_wait = app.config[
-                    "SCREENSHOT_SELENIUM_ANIMATION_WAIT"
-                ]
-                if app.config["SCREENSHOT_REPLACE_UNEXPECTED_ERRORS"]:
-                    unexpected_errors = WebDriverPlaywright.find_unexpected_errors(page)
-                    if unexpected_errors:
-                        logger.warning(
-                            "%i errors found in the screenshot. URL: %s. Errors are: %s",  # noqa: E501
-                            len(unexpected_errors),
-                            url,
-                            unexpected_errors,
-                        )
-                # Detect large dashboards and use tiled screenshots if enabled
-                tiled_enabled = app.config.get("SCREENSHOT_TILED_ENABLED", False)
+            # Detect large dashboards and use tiled screenshots if enabled
+            tiled_enabled = app.config.get("SCREENSHOT_TILED_ENABLED", False)
 
-                if tiled_enabled:
-                    chart_count = page.evaluate(
-                        'document.querySelectorAll(".chart-container").length'
-                    )
-                    dashboard_height = page.evaluate(
-                        f"""() => {{
-                            const target = document.querySelector(\".{element_name}\");
-                            return target ? target.scrollHeight : 0;
-                        }}"""
-                    )
-                    chart_threshold = app.config.get(
-                        "SCREENSHOT_TILED_CHART_THRESHOLD", 20
-                    )
-                    height_threshold = app.config.get(
-                        "SCREENSHOT_TILED_HEIGHT_THRESHOLD", 5000
-                    )
-                    tile_height = app.config.get(
-                        "SCREENSHOT_TILED_VIEWPORT_HEIGHT", viewport_height
-                    )
+            if tiled_enabled:
+                chart_count = page.evaluate(
+                    'document.querySelectorAll(".chart-container").length'
+                )
+                dashboard_height = page.evaluate(
+                    f"""() => {{
+                        const target = document.querySelector(\".{element_name}\");
+                        return target ? target.scrollHeight : 0;
+                    }}"""
+                )
+                chart_threshold = app.config.get("SCREENSHOT_TILED_CHART_THRESHOLD", 20)
+                height_threshold = app.config.get(
+                    "SCREENSHOT_TILED_HEIGHT_THRESHOLD", 5000
+                )
+                tile_height = app.config.get(
+                    "SCREENSHOT_TILED_VIEWPORT_HEIGHT", viewport_height
+                )
 
-                    # A height of 0 means the DOM query above found no matching
-                    # element (or it hadn't laid out yet), not that the
-                    # dashboard is actually empty. Treat it as "unknown" rather
-                    # than "fits in a single tile": chart_count alone already
-                    # tells us whether this looks like a large dashboard, and
-                    # that signal must not be silently vetoed just because we
-                    # couldn't measure height, or a large dashboard could skip
-                    # tiling and ship with unrendered below-the-fold charts.
-                    height_unknown = dashboard_height == 0
-                    likely_large_dashboard = (
-                        chart_count >= chart_threshold
-                        or dashboard_height > height_threshold
+                # A height of 0 means the DOM query above found no matching
+                # element (or it hadn't laid out yet), not that the
+                # dashboard is actually empty. Treat it as "unknown" rather
+                # than "fits in a single tile": chart_count alone already
+                # tells us whether this looks like a large dashboard, and
+                # that signal must not be silently vetoed just because we
+                # couldn't measure height, or a large dashboard could skip
+                # tiling and ship with unrendered below-the-fold charts.
+                height_unknown = dashboard_height == 0
+                likely_large_dashboard = (
+                    chart_count >= chart_threshold
+                    or dashboard_height > height_threshold
+                )
+                if height_unknown:
+                    log_fn = logger.warning if likely_large_dashboard else logger.debug
+                    log_fn(
+                        "Could not determine dashboard height for element %s "
+                        "at url %s (%s chart containers found); %s",
+                        element_name,
+                        url,
+                        chart_count,
+                        "attempting tiled screenshot anyway"
+                        if likely_large_dashboard
+                        else "falling back to standard screenshot behavior",
                     )
-                    if height_unknown:
-                        log_fn = (
-                            logger.warning if likely_large_dashboard else logger.debug
-                        )
-                        log_fn(
-                            "Could not determine dashboard height for element %s "
-                            "at url %s (%s chart containers found); %s",
-                            element_name,
-                            url,
-                            chart_count,
-                            "attempting tiled screenshot anyway"
-                            if likely_large_dashboard
-                            else "falling back to standard screenshot behavior",
-                        )
 
-                    # Use tiled screenshots for large dashboards
-                    use_tiled = likely_large_dashboard and (
-                        height_unknown or dashboard_height > tile_height
-                    )
+                # Use tiled screenshots for large dashboards
+                use_tiled = likely_large_dashboard and (
+                    height_unknown or dashboard_height > tile_height
+                )
 
-                    if use_tiled:
-                        logger.info(
-                            "Large dashboard detected: %s charts, %spx height. "
-                            "Using tiled screenshots.",
-                            chart_count,
-                            dashboard_height,
-                        )
-                        # set viewport height to tile height for easier calculations
-                        page.set_viewport_size(
-                            {"height": tile_height, "width": viewport_width}
-                        )
-                        img = take_tiled_screenshot(
-                            page,
-                            element_name,
-                            tile_height,
-                            load_wait=self._screenshot_load_wait,
-                            animation_wait=selenium_animation_wait,
-                            log_context=log_context,
-                        )
-                        if not img:
-                            # _get_screenshot() has no wait/readiness logic at
-                            # all, so falling back to it here would risk
-                            # silently delivering a screenshot of spinners or
-                            # a blank dashboard. Fail the capture loudly
-                            # (report error, thumbnail cache ERROR) instead of
-                            # guessing at a "safer" fallback.
-                            logger.warning(
-                                "Tiled screenshot failed for url %s and no "
-                                "safe fallback exists; failing the capture",
-                                url,
-                            )
-                            raise PlaywrightTimeout(
-                                f"Tiled screenshot failed for url {url}"
-                            )
-                        logger.debug(
-                            "Tiled screenshot result: %d bytes for url: %s",
-                            len(img),
-                            url,
-                        )
-                    else:
-                        logger.debug(
-                            "Dashboard below tiling threshold "
-                            "(%s charts, %spx height); using standard screenshot "
-                            "for url: %s",
-                            chart_count,
-                            dashboard_height,
-                            url,
-                        )
-                        # Standard screenshot captures the full element including
-                        # below-the-fold content, so wait for all viewport-visible
-                        # chart holders to reach a terminal state.
-                        WebDriverPlaywright._wait_for_charts_ready(
-                            page,
-                            url,
-                            self._screenshot_load_wait,
-                            element_name,
-                            log_context=log_context,
-                            screenshot_started_at=screenshot_started_at,
-                        )
-                        if selenium_animation_wait > 0:
-                            logger.debug(
-                                "Wait %i seconds for chart animation",
-                                selenium_animation_wait,
-                            )
-                            page.wait_for_timeout(selenium_animation_wait * 1000)
-                        logger.debug(
-                            "Taking screenshot of url %s as user %s",
+                if use_tiled:
+                    logger.info(
+                        "Large dashboard detected: %s charts, %spx height. "
+                        "Using tiled screenshots.",
+                        chart_count,
+                        dashboard_height,
+                    )
+                    # set viewport height to tile height for easier calculations
+                    page.set_viewport_size(
+                        {"height": tile_height, "width": viewport_width}
+                    )
+                    img = take_tiled_screenshot(
+                        page,
+                        element_name,
+                        tile_height,
+                        load_wait=self._bound_waits(
+                            page, url, deadline, self._screenshot_load_wait
+                        ),
+                        animation_wait=selenium_animation_wait,
+                        log_context=log_context,
+                    )
+                    if not img:
+                        # _get_screenshot() has no wait/readiness logic at
+                        # all, so falling back to it here would risk
+                        # silently delivering a screenshot of spinners or
+                        # a blank dashboard. Fail the capture loudly
+                        # (report error, thumbnail cache ERROR) instead of
+                        # guessing at a "safer" fallback.
+                        logger.warning(
+                            "Tiled screenshot failed for url %s and no "
+                            "safe fallback exists; failing the capture",
                             url,
-                            user.username if user else "None",
-                        )
-                        img = WebDriverPlaywright._get_screenshot(
-                            page, element, element_name
                         )
-                        logger.debug(
-                            "Screenshot result: %d bytes for url: %s",
-                            len(img) if img else 0,
-                            url,
+                        raise PlaywrightTimeout(
+                            f"Tiled screenshot failed for url {url}"
                         )
+                    logger.debug(
+                        "Tiled screenshot result: %d bytes for url: %s",
+                        len(img),
+                        url,
+                    )
                 else:
                     logger.debug(
-                        "Tiled screenshots disabled; using standard screenshot "
+                        "Dashboard below tiling threshold "
+                        "(%s charts, %spx height); using standard screenshot "
                         "for url: %s",
+                        chart_count,
+                        dashboard_height,
                         url,
                     )
                     # Standard screenshot captures the full element including
@@ -664,7 +938,9 @@ class WebDriverPlaywright(WebDriverProxy):
                     WebDriverPlaywright._wait_for_charts_ready(
                         page,
                         url,
-                        self._screenshot_load_wait,
+                        self._bound_waits(
+                            page, url, deadline, self._screenshot_load_wait
+                        ),
                         element_name,
                         log_context=log_context,
                         screenshot_started_at=screenshot_started_at,
@@ -674,12 +950,18 @@ class WebDriverPlaywright(WebDriverProxy):
                             "Wait %i seconds for chart animation",
                             selenium_animation_wait,
                         )
-                        page.wait_for_timeout(selenium_animation_wait * 1000)
+                        page.wait_for_timeout(
+                            self._bound_waits(
+                                page, url, deadline, selenium_animation_wait
+                            )
+                            * 1000
+                        )
                     logger.debug(
                         "Taking screenshot of url %s as user %s",
                         url,
                         user.username if user else "None",
                     )
+                    self._bound_waits(page, url, deadline)
                     img = WebDriverPlaywright._get_screenshot(
                         page, element, element_name
                     )
@@ -688,15 +970,50 @@ class WebDriverPlaywright(WebDriverProxy):
                         len(img) if img else 0,
                         url,
                     )
-
-            except PlaywrightTimeout:
-                raise
-            except PlaywrightError:
-                logger.exception(
-                    "Encountered an unexpected error when requesting url %s", url
+            else:
+                logger.debug(
+                    "Tiled screenshots disabled; using standard screenshot for url: %s",
+                    url,
                 )
-        finally:
-            context.close()
+                # Standard screenshot captures the full element including
+                # below-the-fold content, so wait for all viewport-visible
+                # chart holders to reach a terminal state.
+                WebDriverPlaywright._wait_for_charts_ready(
+                    page,
+                    url,
+                    self._bound_waits(page, url, deadline, self._screenshot_load_wait),
+                    element_name,
+                    log_context=log_context,
+                    screenshot_started_at=screenshot_started_at,
+                )
+                if selenium_animation_wait > 0:
+                    logger.debug(
+                        "Wait %i seconds for chart animation",
+                        selenium_animation_wait,
+                    )
+                    page.wait_for_timeout(
+                        self._bound_waits(page, url, deadline, selenium_animation_wait)
+                        * 1000
+                    )
+                logger.debug(
+                    "Taking screenshot of url %s as user %s",
+                    url,
+                    user.username if user else "None",
+                )
+                self._bound_waits(page, url, deadline)
+                img = WebDriverPlaywright._get_screenshot(page, element, element_name)
+                logger.debug(
+                    "Screenshot result: %d bytes for url: %s",
+                    len(img) if img else 0,
+                    url,
+                )
+
+        except PlaywrightTimeout:
+            raise
+        except PlaywrightError:
+            logger.exception(
+                "Encountered an unexpected error when requesting url %s", url
+            )
         return img
 
 
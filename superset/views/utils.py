@@ -37,7 +37,7 @@ from flask_babel import _
 from sqlalchemy.exc import NoResultFound
 from werkzeug.exceptions import BadRequest
 
-from superset import appbuilder, dataframe, db, result_set, viz
+from superset import appbuilder, dataframe, db, result_set, results_backend, viz
 from superset.common.db_query_status import QueryStatus
 from superset.daos.datasource import DatasourceDAO
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -53,12 +53,14 @@ from superset.models.core import Database
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab.utils import get_results_chunk_key, get_results_chunk_range
 from superset.superset_typing import (
     ExplorableData,
     FlaskResponse,
     FormData,
 )
 from superset.utils import json
+from superset.utils.compression import decompress
 from superset.utils.core import DatasourceType
 from superset.utils.decorators import stats_timing
 from superset.viz import BaseViz
@@ -714,8 +716,38 @@ def check_datasource_perms(
     viz_obj.raise_for_access()
 
 
+def _read_results_chunks(
+    key: str,
+    manifest: dict[str, int],
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> pa.Table:
+    """
+    Read the requested rows of results stored in chunks, fetching and decoding
+    only the chunks holding them.
+    """
+    chunk_range = get_results_chunk_range(manifest, offset, limit)
+    with stats_timing("sqllab.query.results_backend_chunks_read", stats_logger):
+        blobs = results_backend.get_many(
+            *[get_results_chunk_key(key, index) for index in chunk_range]
+        )
+    if not all(blobs):
+        raise SerializationError("Unable to read the results chunks")
+
+    tables = [
+        pa.ipc.open_stream(pa.BufferReader(decompress(blob, decode=False))).read_all()
+        for blob in blobs
+    ]
+    start = offset - chunk_range.start * manifest["chunk_rows"]
+    return pa.concat_tables(tables).slice(max(start, 0), limit)
+
+
 def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
 ) -> dict[str, Any]:
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
@@ -726,8 +758,15 @@ def _deserialize_results_payload(
 
         with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
             try:
-                reader = pa.BufferReader(ds_payload["data"])
-                pa_table = pa.ipc.open_stream(reader).read_all()
+                if manifest := ds_payload.pop("data_chunks", None):
+                    pa_table = _read_results_chunks(
+                        query.results_key, manifest, offset, limit
+                    )
+                else:
+                    reader = pa.BufferReader(ds_payload["data"])
+                    pa_table = pa.ipc.open_stream(reader).read_all()
+                    if offset or limit is not None:
+                        pa_table = pa_table.slice(offset, limit)
             except pa.ArrowSerializationError as ex:
                 raise SerializationError("Unable to deserialize table") from ex
 
@@ -749,7 +788,12 @@ def _deserialize_results_payload(
         return ds_payload
 
     with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
-        return json.loads(payload)
+        ds_payload = json.loads(payload)
+
+    if offset or limit is not None:
+        end = None if limit is None else offset + limit
+        ds_payload["data"] = ds_payload["data"][offset:end]
+    return ds_payload
 
 
 def get_cta_schema_name(
@@ -64,7 +64,7 @@ from superset.superset_typing import (
     VizPayload,
 )
 from superset.utils import core as utils, csv, json
-from superset.utils.cache import set_and_log_cache
+from superset.utils.cache import get_cache_generation, set_and_log_cache
 from superset.utils.cache_keys import add_impersonation_cache_key_if_needed
 from superset.utils.core import (
     apply_max_row_limit,
@@ -489,6 +489,8 @@ class BaseViz:  # pylint: disable=too-many-public-methods
         cache_dict["extra_cache_keys"] = self.datasource.get_extra_cache_keys(query_obj)
         cache_dict["rls"] = security_manager.get_rls_cache_key(self.datasource)
         cache_dict["changed_on"] = self.datasource.changed_on
+        if cache_generation := get_cache_generation(self.datasource.uid):
+            cache_dict["cache_generation"] = cache_generation
 
         # Add an impersonation key to cache if impersonation is enabled on the db
         # or if the CACHE_QUERY_BY_USER flag is on or per_user_caching is enabled on
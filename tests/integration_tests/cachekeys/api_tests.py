@@ -21,9 +21,11 @@ from typing import Any
 from unittest.mock import patch
 
 import pytest
+from flask import current_app
 
 from superset.extensions import cache_manager, db
 from superset.models.cache import CacheKey
+from superset.utils.cache import get_cache_generation
 from superset.utils.core import get_example_default_schema
 from tests.integration_tests.base_tests import (
     SupersetTestCase,
@@ -90,6 +92,18 @@ def test_invalidate_uses_data_cache_not_default_cache(invalidate):
     default_delete.assert_not_called()
 
 
+def test_invalidate_cache_generation(invalidate):
+    with patch.dict(current_app.config, {"DATASOURCE_CACHE_GENERATIONS": True}):
+        generation = get_cache_generation("3__table")
+        other_generation = get_cache_generation("4__table")
+
+        rv = invalidate({"datasource_uids": ["3__table"]})
+
+        assert rv.status_code == 201
+        assert get_cache_generation("3__table") != generation
+        assert get_cache_generation("4__table") == other_generation
+
+
 def test_invalidate_cache_empty_input(invalidate):
     rv = invalidate({"datasource_uids": []})
     assert rv.status_code == 201
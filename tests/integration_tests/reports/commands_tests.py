@@ -90,6 +90,7 @@ from tests.integration_tests.fixtures.birth_names_dashboard import (
     load_birth_names_dashboard_with_slices,  # noqa: F401
     load_birth_names_data,  # noqa: F401
 )
+from tests.integration_tests.fixtures.query_context import get_query_context
 from tests.integration_tests.fixtures.tabbed_dashboard import (
     tabbed_dashboard,  # noqa: F401
 )
@@ -115,6 +116,16 @@ pytestmark = pytest.mark.usefixtures(
 )
 
 
+@pytest.fixture(autouse=True)
+def chart_data_over_http() -> Iterator[None]:
+    """
+    The report tests mock the chart data HTTP requests of the workers, unless they
+    run the chart data in process.
+    """
+    with patch.dict(app.config, {"ALERT_REPORTS_IN_PROCESS_CHART_DATA": False}):
+        yield
+
+
 def get_target_from_report_schedule(report_schedule: ReportSchedule) -> list[str]:
     return [
         json.loads(recipient.recipient_config_json)["target"]
@@ -269,6 +280,20 @@ def create_report_email_chart_with_csv():
     cleanup_report_schedule(report_schedule)
 
 
+@pytest.fixture
+def create_report_email_chart_with_csv_query_context() -> Iterator[ReportSchedule]:
+    """Email report schedule with a CSV attachment on a chart with a query context."""
+    chart = db.session.query(Slice).first()
+    chart.query_context = json.dumps(get_query_context("birth_names"))
+    report_schedule = create_report_notification(
+        email_target="target@email.com",
+        chart=chart,
+        report_format=ReportDataFormat.CSV,
+    )
+    yield report_schedule
+    cleanup_report_schedule(report_schedule)
+
+
 @pytest.fixture
 def create_report_email_chart_with_xlsx() -> Iterator[ReportSchedule]:
     """Email report schedule on a chart with the XLSX (Excel) attachment format."""
@@ -1071,6 +1096,40 @@ def test_email_chart_report_schedule_with_csv(
         assert_log(ReportState.SUCCESS)
 
 
+@pytest.mark.usefixtures(
+    "load_birth_names_dashboard_with_slices",
+    "create_report_email_chart_with_csv_query_context",
+)
+@patch("superset.utils.csv.urllib.request.urlopen")
+@patch("superset.reports.notifications.email.send_email_smtp")
+def test_email_chart_report_schedule_with_csv_in_process(
+    email_mock,
+    mock_urlopen,
+    create_report_email_chart_with_csv_query_context,
+):
+    """
+    ExecuteReport Command: Test chart email report schedule with CSV generated in
+    the worker, without requesting the webserver
+    """
+    with (
+        patch.dict(app.config, {"ALERT_REPORTS_IN_PROCESS_CHART_DATA": True}),
+        freeze_time("2020-01-01T00:00:00Z"),
+    ):
+        AsyncExecuteReportScheduleCommand(
+            TEST_ID,
+            create_report_email_chart_with_csv_query_context.id,
+            datetime.utcnow(),
+        ).run()
+
+        mock_urlopen.assert_not_called()
+        smtp_data = email_mock.call_args[1]["data"]
+        csv_data = smtp_data[list(smtp_data.keys())[0]].decode()
+        header, *rows = csv_data.splitlines()
+        assert header.split(",")[-2:] == ["name", "sum__num"]
+        assert rows
+        assert_log(ReportState.SUCCESS)
+
+
 @pytest.mark.usefixtures(
     "load_birth_names_dashboard_with_slices",
     "create_report_email_chart_with_xlsx",
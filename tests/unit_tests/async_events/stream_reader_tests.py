@@ -0,0 +1,170 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from superset.async_events.async_query_manager import AsyncQueryManager
+from superset.async_events.cache_backend import RedisCacheBackend
+from superset.async_events.stream_reader import (
+    AsyncEventStreamReader,
+    parse_stream_id,
+)
+from superset.utils import json
+
+
+class FakeStreams:
+    """
+    Redis streams supporting blocking reads, as returned by redis-py.
+    """
+
+    def __init__(self) -> None:
+        self.entries: dict[str, list[tuple[bytes, dict[bytes, bytes]]]] = {}
+        self.reads: list[dict[str, str]] = []
+        self.condition = threading.Condition()
+
+    def xadd(self, stream_name: str, entry_id: str, data: dict[str, Any]) -> None:
+        with self.condition:
+            self.entries.setdefault(stream_name, []).append(
+                (
+                    entry_id.encode(),
+                    {b"data": json.dumps(data).encode()},
+                )
+            )
+            self.condition.notify_all()
+
+    def xread(self, streams: dict[str, str], count: int, block: int) -> list[Any]:
+        def read() -> list[Any]:
+            return [
+                [stream_name.encode(), new_entries[:count]]
+                for stream_name, last_id in streams.items()
+                if (
+                    new_entries := [
+                        entry
+                        for entry in self.entries.get(stream_name, [])
+                        if parse_stream_id(entry[0]) > parse_stream_id(last_id)
+                    ]
+                )
+            ]
+
+        with self.condition:
+            self.reads.append(streams)
+            self.condition.wait_for(read, timeout=block / 1000)
+            return read()
+
+
+@pytest.fixture
+def streams() -> FakeStreams:
+    return FakeStreams()
+
+
+@pytest.fixture
+def reader(streams: FakeStreams) -> Iterator[AsyncEventStreamReader]:
+    reader = AsyncEventStreamReader(
+        mock.Mock(spec=RedisCacheBackend, xread=streams.xread),
+        block_ms=50,
+    )
+    yield reader
+    reader.shutdown()
+
+
+def test_parse_stream_id() -> None:
+    assert parse_stream_id("1607477697866-1") == (1607477697866, 1)
+    assert parse_stream_id(b"1607477697866-10") == (1607477697866, 10)
+    assert parse_stream_id("1607477697866") == (1607477697866, 0)
+    assert parse_stream_id("invalid") is None
+
+
+def test_wait_multiplexes_streams(
+    streams: FakeStreams,
+    reader: AsyncEventStreamReader,
+) -> None:
+    """
+    Test that requests waiting on several streams are served by a single read, and
+    only receive the entries added after their last ID.
+    """
+    results: dict[str, list[Any]] = {}
+
+    def wait(stream_name: str, last_id: str | None) -> None:
+        results[stream_name] = reader.wait(stream_name, last_id, timeout=5)
+
+    threads = [
+        threading.Thread(target=wait, args=("a", "1-0")),
+        threading.Thread(target=wait, args=("b", None)),
+    ]
+    for thread in threads:
+        thread.start()
+    # wait for both streams to be read together
+    deadline = time.monotonic() + 5
+    while {"a": "1-0", "b": "0-0"} not in streams.reads:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    streams.xadd("a", "1-0", {"job_id": "old"})
+    streams.xadd("a", "2-0", {"job_id": "1"})
+    streams.xadd("b", "3-0", {"job_id": "2"})
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert [entry[0] for entry in results["a"]] == [b"2-0"]
+    assert [entry[0] for entry in results["b"]] == [b"3-0"]
+
+
+def test_wait_timeout(streams: FakeStreams, reader: AsyncEventStreamReader) -> None:
+    """
+    Test that waiting returns no entries when none are added before the timeout,
+    and that streams aren't read once nobody waits on them.
+    """
+    assert reader.wait("a", "1-0", timeout=0.1) == []
+    assert reader.wait("a", "invalid", timeout=5) == []
+
+    time.sleep(0.2)
+    reads = len(streams.reads)
+    time.sleep(0.2)
+    assert len(streams.reads) == reads
+
+
+def test_read_events_long_polling(
+    streams: FakeStreams,
+    reader: AsyncEventStreamReader,
+) -> None:
+    """
+    Test that reading the events of a channel waits for new events when there are
+    none.
+    """
+    manager = AsyncQueryManager()
+    manager._stream_prefix = "async-events-"
+    manager._cache = mock.Mock(spec=RedisCacheBackend)
+    manager._cache.xrange.return_value = []
+    manager._stream_reader = reader
+    timer = threading.Timer(
+        0.1,
+        streams.xadd,
+        args=("async-events-chan", "5-0", {"job_id": "1", "status": "done"}),
+    )
+    timer.start()
+
+    assert manager.read_events("chan", "4-0", timeout=5) == [
+        {"id": "5-0", "job_id": "1", "status": "done"}
+    ]
+    assert manager.read_events("chan", "5-0") == []
+    timer.join()
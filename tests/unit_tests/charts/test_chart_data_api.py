@@ -363,3 +363,50 @@ def test_send_chart_response_does_not_double_extension_for_csv_filename() -> Non
     content_disposition = response.headers["Content-Disposition"]
     assert "my_export.csv.csv" not in content_disposition
     assert "my_export.csv" in content_disposition
+
+
+def test_send_chart_response_arrow() -> None:
+    """A single query Arrow result is returned as an Arrow IPC stream."""
+    from superset.charts.data.api import ChartDataRestApi
+    from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+
+    query_context = MagicMock()
+    query_context.result_type = ChartDataResultType.FULL
+    query_context.result_format = ChartDataResultFormat.ARROW
+
+    result = {
+        "query_context": query_context,
+        "queries": [{"data": b"arrow-stream"}],
+    }
+
+    api = ChartDataRestApi()
+    response = api._send_chart_response(result, form_data={"slice_name": "My Chart"})
+
+    assert response.mimetype == "application/vnd.apache.arrow.stream"
+    assert response.get_data() == b"arrow-stream"
+
+
+def test_send_chart_response_arrow_multiple_queries() -> None:
+    """Multi-query Arrow results are bundled as one stream per query in a zip."""
+    import io
+    import zipfile
+
+    from superset.charts.data.api import ChartDataRestApi
+    from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+
+    query_context = MagicMock()
+    query_context.result_type = ChartDataResultType.FULL
+    query_context.result_format = ChartDataResultFormat.ARROW
+
+    result = {
+        "query_context": query_context,
+        "queries": [{"data": b"first"}, {"data": b"second"}],
+    }
+
+    api = ChartDataRestApi()
+    response = api._send_chart_response(result, form_data={"slice_name": "My Chart"})
+
+    assert response.mimetype == "application/zip"
+    with zipfile.ZipFile(io.BytesIO(response.get_data())) as zip_file:
+        assert zip_file.read("query_1.arrow") == b"first"
+        assert zip_file.read("query_2.arrow") == b"second"
@@ -285,3 +285,41 @@ def test_columnar_reader_metadata_invalid_file():
         "Parsing error: Parquet file size is 2 bytes, "
         "smaller than the minimum file footer (8 bytes)"
     )
+
+
+def test_columnar_reader_file_to_dataframes(mocker):
+    """
+    Test that columnar files are read in batches, numbering the rows of the whole
+    file.
+    """
+    mocker.patch(
+        "superset.commands.database.uploaders.columnar_reader.READ_BATCH_SIZE", 2
+    )
+    reader = ColumnarReader(options=ColumnarReaderOptions(columns_read=["Name"]))
+
+    chunks = list(reader.file_to_dataframes(create_columnar_file(COLUMNAR_DATA)))
+    assert [chunk.index.tolist() for chunk in chunks] == [[0, 1], [2]]
+    assert [chunk.columns.tolist() for chunk in chunks] == [["Name"], ["Name"]]
+
+    with pytest.raises(DatabaseUploadFailed) as ex:
+        list(
+            reader.file_to_dataframes(
+                FileStorage(io.BytesIO(b"test"), filename="test.parquet")
+            )
+        )
+    assert "Parsing error" in str(ex.value)
+
+
+def test_columnar_reader_file_to_dataframes_empty_file():
+    """
+    Test that a columnar file without rows is read into an empty DataFrame, so the
+    table is still created or replaced.
+    """
+    reader = ColumnarReader(options=ColumnarReaderOptions(columns_read=["Name"]))
+
+    chunks = list(
+        reader.file_to_dataframes(create_columnar_file({"Name": [], "Age": []}))
+    )
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    assert chunks[0].columns.tolist() == ["Name"]
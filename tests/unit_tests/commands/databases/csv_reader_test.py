@@ -1417,3 +1417,75 @@ def test_csv_reader_chunk_concatenation_error_warning(caplog):
             "inconsistent date parsing across chunks" in record.message
             for record in caplog.records
         )
+
+
+def test_csv_reader_file_to_dataframes(mocker):
+    """Test that CSV files are read in chunks, casting the types of each chunk."""
+    from flask import current_app
+
+    mocker.patch.dict(current_app.config, {"READ_CSV_CHUNK_SIZE": 2})
+    data = [["Name", "Age"]] + [[f"name{i}", str(i)] for i in range(5)]
+
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(column_data_types={"Age": "float64"}),
+    )
+    chunks = list(csv_reader.file_to_dataframes(create_csv_file(data)))
+    assert [chunk.index.tolist() for chunk in chunks] == [[0, 1], [2, 3], [4]]
+    assert all(chunk["Age"].dtype == "float64" for chunk in chunks)
+
+    csv_reader = CSVReader(options=CSVReaderOptions(rows_to_read=3))
+    chunks = list(csv_reader.file_to_dataframes(create_csv_file(data)))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+
+
+def test_csv_reader_file_to_dataframes_errors(mocker):
+    """
+    Test that casting errors report the line of the file, and that the encoding is
+    detected before the first chunk.
+    """
+    from flask import current_app
+
+    mocker.patch.dict(current_app.config, {"READ_CSV_CHUNK_SIZE": 2})
+    data = [["Name", "Age"], ["a", "1"], ["b", "2"], ["c", "3"], ["d", "x"]]
+
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(column_data_types={"Age": "int64"}),
+    )
+    chunks = csv_reader.file_to_dataframes(create_csv_file(data))
+    assert len(next(chunks)) == 2
+    with pytest.raises(DatabaseUploadFailed) as ex:
+        next(chunks)
+    assert "Line 5: 'x' cannot be converted to int64" in str(ex.value)
+
+    binary_data = b"col1,col2\nv1,\xba\nv3,v4\n"
+    csv_reader = CSVReader(options=CSVReaderOptions())
+    chunks = csv_reader.file_to_dataframes(FileStorage(io.BytesIO(binary_data)))
+    assert pd.concat(chunks)["col2"].tolist() == ["º", "v4"]
+
+
+@pytest.mark.parametrize("supports_streaming_upload", [True, False])
+def test_csv_reader_read_streaming(mocker, supports_streaming_upload):
+    """
+    Test that streaming uploads write each chunk, the first one with the
+    ``already_exists`` option and the next ones appending to the table.
+    """
+    from flask import current_app
+
+    mocker.patch.dict(
+        current_app.config, {"READ_CSV_CHUNK_SIZE": 2, "UPLOAD_STREAMING": True}
+    )
+    database = mocker.MagicMock()
+    database.db_engine_spec.supports_streaming_upload = supports_streaming_upload
+    data = [["Name", "Age"]] + [[f"name{i}", str(i)] for i in range(5)]
+
+    csv_reader = CSVReader(options=CSVReaderOptions(already_exists="replace"))
+    csv_reader.read(create_csv_file(data), database, "table", None)
+
+    calls = database.db_engine_spec.df_to_sql.call_args_list
+    uploads = [
+        (len(call.args[2]), call.kwargs["to_sql_kwargs"]["if_exists"]) for call in calls
+    ]
+    if supports_streaming_upload:
+        assert uploads == [(2, "replace"), (2, "append"), (1, "append")]
+    else:
+        assert uploads == [(5, "replace")]
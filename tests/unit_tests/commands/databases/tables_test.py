@@ -291,3 +291,30 @@ def test_tables_without_catalog(
         cache=database_without_catalog.table_cache_enabled,
         cache_timeout=database_without_catalog.table_cache_timeout,
     )
+
+
+def test_tables_force_refreshes_partitions(
+    mocker: MockerFixture,
+    database_with_catalog: MockerFixture,
+) -> None:
+    """
+    Test that a forced refresh of the tables also refreshes their partitions.
+    """
+    mocker.patch.object(
+        security_manager,
+        "get_datasources_accessible_by_user",
+        return_value=set(),
+    )
+    refresh = mocker.patch(
+        "superset.commands.database.tables.partition_metadata_cache.refresh"
+    )
+
+    TablesDatabaseCommand(1, "catalog1", "schema1", False).run()
+    refresh.assert_not_called()
+
+    TablesDatabaseCommand(1, "catalog1", "schema1", True).run()
+    refresh.assert_called_once_with(
+        database_with_catalog.id,
+        catalog="catalog1",
+        schema="schema1",
+    )
@@ -31,6 +31,7 @@ from superset.commands.exceptions import UpdateFailedError
 from superset.commands.report.exceptions import (
     ReportScheduleAlertGracePeriodError,
     ReportScheduleCsvFailedError,
+    ReportScheduleCsvTimeout,
     ReportScheduleExecuteUnexpectedError,
     ReportScheduleExecutorNotFoundError,
     ReportSchedulePreviousWorkingError,
@@ -52,6 +53,8 @@ from superset.commands.report.execute import (
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.daos.report import REPORT_SCHEDULE_ERROR_NOTIFICATION_MARKER
 from superset.dashboards.permalink.types import DashboardPermalinkState
+from superset.errors import ErrorLevel, SupersetErrorType
+from superset.exceptions import SupersetTimeoutException
 from superset.reports.models import (
     ReportDataFormat,
     ReportRecipients,
@@ -1194,6 +1197,7 @@ def test_get_csv_data_posts_prepared_chart_data_payload(
     mocker: MockerFixture,
 ) -> None:
     """CSV report data should POST the prepared export query context."""
+    mocker.patch.dict(app.config, {"ALERT_REPORTS_IN_PROCESS_CHART_DATA": False})
     report_state = BaseReportState(
         create_report_schedule(mocker),
         "January 1, 2021",
@@ -1327,6 +1331,134 @@ def test_get_csv_data_keeps_screenshot_fallback_without_query_context(
     post_chart_data.assert_not_called()
 
 
+def _mock_chart_data_command(
+    mocker: MockerFixture,
+    queries: list[dict[str, Any]],
+    result_format: ChartDataResultFormat = ChartDataResultFormat.CSV,
+) -> dict[str, Any]:
+    """Mock the chart data command run in process, recording the running user."""
+    from flask import g
+
+    query_context = mocker.MagicMock(
+        result_format=result_format,
+        result_type=ChartDataResultType.POST_PROCESSED,
+    )
+    schema = mocker.patch(
+        "superset.commands.report.execute.ChartDataQueryContextSchema"
+    )
+    schema.return_value.load.return_value = query_context
+    users = []
+
+    def run() -> dict[str, Any]:
+        users.append(g.user)
+        return {"query_context": query_context, "queries": queries}
+
+    command = mocker.patch("superset.commands.report.execute.ChartDataCommand")
+    command.return_value.run.side_effect = run
+    apply_client_processing = mocker.patch(
+        "superset.commands.report.execute.apply_client_processing",
+        side_effect=lambda result, form_data, datasource: result,
+    )
+    return {
+        "query_context": query_context,
+        "schema": schema,
+        "users": users,
+        "apply_client_processing": apply_client_processing,
+    }
+
+
+def test_get_csv_data_runs_chart_data_in_process(
+    app: SupersetApp,
+    mocker: MockerFixture,
+) -> None:
+    """CSV report data should be generated in process as the report executor."""
+    report_state = _executor_report_state(mocker)
+    report_state._report_schedule.chart.query_context = json.dumps(
+        {
+            "datasource": {"id": 1, "type": "table"},
+            "queries": [{"row_limit": 10}],
+            "form_data": {"viz_type": "pivot_table_v2"},
+        }
+    )
+    user = mocker.MagicMock(username="report_executor")
+    mocker.patch(
+        "superset.commands.report.execute.resolve_executor_user",
+        return_value=(user, "report_executor"),
+    )
+    mocker.patch("superset.commands.report.execute.machine_auth_provider_factory")
+    mocker.patch(
+        "superset.commands.report.execute.security_manager.can_access",
+        return_value=True,
+    )
+    post_chart_data = mocker.patch.object(report_state, "_post_chart_data")
+    mocks = _mock_chart_data_command(
+        mocker,
+        [{"data": "a,b\n1,2\n"}],
+    )
+
+    # CSV text is encoded like the chart data API does, with CSV_EXPORT encoding
+    assert report_state._get_data(ChartDataResultFormat.CSV) == "a,b\n1,2\n".encode(
+        app.config["CSV_EXPORT"]["encoding"]
+    )
+
+    post_chart_data.assert_not_called()
+    assert mocks["users"] == [user]
+    request_payload = mocks["schema"].return_value.load.call_args.args[0]
+    assert request_payload["result_format"] == ChartDataResultFormat.CSV.value
+    assert request_payload["result_type"] == ChartDataResultType.POST_PROCESSED.value
+    mocks["apply_client_processing"].assert_called_once_with(
+        mocker.ANY,
+        request_payload["form_data"],
+        mocks["query_context"].datasource,
+    )
+
+
+def test_run_chart_data_zips_multiple_queries(
+    app: SupersetApp,
+    mocker: MockerFixture,
+) -> None:
+    """Charts with several queries should be exported as a zip, like the API."""
+    from io import BytesIO
+    from zipfile import ZipFile
+
+    mocker.patch(
+        "superset.commands.report.execute.security_manager.can_access",
+        return_value=True,
+    )
+    _mock_chart_data_command(mocker, [{"data": b"a\n1\n"}, {"data": "b\n2\n"}])
+
+    data = BaseReportState._run_chart_data({}, mocker.MagicMock())
+
+    with ZipFile(BytesIO(data)) as bundle:
+        assert bundle.read("query_1.csv") == b"a\n1\n"
+        assert bundle.read("query_2.csv").decode("utf-8-sig") == "b\n2\n"
+
+
+def test_get_csv_data_in_process_requires_export_permission(
+    app: SupersetApp,
+    mocker: MockerFixture,
+) -> None:
+    """Executors without the export permission should fail like over HTTP."""
+    report_state = _executor_report_state(mocker)
+    report_state._report_schedule.chart.query_context = json.dumps(
+        {"datasource": {"id": 1, "type": "table"}, "queries": [{}]}
+    )
+    mocker.patch(
+        "superset.commands.report.execute.resolve_executor_user",
+        return_value=(mocker.MagicMock(), "report_executor"),
+    )
+    mocker.patch("superset.commands.report.execute.machine_auth_provider_factory")
+    mocker.patch(
+        "superset.commands.report.execute.security_manager.can_access",
+        return_value=False,
+    )
+    mocks = _mock_chart_data_command(mocker, [{"data": "a\n1\n"}])
+
+    with pytest.raises(ReportScheduleCsvFailedError, match="can't export"):
+        report_state._get_data(ChartDataResultFormat.CSV)
+    assert mocks["users"] == []
+
+
 def test_get_url_for_xlsx_report(mocker: MockerFixture) -> None:
     """XLSX reports should request post-processed chart data."""
     report_schedule = create_report_schedule(mocker)
@@ -1678,7 +1810,7 @@ def test_get_data_xlsx_wraps_soft_time_limit_as_xlsx_timeout(
     app.config.update({"ALERT_REPORTS_CSV_REQUEST_TIMEOUT": 60})
     report_state = _executor_report_state(mocker)
     # Non-None query context so _get_data skips the screenshot fallback and
-    # reaches the _post_chart_data call this test drives to time out.
+    # reaches the _run_chart_data call this test drives to time out.
     report_state._report_schedule.chart.query_context = '{"mock": "qc"}'
 
     mocker.patch(
@@ -1688,7 +1820,7 @@ def test_get_data_xlsx_wraps_soft_time_limit_as_xlsx_timeout(
     mocker.patch("superset.commands.report.execute.machine_auth_provider_factory")
     mocker.patch.object(
         report_state,
-        "_post_chart_data",
+        "_run_chart_data",
         side_effect=SoftTimeLimitExceeded(),
     )
 
@@ -1696,6 +1828,49 @@ def test_get_data_xlsx_wraps_soft_time_limit_as_xlsx_timeout(
         report_state._get_data(ChartDataResultFormat.XLSX)
 
 
+def test_get_data_in_process_applies_request_timeout(
+    app: SupersetApp, mocker: MockerFixture
+) -> None:
+    """
+    The chart data generated in the worker is bounded by
+    ``ALERT_REPORTS_CSV_REQUEST_TIMEOUT``, and no auth cookies are requested as
+    the webserver isn't called.
+    """
+    app.config.update(
+        {
+            "ALERT_REPORTS_CSV_REQUEST_TIMEOUT": 60,
+            "ALERT_REPORTS_IN_PROCESS_CHART_DATA": True,
+        }
+    )
+    report_state = _executor_report_state(mocker)
+    report_state._report_schedule.chart.query_context = '{"mock": "qc"}'
+
+    mocker.patch(
+        "superset.commands.report.execute.resolve_executor_user",
+        return_value=(mocker.MagicMock(), "executor"),
+    )
+    auth_provider = mocker.patch(
+        "superset.commands.report.execute.machine_auth_provider_factory"
+    )
+    timeout = mocker.patch("superset.commands.report.execute.timeout")
+    mocker.patch.object(report_state, "_get_chart_data_request_payload")
+    mocker.patch.object(
+        report_state,
+        "_run_chart_data",
+        side_effect=SupersetTimeoutException(
+            error_type=SupersetErrorType.BACKEND_TIMEOUT_ERROR,
+            message="Timeout",
+            level=ErrorLevel.ERROR,
+        ),
+    )
+
+    with pytest.raises(ReportScheduleCsvTimeout):
+        report_state._get_data(ChartDataResultFormat.CSV)
+
+    timeout.assert_called_once_with(60)
+    auth_provider.instance.get_auth_cookies.assert_not_called()
+
+
 def test_executor_not_found_error_message_without_username() -> None:
     """
     When no username is available, the message falls back to ``(unknown)``
@@ -14,8 +14,11 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
+import pandas as pd
+
 from superset.common.utils.query_cache_manager import QueryCacheManager
 from superset.constants import CacheRegion
 
@@ -55,3 +58,136 @@ class TestQueryCacheManagerGet:
         assert result.is_loaded == miss_result.is_loaded
         assert result.cache_value == miss_result.cache_value
         assert result.status == miss_result.status
+
+
+class TestQueryCacheManagerStale:
+    @staticmethod
+    def _set_and_get(app, timeout, ratio, now):
+        from freezegun import freeze_time
+
+        from superset.models.helpers import QueryResult
+
+        cached: dict = {}
+        mock_cache = MagicMock()
+        mock_cache.get.side_effect = lambda key: cached.get(key)
+
+        def set_and_log_cache(cache, key, value, timeout, datasource_uid):
+            cached[key] = {**value, "dttm": "2024-01-01T00:00:00"}
+
+        with (
+            patch.dict(app.config, {"DATA_CACHE_SOFT_TIMEOUT_RATIO": ratio}),
+            patch(
+                "superset.common.utils.query_cache_manager._cache",
+                {CacheRegion.DATA: mock_cache},
+            ),
+            patch(
+                "superset.common.utils.query_cache_manager.set_and_log_cache",
+                side_effect=set_and_log_cache,
+            ),
+        ):
+            with freeze_time("2024-01-01 00:00:00"):
+                QueryCacheManager().set_query_result(
+                    key="key",
+                    query_result=QueryResult(
+                        df=pd.DataFrame(), query="SELECT 1", duration=timedelta(0)
+                    ),
+                    timeout=timeout,
+                    region=CacheRegion.DATA,
+                )
+            with freeze_time(now):
+                return QueryCacheManager.get(key="key", region=CacheRegion.DATA)
+
+    def test_fresh_entry(self, app):
+        """An entry before its soft expiry is not stale."""
+        result = self._set_and_get(app, 100, 0.5, "2024-01-01 00:00:40")
+        assert result.is_loaded is True
+        assert result.is_stale is False
+
+    def test_stale_entry(self, app):
+        """An entry past its soft expiry is still served, flagged as stale."""
+        result = self._set_and_get(app, 100, 0.5, "2024-01-01 00:01:00")
+        assert result.is_loaded is True
+        assert result.is_stale is True
+
+    def test_soft_timeout_disabled(self, app):
+        """Entries never become stale unless a soft timeout ratio is configured."""
+        result = self._set_and_get(app, 100, None, "2024-01-01 00:01:00")
+        assert result.is_loaded is True
+        assert result.is_stale is False
+
+    def test_no_timeout(self, app):
+        """Entries cached without expiry never become stale."""
+        result = self._set_and_get(app, 0, 0.5, "2025-01-01 00:00:00")
+        assert result.is_loaded is True
+        assert result.is_stale is False
+
+
+class TestQueryCacheManagerDataFrameCodec:
+    @staticmethod
+    def _set_and_get(app, codec, df):
+        from superset.models.helpers import QueryResult
+
+        cached: dict = {}
+        mock_cache = MagicMock()
+        mock_cache.get.side_effect = lambda key: cached.get(key)
+
+        def set_and_log_cache(cache, key, value, timeout, datasource_uid):
+            cached[key] = {**value, "dttm": "2024-01-01T00:00:00"}
+
+        with (
+            patch.dict(app.config, {"DATA_CACHE_DATAFRAME_CODEC": codec}),
+            patch(
+                "superset.common.utils.query_cache_manager._cache",
+                {CacheRegion.DATA: mock_cache},
+            ),
+            patch(
+                "superset.common.utils.query_cache_manager.set_and_log_cache",
+                side_effect=set_and_log_cache,
+            ),
+        ):
+            QueryCacheManager().set_query_result(
+                key="key",
+                query_result=QueryResult(
+                    df=df, query="SELECT 1", duration=timedelta(0)
+                ),
+                region=CacheRegion.DATA,
+            )
+            return cached["key"]["df"], QueryCacheManager.get(
+                key="key", region=CacheRegion.DATA
+            )
+
+    def test_arrow_codec(self, app):
+        """Dataframes are cached encoded and decoded when read."""
+        from superset.utils.cache_codec import EncodedDataFrame
+
+        df = pd.DataFrame({"a": [1, 2], "b": ["x", None]})
+        cached_df, result = self._set_and_get(app, "arrow", df)
+
+        assert isinstance(cached_df, EncodedDataFrame)
+        assert result.is_loaded is True
+        with patch.object(
+            EncodedDataFrame,
+            "decode",
+            autospec=True,
+            side_effect=EncodedDataFrame.decode,
+        ) as decode:
+            decode.assert_not_called()
+            pd.testing.assert_frame_equal(result.df, df)
+            pd.testing.assert_frame_equal(result.df, df)
+        decode.assert_called_once()
+
+    def test_arrow_codec_fallback(self, app):
+        """Dataframes that can't be encoded losslessly are cached as is."""
+        df = pd.DataFrame({"a": [1, "x"]})
+        cached_df, result = self._set_and_get(app, "arrow", df)
+
+        assert cached_df is df
+        pd.testing.assert_frame_equal(result.df, df)
+
+    def test_pickle_codec(self, app):
+        """Dataframes are cached as is by default."""
+        df = pd.DataFrame({"a": [1, 2]})
+        cached_df, result = self._set_and_get(app, "pickle", df)
+
+        assert cached_df is df
+        pd.testing.assert_frame_equal(result.df, df)
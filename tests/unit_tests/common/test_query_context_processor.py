@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import threading
 from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -26,6 +27,7 @@ import pytest
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.db_query_status import QueryStatus
 from superset.common.query_context_processor import QueryContextProcessor
+from superset.exceptions import QueryObjectValidationError
 from superset.utils.core import GenericDataType
 from superset.utils.date_parser import get_past_or_future
 
@@ -83,6 +85,18 @@ def processor(mock_query_context):
     processor._qc_datasource.add_offset_join_column = (
         ExploreMixin.add_offset_join_column.__get__(processor._qc_datasource)
     )
+    processor._qc_datasource._run_time_offset_query = (
+        ExploreMixin._run_time_offset_query.__get__(processor._qc_datasource)
+    )
+    processor._qc_datasource._cache_time_offset_df = (
+        ExploreMixin._cache_time_offset_df.__get__(processor._qc_datasource)
+    )
+    processor._qc_datasource._can_single_scan_time_offsets = (
+        ExploreMixin._can_single_scan_time_offsets.__get__(processor._qc_datasource)
+    )
+    processor._qc_datasource._run_single_scan_time_offsets = (
+        ExploreMixin._run_single_scan_time_offsets.__get__(processor._qc_datasource)
+    )
 
     return processor
 
@@ -101,6 +115,24 @@ def test_get_data_table_like(processor, mock_query_context):
     assert result == expected
 
 
+def test_get_data_arrow(processor, mock_query_context):
+    from superset.utils.arrow import arrow_ipc_to_df
+
+    df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    coltypes = [GenericDataType.NUMERIC, GenericDataType.STRING]
+    mock_query_context.result_format = ChartDataResultFormat.ARROW
+
+    result = processor.get_data(df, coltypes)
+
+    result_df, metadata = arrow_ipc_to_df(result)
+    pd.testing.assert_frame_equal(result_df, df)
+    assert metadata == {
+        "colnames": ["col1", "col2"],
+        "coltypes": [GenericDataType.NUMERIC, GenericDataType.STRING],
+        "verbose_labels": ["Column 1", "Column 2"],
+    }
+
+
 @patch("superset.common.query_context_processor.csv.df_to_escaped_csv")
 def test_get_data_csv(mock_df_to_escaped_csv, processor, mock_query_context):
     df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
@@ -1318,6 +1350,370 @@ def test_processing_time_offsets_rejects_unparseable_offset(
     datasource.query.assert_not_called()
 
 
+def test_processing_time_offsets_parallel_queries(
+    app, processor: QueryContextProcessor
+) -> None:
+    """Offsets missing from the cache are queried concurrently when
+    CHART_DATA_MAX_PARALLEL_QUERIES is set, while the queries and the joined
+    columns keep the order of the offsets.
+    """
+    from superset.common.query_object import QueryObject
+    from superset.models.helpers import ExploreMixin
+
+    # The fixture's datasource is a MagicMock, not a real Explorable
+    datasource: Any = processor._qc_datasource
+
+    for method in (
+        "processing_time_offsets",
+        "_align_offset_without_time_grain",
+        "_coalesce_offset_index",
+    ):
+        setattr(
+            datasource,
+            method,
+            getattr(ExploreMixin, method).__get__(datasource),
+        )
+
+    df = pd.DataFrame(
+        {
+            "__timestamp": pd.to_datetime(["2024-04-01", "2024-05-01", "2024-06-01"]),
+            "sum__num": [100, 200, 300],
+        }
+    )
+
+    query_object = QueryObject(
+        datasource=MagicMock(),
+        granularity="ds",
+        columns=[],
+        metrics=["sum__num"],
+        is_timeseries=True,
+        time_offsets=["1 year ago", "1 quarter ago"],
+        filters=[
+            {
+                "col": "ds",
+                "op": "TEMPORAL_RANGE",
+                "val": "2024-04-01 : 2024-07-01",
+            }
+        ],
+    )
+
+    # both offset queries have to be in flight at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_query(dct: dict[str, Any]) -> MagicMock:
+        barrier.wait()
+        result = MagicMock()
+        result.df = pd.DataFrame(
+            {
+                "__timestamp": pd.date_range(
+                    start=dct["from_dttm"], periods=3, freq="MS"
+                ),
+                "sum__num": [float(dct["from_dttm"].month)] * 3,
+            }
+        )
+        result.query = f"SELECT {dct['from_dttm'].date()}"
+        return result
+
+    datasource.query = fake_query
+    datasource.normalize_df = MagicMock(
+        side_effect=lambda offset_df, _query_object: offset_df
+    )
+
+    with (
+        patch.dict(app.config, {"CHART_DATA_MAX_PARALLEL_QUERIES": 2}),
+        patch(
+            "superset.models.helpers.get_since_until_from_query_object",
+            return_value=(pd.Timestamp("2024-04-01"), pd.Timestamp("2024-07-01")),
+        ),
+        patch(
+            "superset.common.utils.query_cache_manager.QueryCacheManager"
+        ) as mock_cache_manager,
+        patch.object(
+            datasource,
+            "get_time_grain",
+            return_value=None,
+        ),
+        patch("superset.models.helpers.load_datasource") as mock_load_datasource,
+    ):
+        mock_cache = MagicMock()
+        mock_cache.is_loaded = False
+        mock_cache_manager.get.return_value = mock_cache
+
+        result = datasource.processing_time_offsets(df, query_object, None, None, False)
+
+    # the datasource is loaded before its queries run in other threads
+    mock_load_datasource.assert_called_once_with(datasource)
+    assert result["queries"] == ["SELECT 2023-04-01", "SELECT 2024-01-01"]
+    assert result["df"].columns.tolist() == [
+        "__timestamp",
+        "sum__num",
+        "sum__num__1 year ago",
+        "sum__num__1 quarter ago",
+    ]
+    assert result["df"]["sum__num__1 year ago"].tolist() == [4.0, 4.0, 4.0]
+    assert result["df"]["sum__num__1 quarter ago"].tolist() == [1.0, 1.0, 1.0]
+
+
+def _single_scan_datasource(processor: QueryContextProcessor) -> Any:
+    from superset.models.helpers import ExploreMixin
+
+    # The fixture's datasource is a MagicMock, not a real Explorable
+    datasource: Any = processor._qc_datasource
+    for method in (
+        "processing_time_offsets",
+        "_align_offset_without_time_grain",
+        "_coalesce_offset_index",
+    ):
+        setattr(
+            datasource,
+            method,
+            getattr(ExploreMixin, method).__get__(datasource),
+        )
+    datasource.get_time_grain = ExploreMixin.get_time_grain
+    datasource.generate_join_column = ExploreMixin.generate_join_column
+    datasource.offset = 0
+    datasource.normalize_df = MagicMock(
+        side_effect=lambda offset_df, _query_object: offset_df
+    )
+    return datasource
+
+
+def _daily_query_object(
+    time_offsets: list[str],
+    row_limit: int | None = None,
+    x_axis_expression: str = "ds",
+    filter_column: str = "ds",
+):
+    from superset.common.query_object import QueryObject
+
+    return QueryObject(
+        datasource=MagicMock(),
+        columns=[
+            {
+                "label": "ds",
+                "sqlExpression": x_axis_expression,
+                "columnType": "BASE_AXIS",
+                "timeGrain": "P1D",
+            }
+        ],
+        metrics=["sum__num"],
+        row_limit=row_limit,
+        time_offsets=time_offsets,
+        filters=[
+            {
+                "col": filter_column,
+                "op": "TEMPORAL_RANGE",
+                "val": "2024-04-01 : 2024-04-15",
+            }
+        ],
+    )
+
+
+def _fake_daily_query(captured: list[dict[str, Any]]):
+    def fake_query(dct: dict[str, Any]) -> MagicMock:
+        captured.append(dct)
+        days = pd.date_range(start=dct["from_dttm"], end=dct["to_dttm"], freq="D")[:-1]
+        result = MagicMock()
+        result.status = QueryStatus.SUCCESS
+        result.df = pd.DataFrame({"ds": days, "sum__num": [d.day for d in days]})
+        result.query = f"SELECT {dct['from_dttm'].date()}"
+        return result
+
+    return fake_query
+
+
+def _run_daily_time_offsets(
+    datasource: Any,
+    time_offsets: list[str],
+    row_limit: int | None = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    df = pd.DataFrame(
+        {
+            "ds": pd.date_range(start="2024-04-01", periods=14, freq="D"),
+            "sum__num": list(range(14)),
+        }
+    )
+    with (
+        patch("superset.models.helpers.feature_flag_manager") as mock_ff,
+        patch(
+            "superset.models.helpers.get_since_until_from_query_object",
+            return_value=(pd.Timestamp("2024-04-01"), pd.Timestamp("2024-04-15")),
+        ),
+        patch(
+            "superset.common.utils.query_cache_manager.QueryCacheManager"
+        ) as mock_cache_manager,
+    ):
+        mock_ff.is_feature_enabled.side_effect = (
+            lambda flag: flag == "TIME_COMPARISON_SINGLE_SCAN"
+        )
+        mock_cache = MagicMock()
+        mock_cache.is_loaded = False
+        mock_cache_manager.get.return_value = mock_cache
+
+        return datasource.processing_time_offsets(
+            df,
+            _daily_query_object(time_offsets, row_limit, **kwargs),
+            None,
+            None,
+            False,
+        )
+
+
+def test_processing_time_offsets_single_scan(
+    processor: QueryContextProcessor,
+) -> None:
+    """Overlapping relative offsets aligned on the time grain are fetched with a
+    single query over the span of their windows, and sliced back per offset.
+    """
+    datasource = _single_scan_datasource(processor)
+    captured: list[dict[str, Any]] = []
+    datasource.query = _fake_daily_query(captured)
+
+    result = _run_daily_time_offsets(datasource, ["1 week ago", "2 weeks ago"])
+
+    assert len(captured) == 1
+    assert captured[0]["from_dttm"] == pd.Timestamp("2024-03-18")
+    assert captured[0]["to_dttm"] == pd.Timestamp("2024-04-08")
+    assert (
+        captured[0]["filter"][0]["val"] == "2024-03-18 00:00:00 : 2024-04-08 00:00:00"
+    )
+    assert result["queries"] == ["SELECT 2024-03-18", "SELECT 2024-03-18"]
+
+    week_ago = pd.date_range(start="2024-03-25", periods=14, freq="D")
+    two_weeks_ago = pd.date_range(start="2024-03-18", periods=14, freq="D")
+    assert result["df"]["sum__num__1 week ago"].tolist() == [d.day for d in week_ago]
+    assert result["df"]["sum__num__2 weeks ago"].tolist() == [
+        d.day for d in two_weeks_ago
+    ]
+
+
+def test_processing_time_offsets_single_scan_matches_per_offset_queries(
+    processor: QueryContextProcessor,
+) -> None:
+    """The single scan returns the same frame as the individual offset queries."""
+    datasource = _single_scan_datasource(processor)
+    captured: list[dict[str, Any]] = []
+    datasource.query = _fake_daily_query(captured)
+    single_scan = _run_daily_time_offsets(datasource, ["1 week ago", "2 weeks ago"])
+
+    datasource._can_single_scan_time_offsets = MagicMock(return_value=False)
+    per_offset = _run_daily_time_offsets(datasource, ["1 week ago", "2 weeks ago"])
+
+    assert len(captured) == 3
+    pd.testing.assert_frame_equal(single_scan["df"], per_offset["df"])
+
+
+def test_processing_time_offsets_single_scan_skips_disjoint_windows(
+    processor: QueryContextProcessor,
+) -> None:
+    """Offsets whose windows leave a gap are queried individually."""
+    datasource = _single_scan_datasource(processor)
+    captured: list[dict[str, Any]] = []
+    datasource.query = _fake_daily_query(captured)
+
+    _run_daily_time_offsets(datasource, ["1 week ago", "1 year ago"])
+
+    assert [dct["from_dttm"] for dct in captured] == [
+        pd.Timestamp("2024-03-25"),
+        pd.Timestamp("2023-04-01"),
+    ]
+
+
+def test_processing_time_offsets_single_scan_falls_back_on_row_limit(
+    processor: QueryContextProcessor,
+) -> None:
+    """When the row limit may have truncated the widened query, the offsets are
+    queried individually.
+    """
+    datasource = _single_scan_datasource(processor)
+    captured: list[dict[str, Any]] = []
+    datasource.query = _fake_daily_query(captured)
+
+    _run_daily_time_offsets(datasource, ["1 week ago", "2 weeks ago"], row_limit=10)
+
+    assert len(captured) == 3
+    assert captured[0]["row_limit"] == 20
+    assert [dct["row_limit"] for dct in captured[1:]] == [10, 10]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"x_axis_expression": "DATE_TRUNC('day', event_ts)"},
+        {"filter_column": "event_ts"},
+    ],
+)
+def test_processing_time_offsets_single_scan_requires_filter_column_x_axis(
+    processor: QueryContextProcessor, kwargs: dict[str, str]
+) -> None:
+    """Offsets are queried individually when the x-axis is a Custom SQL
+    expression or isn't the column of the time range filter, as its buckets
+    don't match the rows selected by the offset windows.
+    """
+    datasource = _single_scan_datasource(processor)
+    captured: list[dict[str, Any]] = []
+    datasource.query = _fake_daily_query(captured)
+
+    _run_daily_time_offsets(datasource, ["1 week ago", "2 weeks ago"], **kwargs)
+
+    assert [dct["from_dttm"] for dct in captured] == [
+        pd.Timestamp("2024-03-25"),
+        pd.Timestamp("2024-03-18"),
+    ]
+
+
+def test_run_single_scan_time_offsets_without_time_range_filter(
+    processor: QueryContextProcessor,
+) -> None:
+    """The single scan falls back to the individual queries when it can't find
+    the time range filter to widen.
+    """
+    datasource = _single_scan_datasource(processor)
+    datasource.query = MagicMock()
+    pending = MagicMock()
+    pending.query_object.from_dttm = datetime(2024, 3, 25)
+    pending.query_object.to_dttm = datetime(2024, 4, 8)
+    pending.query_object.columns = _daily_query_object([]).columns
+    pending.query_object.filter = [
+        {"col": "other", "op": "TEMPORAL_RANGE", "val": "Last week"}
+    ]
+
+    assert (
+        datasource._run_single_scan_time_offsets([pending], ["ds"], "P1D", None)
+        is None
+    )
+    datasource.query.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "dttm, time_grain, expected",
+    [
+        (datetime(2024, 4, 1, 12, 30), None, True),
+        (datetime(2024, 4, 1, 12), "PT1H", True),
+        (datetime(2024, 4, 1, 12, 30), "PT1H", False),
+        (datetime(2024, 4, 1), "P1D", True),
+        (datetime(2024, 4, 1, 1), "P1D", False),
+        (datetime(2024, 4, 1), "P1W", True),
+        (datetime(2024, 4, 2), "P1W", False),
+        (datetime(2024, 3, 31), "1969-12-28T00:00:00Z/P1W", True),
+        (datetime(2024, 4, 1), "P1M", True),
+        (datetime(2024, 4, 2), "P1M", False),
+        (datetime(2024, 4, 1), "P3M", True),
+        (datetime(2024, 5, 1), "P3M", False),
+        (datetime(2024, 1, 1), "P1Y", True),
+        (datetime(2024, 4, 1), "P1Y", False),
+        (datetime(2024, 4, 6), "P1W/1970-01-03T00:00:00Z", False),
+    ],
+)
+def test_is_time_grain_boundary(
+    dttm: datetime, time_grain: str | None, expected: bool
+) -> None:
+    from superset.models.helpers import _is_time_grain_boundary
+
+    assert _is_time_grain_boundary(dttm, time_grain) is expected
+
+
 def test_ensure_totals_available_updates_cache_values():
     """
     Test that ensure_totals_available() updates the query objects AND
@@ -1972,6 +2368,7 @@ def test_get_df_payload_invalidates_cache_missing_applied_filter_columns():
             self.stacktrace = None
             self.error_message = None
             self.is_cached = True
+            self.is_stale = False
             self.sql_rowcount = 0
             self.cache_value = None
             self.cache_timeout = 3600
@@ -2359,3 +2756,284 @@ def test_relative_offset_preserves_inner_bounds(
     # for #40501. Without the fix, inner_from/to_dttm == shifted dates.
     assert captured[0]["inner_from_dttm"] == pd.Timestamp("2026-05-01")
     assert captured[0]["inner_to_dttm"] == pd.Timestamp("2026-05-28")
+
+
+def _mock_query_context_with_queries(count: int) -> MagicMock:
+    query_context = MagicMock()
+    query_context.result_type = ChartDataResultType.FULL
+    query_context.queries = []
+    for idx in range(count):
+        query_obj = MagicMock()
+        query_obj.result_type = None
+        query_obj.row_limit = idx
+        query_context.queries.append(query_obj)
+    return query_context
+
+
+@pytest.mark.parametrize("max_parallel_queries", [0, 1])
+def test_get_query_results_serial(app, max_parallel_queries):
+    """
+    Queries are executed one after another unless parallel execution is enabled.
+    """
+    query_context = _mock_query_context_with_queries(3)
+    processor = QueryContextProcessor(query_context)
+
+    with (
+        patch.dict(
+            app.config, {"CHART_DATA_MAX_PARALLEL_QUERIES": max_parallel_queries}
+        ),
+        patch(
+            "superset.common.query_context_processor.get_query_results",
+            side_effect=lambda _rt, _qc, query_obj, _fc: {"idx": query_obj.row_limit},
+        ),
+        patch(
+            "superset.common.query_context_processor.run_in_thread_pool"
+        ) as mock_executor,
+        patch(
+            "superset.common.query_context_processor.stats_logger_manager"
+        ) as mock_stats_logger_manager,
+    ):
+        results = processor._get_query_results(force_cached=False)
+
+    assert results == [{"idx": 0}, {"idx": 1}, {"idx": 2}]
+    mock_executor.assert_not_called()
+    mock_stats_logger_manager.instance.timing.assert_called_once()
+    assert (
+        mock_stats_logger_manager.instance.timing.call_args[0][0]
+        == "chart_data.queries.serial"
+    )
+
+
+def test_get_query_results_parallel(app):
+    """
+    Queries run concurrently keep the request order, and see the app context and
+    the attributes of ``g`` from the calling thread.
+    """
+    from flask import g
+
+    query_context = _mock_query_context_with_queries(4)
+    processor = QueryContextProcessor(query_context)
+    g.parallel_test_marker = "marker"
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_get_query_results(_rt, _qc, query_obj, _fc):
+        # the first two queries have to be in flight at the same time
+        if query_obj.row_limit < 2:
+            barrier.wait()
+        return {"idx": query_obj.row_limit, "marker": g.parallel_test_marker}
+
+    with (
+        patch.dict(app.config, {"CHART_DATA_MAX_PARALLEL_QUERIES": 2}),
+        patch(
+            "superset.common.query_context_processor.get_query_results",
+            side_effect=fake_get_query_results,
+        ),
+        patch(
+            "superset.common.query_context_processor.stats_logger_manager"
+        ) as mock_stats_logger_manager,
+    ):
+        results = processor._get_query_results(force_cached=False)
+
+    assert results == [{"idx": idx, "marker": "marker"} for idx in range(4)]
+    assert (
+        mock_stats_logger_manager.instance.timing.call_args[0][0]
+        == "chart_data.queries.parallel"
+    )
+
+
+def test_get_query_results_parallel_raises_first_error(app):
+    """
+    A failing query re-raises its exception, like in the serial path.
+    """
+    query_context = _mock_query_context_with_queries(3)
+    processor = QueryContextProcessor(query_context)
+
+    def fake_get_query_results(_rt, _qc, query_obj, _fc):
+        if query_obj.row_limit == 1:
+            raise QueryObjectValidationError("boom")
+        return {"idx": query_obj.row_limit}
+
+    with (
+        patch.dict(app.config, {"CHART_DATA_MAX_PARALLEL_QUERIES": 3}),
+        patch(
+            "superset.common.query_context_processor.get_query_results",
+            side_effect=fake_get_query_results,
+        ),
+        pytest.raises(QueryObjectValidationError, match="boom"),
+    ):
+        processor._get_query_results(force_cached=False)
+
+
+@pytest.mark.parametrize("cache_generation", [None, "abc123"])
+def test_query_cache_key_cache_generation(processor, cache_generation):
+    """
+    Test that the cache generation of the datasource is folded into the cache key.
+    """
+    query_obj = MagicMock()
+    processor._qc_datasource.uid = "1__table"
+    processor._qc_datasource.get_extra_cache_keys.return_value = []
+
+    with (
+        patch(
+            "superset.common.query_context_processor.get_cache_generation",
+            return_value=cache_generation,
+        ) as get_cache_generation,
+        patch("superset.common.query_context_processor.security_manager"),
+    ):
+        processor.query_cache_key(query_obj, time_offset="1 year ago")
+
+    get_cache_generation.assert_called_once_with("1__table")
+    kwargs = query_obj.cache_key.call_args.kwargs
+    assert kwargs["time_offset"] == "1 year ago"
+    if cache_generation:
+        assert kwargs["cache_generation"] == cache_generation
+    else:
+        assert "cache_generation" not in kwargs
+
+
+@pytest.mark.parametrize("single_flight_timeout", [None, 30])
+def test_get_df_payload_single_flight(app, single_flight_timeout):
+    """
+    Test that cache misses are coalesced through single-flight when enabled.
+    """
+    from superset.common.query_object import QueryObject
+
+    mock_query_context = MagicMock()
+    mock_query_context.force = False
+    mock_query_context.form_data = {}
+
+    mock_datasource = MagicMock()
+    mock_datasource.column_names = ["col1"]
+    mock_datasource.uid = "test_ds"
+
+    processor = QueryContextProcessor(mock_query_context)
+    processor._qc_datasource = mock_datasource
+    query_obj = QueryObject(datasource=mock_datasource, columns=["col1"])
+
+    missed_cache = MagicMock()
+    missed_cache.is_loaded = False
+    missed_cache.df = pd.DataFrame({"col1": [1]})
+    missed_cache.bq_memory_limited = False
+    loaded_cache = MagicMock()
+    loaded_cache.is_loaded = True
+    loaded_cache.is_cached = True
+    loaded_cache.df = pd.DataFrame({"col1": [2]})
+    loaded_cache.bq_memory_limited = False
+
+    with (
+        patch.dict(
+            app.config, {"CHART_DATA_SINGLE_FLIGHT_TIMEOUT": single_flight_timeout}
+        ),
+        patch(
+            "superset.common.query_context_processor.QueryCacheManager"
+        ) as mock_cache_manager,
+        patch("superset.common.query_context_processor.cache_manager"),
+        patch(
+            "superset.common.query_context_processor.single_flight",
+            return_value=loaded_cache,
+        ) as mock_single_flight,
+        patch.object(query_obj, "validate", return_value=None),
+        patch.object(processor, "query_cache_key", return_value="key"),
+        patch.object(processor, "get_cache_timeout", return_value=3600),
+        patch.object(processor, "get_query_result") as mock_get_query_result,
+        patch.object(processor, "get_annotation_data", return_value={}),
+    ):
+        mock_cache_manager.get.return_value = missed_cache
+        result = processor.get_df_payload(query_obj, force_cached=False)
+
+    if single_flight_timeout:
+        mock_single_flight.assert_called_once()
+        assert mock_single_flight.call_args.kwargs["key"] == "key"
+        assert mock_single_flight.call_args.kwargs["timeout"] == 30
+        mock_get_query_result.assert_not_called()
+        assert result["df"]["col1"].tolist() == [2]
+        assert result["is_cached"] is True
+    else:
+        mock_single_flight.assert_not_called()
+        mock_get_query_result.assert_called_once_with(query_obj)
+        missed_cache.set_query_result.assert_called_once()
+        assert result["df"]["col1"].tolist() == [1]
+
+
+@pytest.mark.parametrize("claimed", [(True, False), (False, False)])
+def test_refresh_stale_cache(app, claimed):
+    """
+    Test that stale results are refreshed once, unless already being refreshed.
+    """
+    processor = QueryContextProcessor(MagicMock())
+    processor._stale_cache_keys = ["key1", "key2"]
+
+    with (
+        patch(
+            "superset.common.query_context_processor.cache_manager"
+        ) as mock_cache_manager,
+        patch(
+            "superset.common.query_context_processor.security_manager"
+        ) as mock_security_manager,
+        patch("superset.common.query_context_processor.get_user_id", return_value=1),
+        patch(
+            "superset.tasks.async_queries.refresh_chart_data_cache"
+        ) as mock_refresh_task,
+        patch.object(processor, "_cache_query_context", return_value="qc-key"),
+    ):
+        mock_cache_manager.data_cache.add.side_effect = claimed
+        mock_security_manager.get_current_guest_user_if_guest = MagicMock(
+            return_value=None
+        )
+        processor._refresh_stale_cache()
+
+    assert [
+        call.args[0] for call in mock_cache_manager.data_cache.add.call_args_list
+    ] == ["stale_refresh_key1", "stale_refresh_key2"]
+    if any(claimed):
+        mock_refresh_task.delay.assert_called_once_with(
+            {"user_id": 1}, "qc-key", ["stale_refresh_key1"]
+        )
+    else:
+        mock_refresh_task.delay.assert_not_called()
+    assert processor._stale_cache_keys == []
+
+
+def test_get_query_results_parallel_loads_datasource(app, session):
+    """
+    The datasource is loaded in the calling thread before the queries run
+    concurrently, so worker threads don't lazy load it from the session of the
+    calling thread.
+    """
+    from sqlalchemy import inspect
+
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.models.core import Database
+
+    SqlaTable.metadata.create_all(session.get_bind())
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    dataset = SqlaTable(
+        table_name="t",
+        database=database,
+        columns=[TableColumn(column_name="a")],
+    )
+    session.add(dataset)
+    session.commit()
+    session.expire_all()
+
+    query_context = _mock_query_context_with_queries(2)
+    query_context.datasource = dataset
+    processor = QueryContextProcessor(query_context)
+    unloaded = []
+
+    def fake_get_query_results(_rt, _qc, query_obj, _fc):
+        unloaded.append(inspect(dataset).unloaded | inspect(database).unloaded)
+        return {"idx": query_obj.row_limit}
+
+    with (
+        patch.dict(app.config, {"CHART_DATA_MAX_PARALLEL_QUERIES": 2}),
+        patch(
+            "superset.common.query_context_processor.get_query_results",
+            side_effect=fake_get_query_results,
+        ),
+    ):
+        processor._get_query_results(force_cached=False)
+
+    for keys in unloaded:
+        assert not keys & {"table_name", "columns", "metrics", "database"}
+        assert "database_name" not in keys
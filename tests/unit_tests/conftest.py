@@ -36,6 +36,7 @@ from superset.common.chart_data import ChartDataResultType
 from superset.common.query_object_factory import QueryObjectFactory
 from superset.extensions import appbuilder, feature_flag_manager
 from superset.initialization import SupersetAppInitializer
+from superset.sql.parse import parsed_script_cache
 
 
 @pytest.fixture
@@ -140,6 +141,15 @@ def app_context(app: SupersetApp) -> Iterator[None]:
         yield
 
 
+@pytest.fixture(autouse=True)
+def clear_parsed_script_cache() -> Iterator[None]:
+    """
+    Clear the cache of parsed SQL, so tests observe the parsing of their scripts.
+    """
+    yield
+    parsed_script_cache.clear()
+
+
 @pytest.fixture
 def full_api_access(mocker: MockerFixture) -> Union[Iterator[None], None]:
     """
@@ -722,3 +722,40 @@ def test_validate_parameters_schema_accepts_server_host_key() -> None:
         loaded["ssh_tunnel"]["server_host_key"]
         == "ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAA"
     )
+
+
+def test_extra_validator_accepts_connection_pool() -> None:
+    """
+    Test that extra_validator accepts a valid connection_pool.
+    """
+    from superset.databases.schemas import DatabasePostSchema
+
+    schema = DatabasePostSchema()
+    connection_pool = {"pool_size": 2, "pool_recycle": -1, "pool_pre_ping": False}
+    payload = {
+        "database_name": "test_db",
+        "extra": json.dumps({"connection_pool": connection_pool}),
+    }
+    result = schema.load(payload)
+    assert json.loads(result["extra"])["connection_pool"] == connection_pool
+
+
+@pytest.mark.parametrize(
+    "connection_pool",
+    [None, 5, {"pool_size": 0}, {"pool_timeout": -1}, {"poolsize": 5}],
+)
+def test_extra_validator_rejects_invalid_connection_pool(
+    connection_pool: Any,
+) -> None:
+    """
+    Test that extra_validator rejects an invalid connection_pool.
+    """
+    from superset.databases.schemas import DatabasePostSchema
+
+    schema = DatabasePostSchema()
+    payload = {
+        "database_name": "test_db",
+        "extra": json.dumps({"connection_pool": connection_pool}),
+    }
+    with pytest.raises(ValidationError):
+        schema.load(payload)
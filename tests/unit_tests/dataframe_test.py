@@ -16,13 +16,15 @@
 # under the License.
 # pylint: disable=unused-argument, import-outside-toplevel
 from datetime import datetime
+from typing import Any
 
 import numpy as np
+import pandas as pd
 import pytest
 from pandas import Timestamp
 from pandas._libs.tslibs import NaT
 
-from superset.dataframe import df_to_records
+from superset.dataframe import _convert_big_integers, _is_na, df_to_records
 from superset.db_engine_specs import BaseEngineSpec
 from superset.result_set import SupersetResultSet
 from superset.superset_typing import DbapiDescription
@@ -363,3 +365,86 @@ def test_df_to_records_with_json_serialization_like_sql_lab() -> None:
     )
     parsed_no_flag = superset_json.loads(json_str_no_flag)
     assert parsed_no_flag == parsed  # Same result
+
+
+def _df_to_records_per_value(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """
+    Reference implementation, processing each value of ``DataFrame.to_dict``.
+    """
+    records = df.to_dict(orient="records")
+    for record in records:
+        for key in record:
+            record[key] = (
+                None if _is_na(record[key]) else _convert_big_integers(record[key])
+            )
+    return records
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame(
+            {
+                "int": [1, 2**60, -(2**60), 3],
+                "uint": np.array([1, 2**63, 3, 4], dtype="uint64"),
+                "float": [1.5, np.nan, np.inf, -np.inf],
+                "bool": [True, False, True, False],
+                "dttm": pd.to_datetime(["2024-01-01", None, "2024-01-03", None]),
+                "dttm_tz": pd.to_datetime(
+                    ["2024-01-01", None, "2024-01-03", "2024-01-04"]
+                ).tz_localize("UTC"),
+                "delta": pd.to_timedelta(["1 day", None, "2 days", "3 days"]),
+            }
+        ),
+        pd.DataFrame(
+            {
+                "str": ["a", None, np.nan, "d"],
+                "nested": [{"a": [1, 2]}, [1, 2], [], [np.nan]],
+                "mixed": [np.int64(2**60), 1.5, "x", pd.NaT],
+                "nullable": pd.array([1, None, 2**60, 4], dtype="Int64"),
+                "category": pd.Categorical(["x", "y", None, "x"]),
+                "string": pd.array(["a", None, "c", "d"], dtype="string"),
+            }
+        ),
+        pd.DataFrame([[1, 2.5, "a"], [3, np.nan, "b"]], columns=["a", "a", "b"]),
+        pd.DataFrame({0: [1, 2], 1: ["a", "b"]}),
+        pd.DataFrame(index=range(3)),
+        pd.DataFrame({"a": []}),
+    ],
+)
+def test_df_to_records_matches_per_value_conversion(df: pd.DataFrame) -> None:
+    """
+    Test that the column-wise conversion matches the per value conversion.
+    """
+    assert df_to_records(df) == _df_to_records_per_value(df)
+
+
+def test_df_to_records_boxes_numpy_scalars() -> None:
+    """NumPy scalars in object columns are converted to native Python objects."""
+    df = pd.DataFrame(
+        {
+            "values": pd.Series(
+                [
+                    np.int32(1),
+                    np.float32(1.5),
+                    np.bool_(True),
+                    np.datetime64("2020-01-01"),
+                    np.timedelta64(1, "D"),
+                    "a",
+                ],
+                dtype=object,
+            )
+        }
+    )
+
+    values = [record["values"] for record in df_to_records(df)]
+
+    assert values == [
+        1,
+        1.5,
+        True,
+        Timestamp("2020-01-01"),
+        pd.Timedelta(days=1),
+        "a",
+    ]
+    assert [type(value) for value in values[:3]] == [int, float, bool]
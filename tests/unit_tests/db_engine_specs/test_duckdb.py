@@ -163,3 +163,51 @@ def test_column_type_recognition() -> None:
     col_spec = DuckDBEngineSpec.get_column_spec("TINYINT")
     # TINYINT matches the pattern "^int" so it should be recognized
     assert col_spec is None, "TINYINT doesn't match any patterns"
+
+
+@pytest.mark.parametrize(
+    "limit_method,limit,expected_rows",
+    [
+        ("FORCE_LIMIT", 2, 5),
+        ("FETCH_MANY", 2, 2),
+        ("FETCH_MANY", None, 5),
+    ],
+)
+def test_fetch_arrow(
+    mocker: MockerFixture,
+    limit_method: str,
+    limit: Optional[int],
+    expected_rows: int,
+) -> None:
+    """
+    Test that results are fetched as Arrow, keeping the cursor description.
+    """
+    from sqlalchemy import create_engine
+
+    from superset.db_engine_specs.base import LimitMethod
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    mocker.patch.object(
+        DuckDBEngineSpec, "limit_method", getattr(LimitMethod, limit_method)
+    )
+    connection = create_engine("duckdb:///:memory:").raw_connection()
+    cursor = connection.cursor()
+    cursor.execute("SELECT range AS id, 'a' AS name FROM range(5)")
+    description = cursor.description
+
+    table = DuckDBEngineSpec.fetch_arrow(cursor, limit)
+
+    assert table.num_rows == expected_rows
+    assert table.column_names == ["id", "name"]
+    assert cursor.description == description
+
+
+def test_fetch_arrow_unsupported_cursor(mocker: MockerFixture) -> None:
+    """
+    Test that cursors without Arrow support fall back to fetching rows.
+    """
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    cursor = mocker.MagicMock(spec=["description", "fetchall"])
+
+    assert DuckDBEngineSpec.fetch_arrow(cursor) is None
@@ -0,0 +1,241 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from superset.distributed_lock import single_flight as single_flight_module
+from superset.distributed_lock.single_flight import single_flight
+from superset.exceptions import (
+    AcquireDistributedLockFailedException,
+    LockAlreadyHeldException,
+)
+
+
+class FakeLocks:
+    """
+    In-memory replacement for ``DistributedLock``.
+    """
+
+    def __init__(self) -> None:
+        self.held: set[str] = set()
+        self.mutex = threading.Lock()
+
+    @contextmanager
+    def __call__(
+        self,
+        namespace: str,
+        ttl_seconds: int | None = None,
+        **kwargs: Any,
+    ) -> Iterator[None]:
+        key = f"{namespace}:{kwargs}"
+        with self.mutex:
+            if key in self.held:
+                raise LockAlreadyHeldException("Lock already taken")
+            self.held.add(key)
+        try:
+            yield
+        finally:
+            with self.mutex:
+                self.held.discard(key)
+
+
+@pytest.fixture
+def locks() -> Iterator[FakeLocks]:
+    fake_locks = FakeLocks()
+    with (
+        patch.object(single_flight_module, "DistributedLock", fake_locks),
+        patch.object(single_flight_module, "_get_redis_client", return_value=None),
+    ):
+        yield fake_locks
+
+
+def test_single_flight_runs_once(locks: FakeLocks) -> None:
+    """
+    Test that concurrent callers for the same key run the work only once.
+    """
+    results: dict[str, str] = {}
+    runs: list[int] = []
+
+    def run() -> str:
+        runs.append(1)
+        time.sleep(0.2)
+        results["key"] = "result"
+        return "result"
+
+    def call() -> str:
+        return single_flight("key", lambda: results.get("key"), run, timeout=5)
+
+    outputs: list[str] = []
+    threads = [
+        threading.Thread(target=lambda: outputs.append(call())) for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert outputs == ["result"] * 5
+    assert len(runs) == 1
+    assert not locks.held
+
+
+def test_single_flight_cached_result(locks: FakeLocks) -> None:
+    """
+    Test that a result stored before the lock is acquired is not computed again.
+    """
+    run = MagicMock()
+
+    assert single_flight("key", lambda: "cached", run, timeout=5) == "cached"
+    run.assert_not_called()
+
+
+def test_single_flight_takes_over(locks: FakeLocks) -> None:
+    """
+    Test that a waiter runs the work under the lock when the first caller is gone.
+    """
+    locks.held.add("single_flight:{'key': 'key'}")
+    threading.Timer(0.1, locks.held.clear).start()
+    held: list[bool] = []
+
+    def run() -> str:
+        held.append("single_flight:{'key': 'key'}" in locks.held)
+        return "result"
+
+    result = single_flight("key", lambda: None, run, timeout=0.2, poll_interval=0.05)
+
+    assert result == "result"
+    assert held == [True]
+    assert not locks.held
+
+
+def test_single_flight_timeout(locks: FakeLocks) -> None:
+    """
+    Test that a waiter runs the work itself after the timeout.
+    """
+    locks.held.add("single_flight:{'key': 'key'}")
+    load = MagicMock(return_value=None)
+
+    result = single_flight(
+        "key", load, lambda: "result", timeout=0.2, poll_interval=0.05
+    )
+
+    assert result == "result"
+    assert load.call_count > 1
+
+
+def test_single_flight_acquires_lock_twice(locks: FakeLocks) -> None:
+    """
+    Test that waiters only try the lock before and after waiting.
+    """
+    locks.held.add("single_flight:{'key': 'key'}")
+    lock = MagicMock(side_effect=locks)
+
+    with patch.object(single_flight_module, "DistributedLock", lock):
+        single_flight(
+            "key", lambda: None, lambda: "result", timeout=0.3, poll_interval=0.01
+        )
+
+    assert lock.call_count == 2
+    # the lock outlives the wait of the other callers
+    assert lock.call_args.kwargs["ttl_seconds"] == 2
+
+
+def test_single_flight_leader_failed(locks: FakeLocks) -> None:
+    """
+    Test that a waiter takes over as soon as it is notified that the first caller
+    released the lock without storing a result.
+    """
+    redis_client = MagicMock()
+    pubsub = redis_client.pubsub.return_value
+
+    def get_message(**kwargs: Any) -> dict[str, Any]:
+        # the first caller failed and released the lock
+        locks.held.clear()
+        return {"type": "message", "data": "done"}
+
+    pubsub.get_message.side_effect = get_message
+    locks.held.add("single_flight:{'key': 'key'}")
+    run = MagicMock(return_value="result")
+
+    started_at = time.monotonic()
+    with patch.object(
+        single_flight_module, "_get_redis_client", return_value=redis_client
+    ):
+        result = single_flight("key", lambda: None, run, timeout=5)
+
+    assert result == "result"
+    run.assert_called_once()
+    pubsub.get_message.assert_called_once()
+    assert time.monotonic() - started_at < 5
+
+
+def test_single_flight_lock_backend_failure() -> None:
+    """
+    Test that the work runs when the lock backend is unavailable.
+    """
+    lock = MagicMock(side_effect=AcquireDistributedLockFailedException("Down"))
+    with (
+        patch.object(single_flight_module, "DistributedLock", lock),
+        patch.object(single_flight_module, "_get_redis_client", return_value=None),
+    ):
+        assert single_flight("key", lambda: None, lambda: "result", timeout=5) == (
+            "result"
+        )
+
+
+def test_single_flight_pubsub(locks: FakeLocks) -> None:
+    """
+    Test that waiters are notified through Redis pub/sub when configured.
+    """
+    redis_client = MagicMock()
+    pubsub = redis_client.pubsub.return_value
+    results: dict[str, str] = {}
+
+    def get_message(**kwargs: Any) -> dict[str, Any]:
+        results["key"] = "result"
+        return {"type": "message", "data": "done"}
+
+    pubsub.get_message.side_effect = get_message
+    locks.held.add("single_flight:{'key': 'key'}")
+
+    with patch.object(
+        single_flight_module, "_get_redis_client", return_value=redis_client
+    ):
+        result = single_flight(
+            "key", lambda: results.get("key"), MagicMock(), timeout=5
+        )
+
+    assert result == "result"
+    pubsub.subscribe.assert_called_once_with("single_flight:key")
+    pubsub.unsubscribe.assert_called_once()
+    pubsub.close.assert_called_once()
+
+    # the caller running the work notifies the waiters
+    locks.held.clear()
+    with patch.object(
+        single_flight_module, "_get_redis_client", return_value=redis_client
+    ):
+        single_flight("other", lambda: None, lambda: "result", timeout=5)
+
+    redis_client.publish.assert_called_once_with("single_flight:other", "done")
@@ -1959,9 +1959,9 @@ def test_jinja2_undefined_error_handling(mocker: MockerFixture) -> None:
     processor = BaseTemplateProcessor(database=database)
     template = "SELECT * FROM table"
 
-    # Mock the Environment.from_string to raise UndefinedError
+    # Mock the template loading to raise UndefinedError
     with patch.object(
-        processor.env, "from_string", side_effect=UndefinedError("Variable not defined")
+        processor, "get_template", side_effect=UndefinedError("Variable not defined")
     ):
         with pytest.raises(SupersetSyntaxErrorException) as exc_info:
             processor.process_template(template)
@@ -1992,9 +1992,9 @@ def test_jinja2_security_error_handling(mocker: MockerFixture) -> None:
     processor = BaseTemplateProcessor(database=database)
     template = "SELECT * FROM table"
 
-    # Mock the Environment.from_string to raise SecurityError
+    # Mock the template loading to raise SecurityError
     with patch.object(
-        processor.env, "from_string", side_effect=SecurityError("Access denied")
+        processor, "get_template", side_effect=SecurityError("Access denied")
     ):
         with pytest.raises(SupersetSyntaxErrorException) as exc_info:
             processor.process_template(template)
@@ -2023,9 +2023,9 @@ def test_jinja2_server_error_handling(mocker: MockerFixture) -> None:
     processor = BaseTemplateProcessor(database=database)
     template = "SELECT * FROM table"
 
-    # Mock the Environment.from_string to raise MemoryError (server error)
+    # Mock the template loading to raise MemoryError (server error)
     with patch.object(
-        processor.env, "from_string", side_effect=MemoryError("Out of memory")
+        processor, "get_template", side_effect=MemoryError("Out of memory")
     ):
         with pytest.raises(SupersetTemplateException) as exc_info:
             processor.process_template(template)
@@ -2111,3 +2111,77 @@ def test_undefined_template_variable_not_function(mocker: MockerFixture) -> None
 )
 def test_extra_cache_regex(sql: str, expected: bool) -> None:
     assert bool(ExtraCache.regex.search(sql)) is expected
+
+
+def test_compiled_template_cache(mocker: MockerFixture) -> None:
+    """
+    Test that templates are compiled once and rendered with the context of every
+    processor.
+    """
+    from superset.jinja_context import compiled_template_cache
+
+    compiled_template_cache.clear()
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(current_app.config, {"STATS_LOGGER": stats_logger})
+    compile_ = mocker.spy(SandboxedEnvironment, "compile")
+    database = Database(id=1, database_name="my_database", sqlalchemy_uri="sqlite://")
+
+    sql = "SELECT * FROM t WHERE x = {{ x }}"
+    assert (
+        get_template_processor(database=database).process_template(sql, x=1)
+        == "SELECT * FROM t WHERE x = 1"
+    )
+    assert (
+        get_template_processor(database=database).process_template(sql, x=2)
+        == "SELECT * FROM t WHERE x = 2"
+    )
+
+    assert compile_.call_count == 1
+    stats_logger.incr.assert_has_calls(
+        [
+            mocker.call("jinja_template_cache.miss"),
+            mocker.call("jinja_template_cache.hit"),
+        ]
+    )
+
+
+def test_compiled_template_cache_dialect() -> None:
+    """
+    Test that compiled templates aren't shared between dialects, since filters with
+    constant arguments are evaluated when compiling templates.
+    """
+    from superset.jinja_context import compiled_template_cache
+
+    compiled_template_cache.clear()
+    sql = "SELECT * FROM t WHERE x IN {{ [True] | where_in }}"
+    sqlite_database = Database(database_name="sqlite", sqlalchemy_uri="sqlite://")
+    postgres_database = Database(
+        database_name="postgres",
+        sqlalchemy_uri="postgresql://",
+    )
+
+    assert (
+        get_template_processor(database=sqlite_database).process_template(sql)
+        == "SELECT * FROM t WHERE x IN (1)"
+    )
+    assert (
+        get_template_processor(database=postgres_database).process_template(sql)
+        == "SELECT * FROM t WHERE x IN (true)"
+    )
+
+
+def test_compiled_template_cache_disabled(mocker: MockerFixture) -> None:
+    """
+    Test that templates are compiled every time when the cache is disabled.
+    """
+    from superset.jinja_context import compiled_template_cache
+
+    compiled_template_cache.clear()
+    mocker.patch.dict(current_app.config, {"JINJA_TEMPLATE_CACHE_SIZE": 0})
+    compile_ = mocker.spy(SandboxedEnvironment, "compile")
+    database = Database(id=1, database_name="my_database", sqlalchemy_uri="sqlite://")
+
+    for _ in range(2):
+        get_template_processor(database=database).process_template("SELECT 1")
+
+    assert compile_.call_count == 2
@@ -663,17 +663,161 @@ def test_engine_cache_evicted_on_update_and_delete(mocker: MockerFixture) -> Non
     # Seed the cache with two entries for database id=1 and one for id=2.
     with _ENGINE_CACHE_LOCK:
         _ENGINE_CACHE.clear()
-        _ENGINE_CACHE[(1, "postgresql://old-host/db", "")] = MagicMock()
-        _ENGINE_CACHE[(1, "postgresql://new-host/db", "")] = MagicMock()
-        _ENGINE_CACHE[(2, "postgresql://other/db", "")] = MagicMock()
+        _ENGINE_CACHE[(1, "postgresql://old-host/db", "", None)] = MagicMock()
+        _ENGINE_CACHE[(1, "postgresql://new-host/db", "", None)] = MagicMock()
+        _ENGINE_CACHE[(2, "postgresql://other/db", "", None)] = MagicMock()
+    evicted = [engine for key, engine in _ENGINE_CACHE.items() if key[0] == 1]
 
     db_instance = MagicMock()
     db_instance.id = 1
     _evict_engine_cache(mapper=None, connection=None, target=db_instance)
 
-    # Both id=1 entries gone; id=2 entry untouched.
+    # Both id=1 entries gone and their pools disposed; id=2 entry untouched.
     assert not any(k[0] == 1 for k in _ENGINE_CACHE)
     assert any(k[0] == 2 for k in _ENGINE_CACHE)
+    for engine in evicted:
+        engine.dispose.assert_called_once_with()
+
+
+def test_get_sqla_engine_connection_pool(mocker: MockerFixture) -> None:
+    """
+    Databases with a ``connection_pool`` get a pooled engine instead of a
+    ``NullPool`` one.
+    """
+    from sqlalchemy.pool import NullPool
+
+    from superset.models.core import _ENGINE_CACHE, Database
+    from superset.utils.engine_pool import InstrumentedQueuePool
+
+    _ENGINE_CACHE.clear()
+    mocker.patch(
+        "superset.models.core.security_manager.find_user",
+        return_value=None,
+    )
+    create_engine = mocker.patch("superset.models.core.create_engine")
+
+    database = Database(
+        database_name="my_db",
+        sqlalchemy_uri="trino://",
+        extra=json.dumps({"connection_pool": {"pool_size": 2}}),
+    )
+    database.id = 1
+    database._get_sqla_engine()
+    kwargs = create_engine.call_args[1]
+    assert kwargs["poolclass"] == InstrumentedQueuePool
+    assert kwargs["pool_size"] == 2
+    assert kwargs["max_overflow"] == 10
+    assert kwargs["pool_pre_ping"] is True
+    assert kwargs["pool_logging_name"] == "database.1.pool"
+
+    # private engines would drop their pool right away, so they aren't pooled
+    database._get_sqla_engine(cacheable=False)
+    assert create_engine.call_args[1]["poolclass"] == NullPool
+
+
+def test_get_sqla_engine_connection_pool_per_user(mocker: MockerFixture) -> None:
+    """
+    Pooled engines are not shared between impersonated users, even when the
+    engine spec doesn't change the URL to impersonate them.
+    """
+    from superset.models.core import _ENGINE_CACHE, Database
+
+    _ENGINE_CACHE.clear()
+    mocker.patch(
+        "superset.models.core.security_manager.find_user",
+        return_value=None,
+    )
+    create_engine = mocker.patch("superset.models.core.create_engine")
+    get_username = mocker.patch("superset.models.core.get_username")
+
+    database = Database(
+        database_name="my_db",
+        sqlalchemy_uri="trino://",
+        impersonate_user=True,
+        extra=json.dumps({"connection_pool": {}}),
+    )
+    database.id = 1
+    mocker.patch.object(
+        database.db_engine_spec,
+        "impersonate_user",
+        side_effect=lambda database, username, token, url, kwargs: (url, kwargs),
+    )
+    for username in ("alice", "bob", "alice"):
+        get_username.return_value = username
+        database._get_sqla_engine()
+
+    assert create_engine.call_count == 2
+    assert sorted(key[3] for key in _ENGINE_CACHE) == ["alice", "bob"]
+
+
+def test_get_sqla_engine_user_engines_lru(mocker: MockerFixture) -> None:
+    """
+    Only the most recently used engines of impersonated users are cached, the
+    pools of the evicted ones being disposed.
+    """
+    from flask import current_app
+
+    from superset.models.core import _ENGINE_CACHE, Database
+
+    _ENGINE_CACHE.clear()
+    mocker.patch.dict(current_app.config, {"DATABASE_USER_ENGINE_CACHE_SIZE": 2})
+    mocker.patch(
+        "superset.models.core.security_manager.find_user",
+        return_value=None,
+    )
+    create_engine = mocker.patch(
+        "superset.models.core.create_engine",
+        side_effect=lambda *args, **kwargs: mocker.MagicMock(),
+    )
+    get_username = mocker.patch("superset.models.core.get_username")
+
+    database = Database(
+        database_name="my_db",
+        sqlalchemy_uri="trino://",
+        impersonate_user=True,
+        extra=json.dumps({"connection_pool": {}}),
+    )
+    database.id = 1
+    mocker.patch.object(
+        database.db_engine_spec,
+        "impersonate_user",
+        side_effect=lambda database, username, token, url, kwargs: (url, kwargs),
+    )
+    engines = {}
+    for username in ("alice", "bob", "alice", "carol"):
+        get_username.return_value = username
+        engines[username] = database._get_sqla_engine()
+
+    assert create_engine.call_count == 3
+    assert [key[3] for key in _ENGINE_CACHE] == ["alice", "carol"]
+    engines["bob"].dispose.assert_called_once_with()
+    engines["alice"].dispose.assert_not_called()
+    _ENGINE_CACHE.clear()
+
+
+def test_reset_engine_pools() -> None:
+    """
+    After a fork the cached engines drop the connections inherited from the
+    parent process without closing them, even if another thread of the parent
+    held the cache lock.
+    """
+    from unittest.mock import MagicMock
+
+    from superset.models import core
+
+    engine = MagicMock()
+    core._ENGINE_CACHE.clear()
+    core._ENGINE_CACHE[(1, "postgresql://host/db", "", None)] = engine
+    lock = core._ENGINE_CACHE_LOCK
+    lock.acquire()
+    try:
+        core.reset_engine_pools()
+    finally:
+        lock.release()
+
+    engine.dispose.assert_called_once_with(close=False)
+    assert not core._ENGINE_CACHE_LOCK.locked()
+    core._ENGINE_CACHE.clear()
 
 
 def test_get_sqla_engine_user_impersonation(mocker: MockerFixture) -> None:
@@ -621,3 +621,100 @@ def test_empty_result_set_preserves_column_metadata() -> None:
     df = result_set.to_pandas_df()
     assert len(df) == 0
     assert list(map(str, df.columns)) == ["id", "name", "created_at"]
+
+
+def test_arrow_table_matches_rows() -> None:
+    """
+    Test that a result set built from an Arrow table matches the one built from
+    the equivalent rows.
+    """
+    import pyarrow as pa
+
+    data: DbapiResult = [
+        (1, "a", 1.5, datetime(2024, 1, 1), True),
+        (2, None, None, None, None),
+    ]
+    description = [
+        ("id", "int", None, None, None, None, True),
+        ("name", "varchar", None, None, None, None, True),
+        ("value", "float", None, None, None, None, True),
+        ("ts", "timestamp", None, None, None, None, True),
+        ("flag", "boolean", None, None, None, None, True),
+    ]
+    table = pa.table(
+        {
+            "id": [1, 2],
+            "name": ["a", None],
+            "value": [1.5, None],
+            "ts": pa.array([datetime(2024, 1, 1), None], type=pa.timestamp("us")),
+            "flag": [True, None],
+        }
+    )
+
+    from_rows = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+    from_arrow = SupersetResultSet(table, description, BaseEngineSpec)  # type: ignore
+
+    assert from_arrow.columns == from_rows.columns
+    pd.testing.assert_frame_equal(
+        from_arrow.to_pandas_df(), from_rows.to_pandas_df(), check_dtype=False
+    )
+
+
+def test_arrow_table_nested_and_dictionary_columns() -> None:
+    """
+    Test that nested Arrow columns are stringified while keeping their values as
+    Python objects, and that dictionary encoded columns are decoded.
+    """
+    import pyarrow as pa
+
+    table = pa.table(
+        {
+            "tags": [[1, 2], None],
+            "attrs": [{"k": "v"}, {"k": "w"}],
+            "category": pa.array(["x", "y"]).dictionary_encode(),
+        }
+    )
+
+    result_set = SupersetResultSet(table, None, BaseEngineSpec)  # type: ignore
+
+    assert result_set.table.column_names == ["tags", "attrs", "category"]
+    assert pa.types.is_string(result_set.table.schema.field("tags").type)
+    assert pa.types.is_string(result_set.table.schema.field("category").type)
+    df = result_set.to_pandas_df()
+    assert df["tags"].tolist() == [[1, 2], None]
+    assert df["attrs"].tolist() == [{"k": "v"}, {"k": "w"}]
+    assert df["category"].tolist() == ["x", "y"]
+
+
+def test_arrow_table_dedup_column_names() -> None:
+    """
+    Test that duplicate and empty column names of an Arrow table are renamed.
+    """
+    import pyarrow as pa
+
+    table = pa.Table.from_arrays(
+        [pa.array([1]), pa.array([2]), pa.array([3])], names=["a", "a", ""]
+    )
+
+    result_set = SupersetResultSet(table, None, BaseEngineSpec)  # type: ignore
+
+    assert result_set.table.column_names == ["a", "a__1", "_col_0"]
+
+
+def test_mixed_type_column_is_stringified() -> None:
+    """
+    Test that only the column Arrow can't convert is stringified.
+    """
+    data = [[1, 1, None], [2, "a", None], [3, None, [1, 2]]]
+    description = [
+        ("id", "int", None, None, None, None, True),
+        ("mixed", "varchar", None, None, None, None, True),
+        ("nested", "json", None, None, None, None, True),
+    ]
+
+    result_set = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.table.column("id").type == "int64"
+    assert result_set.table.column("mixed").to_pylist() == ["1", "a", None]
+    assert result_set.table.column("nested").to_pylist() == [None, None, "[1, 2]"]
+    assert result_set.to_pandas_df()["nested"].tolist() == [None, None, [1, 2]]
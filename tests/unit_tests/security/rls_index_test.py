@@ -0,0 +1,197 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from flask import current_app, g
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+from superset.extensions import cache_manager, security_manager
+from superset.security.rls_index import (
+    IndexedRLSFilter,
+    register_rls_index_events,
+    rls_index_cache,
+    RLS_INDEX_VERSION_KEY,
+    RLSIndex,
+)
+
+
+@pytest.fixture
+def rls_index(mocker: MockerFixture) -> Iterator[None]:
+    """
+    Enable the RLS index for a test.
+    """
+    mocker.patch.dict(current_app.config, {"RLS_FILTER_INDEX_TTL": 300})
+    rls_index_cache.clear()
+    yield
+    rls_index_cache.clear()
+
+
+def test_rls_index_get_filters() -> None:
+    """
+    Test that regular filters apply to their subjects and base filters to everyone
+    but their subjects.
+    """
+    index = RLSIndex(
+        [
+            (IndexedRLSFilter("regular", "Regular", frozenset({1, 2})), [10, 11]),
+            (IndexedRLSFilter("base", "Base", frozenset({2})), [10]),
+        ]
+    )
+
+    assert index.get_filters(10, [1]) == ["regular", "base"]
+    assert index.get_filters(10, [2, 3]) == ["regular"]
+    assert index.get_filters(10, [3]) == ["base"]
+    assert index.get_filters(11, [3]) == []
+    assert index.get_filters(12, [1]) == []
+
+
+def test_rls_index_cache_versions(mocker: MockerFixture, rls_index: None) -> None:
+    """
+    Test that the index is loaded once, and reloaded when its version is bumped in
+    this process or in the shared cache, or when it expires.
+    """
+    cache = mocker.patch.object(cache_manager, "_cache")
+    cache.get.return_value = None
+    load = mocker.MagicMock(side_effect=lambda: RLSIndex([]))
+
+    index = rls_index_cache.get(load)
+    assert rls_index_cache.get(load) is index
+    assert load.call_count == 1
+
+    rls_index_cache.invalidate()
+    cache.set.assert_called_once_with(RLS_INDEX_VERSION_KEY, mocker.ANY, timeout=0)
+    rls_index_cache.get(load)
+    assert load.call_count == 2
+
+    # another process bumped the shared version, read on the next request
+    cache.get.return_value = "other"
+    rls_index_cache.get(load)
+    assert load.call_count == 2
+    del g._rls_index_shared_version
+    rls_index_cache.get(load)
+    assert load.call_count == 3
+
+    mocker.patch.dict(current_app.config, {"RLS_FILTER_INDEX_TTL": 0})
+    rls_index_cache.get(load)
+    assert load.call_count == 4
+
+    mocker.patch.dict(current_app.config, {"RLS_FILTER_INDEX_TTL": None})
+    assert rls_index_cache.get(load) is None
+
+
+def create_filters(session: Session) -> dict[str, Any]:
+    # pylint: disable=import-outside-toplevel
+    from superset.connectors.sqla.models import RowLevelSecurityFilter, SqlaTable
+    from superset.models.core import Database
+    from superset.subjects.models import Subject
+    from superset.subjects.types import SubjectType
+
+    SqlaTable.metadata.create_all(session.get_bind())
+
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    dataset = SqlaTable(table_name="t1", schema="main", database=database)
+    other_dataset = SqlaTable(table_name="t2", schema="main", database=database)
+    finance = Subject(label="finance", type=SubjectType.ROLE)
+    sales = Subject(label="sales", type=SubjectType.ROLE)
+    session.add_all([database, dataset, other_dataset, finance, sales])
+    session.flush()
+    session.add_all(
+        [
+            RowLevelSecurityFilter(
+                name="finance",
+                filter_type="Regular",
+                group_key="dept",
+                clause="dept = 'Finance'",
+                tables=[dataset, other_dataset],
+                subjects=[finance],
+            ),
+            RowLevelSecurityFilter(
+                name="not sales",
+                filter_type="Base",
+                clause="public",
+                tables=[dataset],
+                subjects=[sales],
+            ),
+        ]
+    )
+    session.commit()
+    return {
+        "dataset": dataset,
+        "other_dataset": other_dataset,
+        "finance": finance,
+        "sales": sales,
+    }
+
+
+def get_clauses(dataset: Any) -> list[str]:
+    return sorted(f.clause for f in security_manager.get_rls_filters(dataset))
+
+
+def test_get_rls_filters_from_index(
+    mocker: MockerFixture,
+    session: Session,
+    rls_index: None,
+) -> None:
+    """
+    Test that filters resolved with the index match the filters queried from the
+    database, and that the index is reloaded when filters are committed.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.connectors.sqla.models import RowLevelSecurityFilter
+
+    register_rls_index_events()
+    objects = create_filters(session)
+    dataset = objects["dataset"]
+    mocker.patch.object(g, "user", mocker.MagicMock(id=None), create=True)
+    mocker.patch("superset.security.manager.get_username", return_value=None)
+    subject_ids = mocker.patch(
+        "superset.subjects.utils.get_current_user_subject_ids",
+    )
+
+    for subjects, expected in [
+        ([objects["finance"]], ["dept = 'Finance'", "public"]),
+        ([objects["sales"]], []),
+        ([objects["finance"], objects["sales"]], ["dept = 'Finance'"]),
+        ([], ["public"]),
+    ]:
+        subject_ids.return_value = [subject.id for subject in subjects]
+        g.pop("_rls_subject_ids", None)
+        assert get_clauses(dataset) == expected
+        mocker.patch.dict(current_app.config, {"RLS_FILTER_INDEX_TTL": None})
+        assert get_clauses(dataset) == expected
+        mocker.patch.dict(current_app.config, {"RLS_FILTER_INDEX_TTL": 300})
+
+    load = mocker.spy(security_manager, "_load_rls_index")
+    get_clauses(dataset)
+    get_clauses(objects["other_dataset"])
+    assert load.call_count == 0
+
+    session.add(
+        RowLevelSecurityFilter(
+            name="new",
+            filter_type="Base",
+            clause="new",
+            tables=[dataset],
+        )
+    )
+    session.commit()
+    assert get_clauses(dataset) == ["new", "public"]
+    assert load.call_count == 1
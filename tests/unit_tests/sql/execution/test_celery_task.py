@@ -704,7 +704,8 @@ def test_store_results_in_backend_success(
     )
     mocker.patch("superset.results_backend_use_msgpack", False)
     mocker.patch(
-        "superset.sql.execution.celery_task.zlib_compress", return_value=b"compressed"
+        "superset.sql.execution.celery_task.compress_results",
+        return_value=b"compressed",
     )
     mocker.patch("superset.sql.execution.celery_task.db.session")
 
@@ -731,7 +732,8 @@ def test_store_results_in_backend_with_size_check(
     )
     mocker.patch("superset.results_backend_use_msgpack", False)
     mocker.patch(
-        "superset.sql.execution.celery_task.zlib_compress", return_value=b"compressed"
+        "superset.sql.execution.celery_task.compress_results",
+        return_value=b"compressed",
     )
     mocker.patch("superset.sql.execution.celery_task.db.session")
 
@@ -781,7 +783,8 @@ def test_store_results_in_backend_default_cache_timeout(
     )
     mocker.patch("superset.results_backend_use_msgpack", False)
     mocker.patch(
-        "superset.sql.execution.celery_task.zlib_compress", return_value=b"compressed"
+        "superset.sql.execution.celery_task.compress_results",
+        return_value=b"compressed",
     )
     mocker.patch("superset.sql.execution.celery_task.db.session")
 
@@ -810,7 +813,8 @@ def test_store_results_in_backend_write_failure(
     )
     mocker.patch("superset.results_backend_use_msgpack", False)
     mocker.patch(
-        "superset.sql.execution.celery_task.zlib_compress", return_value=b"compressed"
+        "superset.sql.execution.celery_task.compress_results",
+        return_value=b"compressed",
     )
     mocker.patch("superset.sql.execution.celery_task.db.session")
 
@@ -1165,7 +1169,7 @@ def test_execute_sql_task_with_results_backend(
     )
     mocker.patch("superset.results_backend_use_msgpack", False)
     mocker.patch(
-        "superset.sql.execution.celery_task.zlib_compress", return_value=b"data"
+        "superset.sql.execution.celery_task.compress_results", return_value=b"data"
     )
     mocker.patch("superset.sql.execution.celery_task.db.session")
     mocker.patch("superset.dataframe.df_to_records", return_value=[])
@@ -1665,7 +1665,7 @@ def test_async_handle_get_result_with_results_backend(
         "superset.results_backend_manager",
         mock_results_backend_manager,
     )
-    mocker.patch("superset.utils.core.zlib_decompress", return_value=payload)
+    mocker.patch("superset.utils.compression.decompress", return_value=payload)
     mocker.patch.dict(
         current_app.config, {"SQL_QUERY_MUTATOR": None, "SQLLAB_TIMEOUT": 30}
     )
@@ -1711,7 +1711,7 @@ def test_async_handle_get_result_backend_load_error(
         mock_results_backend_manager,
     )
     mocker.patch(
-        "superset.utils.core.zlib_decompress",
+        "superset.utils.compression.decompress",
         side_effect=Exception("Decompression failed"),
     )
     mocker.patch.dict(
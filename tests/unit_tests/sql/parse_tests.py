@@ -21,6 +21,7 @@ import logging
 
 import pytest
 import sqlglot
+from flask import current_app
 from pytest_mock import MockerFixture
 from sqlglot import Dialects, exp, parse_one
 
@@ -36,6 +37,7 @@ from superset.sql.parse import (
     KQLTokenType,
     KustoKQLStatement,
     LimitMethod,
+    parsed_script_cache,
     Partition,
     process_jinja_sql,
     remove_quotes,
@@ -4723,3 +4725,53 @@ def test_has_aggregate(expression: str, expected: bool) -> None:
     function sqlglot can't model.
     """
     assert has_aggregate(expression) is expected
+
+
+def test_parsed_script_cache(mocker: MockerFixture) -> None:
+    """
+    Test that scripts are parsed once per engine, and that each parse returns new
+    copies of the statements so they can be transformed.
+    """
+    parse = mocker.spy(sqlglot, "parse")
+    sql = "SELECT a FROM t WHERE b = 1; SELECT c FROM u"
+
+    first = SQLScript(sql, "postgresql")
+    first.statements[0].apply_rls(
+        None,
+        None,
+        {Table("t", None, None): [sqlglot.parse_one("c = 2")]},
+        RLSMethod.AS_PREDICATE,
+    )
+    second = SQLScript(sql, "postgresql")
+
+    assert parse.call_count == 1
+    assert "c = 2" in first.format()
+    assert second.format() == (
+        "SELECT\n  a\nFROM t\nWHERE\n  b = 1;\nSELECT\n  c\nFROM u"
+    )
+    assert second.statements[0]._parsed is not first.statements[0]._parsed
+
+    SQLScript(sql, "mysql")
+    assert parse.call_count == 2
+
+    info = parsed_script_cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_parsed_script_cache_disabled(mocker: MockerFixture) -> None:
+    """
+    Test that scripts are parsed every time when the cache is disabled, and that
+    scripts that fail to parse are not cached.
+    """
+    parse = mocker.spy(sqlglot, "parse")
+
+    for _ in range(2):
+        with pytest.raises(SupersetParseError):
+            SQLScript("SELECT FROM (", "postgresql")
+    assert parse.call_count == 2
+
+    mocker.patch.dict(current_app.config, {"SQL_PARSE_CACHE_SIZE": 0})
+    SQLScript("SELECT 1", "postgresql")
+    SQLScript("SELECT 1", "postgresql")
+    assert parse.call_count == 4
+    assert parsed_script_cache.info().currsize == 0
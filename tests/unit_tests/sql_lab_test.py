@@ -53,6 +53,7 @@ def test_execute_query(mocker: MockerFixture, app: None) -> None:
     database = query.database
     database.allow_dml = False
     db_engine_spec = database.db_engine_spec
+    db_engine_spec.fetch_arrow.return_value = None
     db_engine_spec.fetch_data.return_value = [(42,)]
 
     cursor = mocker.MagicMock()
@@ -194,6 +195,97 @@ def test_execute_sql_statement_within_payload_limit(mocker: MockerFixture, app)
         )
 
 
+def test_execute_sql_statements_stores_results_in_chunks(
+    mocker: MockerFixture, app: SupersetApp
+) -> None:
+    """
+    Test that results are stored in chunks when
+    ``SQLLAB_RESULTS_BACKEND_CHUNK_ROWS`` is set, and that reading a page of the
+    results only reads the chunks holding it.
+    """
+    from cachelib import SimpleCache
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.utils.compression import decompress
+    from superset.views.utils import _deserialize_results_payload
+
+    query = mocker.MagicMock()
+    query.limit = 25
+    query.status = "RUNNING"
+    query.select_as_cta = False
+    query.database.cache_timeout = 100
+    query.database.db_engine_spec = PostgresEngineSpec
+    query.database.mutate_sql_based_on_config.side_effect = lambda sql, **kw: sql
+    query.to_dict.return_value = {"rows": 25}
+    mocker.patch("superset.sql_lab.get_query", return_value=query)
+    mocker.patch("superset.sql_lab.db")
+    mocker.patch(
+        "superset.sql_lab.execute_query",
+        return_value=SupersetResultSet(
+            [(i, f"name {i}") for i in range(25)],
+            [("id", "int"), ("name", "varchar")],
+            BaseEngineSpec,
+        ),
+    )
+    results_backend = SimpleCache()
+    mocker.patch("superset.sql_lab.results_backend", results_backend)
+    mocker.patch("superset.views.utils.results_backend", results_backend)
+    mocker.patch("superset.sql_lab.results_backend_use_msgpack", True)
+    app.config["SQLLAB_RESULTS_BACKEND_CHUNK_ROWS"] = 10
+
+    try:
+        execute_sql_statements(
+            query_id=1,
+            rendered_query="SELECT id, name FROM names",
+            return_results=False,
+            store_results=True,
+            start_time=None,
+            expand_data=False,
+            log_params={},
+        )
+    finally:
+        app.config["SQLLAB_RESULTS_BACKEND_CHUNK_ROWS"] = None
+
+    key = query.results_key
+    assert all(results_backend.has(f"{key}/{index}") for index in range(3))
+    assert not results_backend.has(f"{key}/3")
+    payload = decompress(results_backend.get(key), decode=False)
+
+    get_many = mocker.spy(results_backend, "get_many")
+    page = _deserialize_results_payload(payload, query, True, offset=12, limit=5)
+    get_many.assert_called_once_with(f"{key}/1")
+    assert page["data"] == [{"id": i, "name": f"name {i}"} for i in range(12, 17)]
+    assert "data_chunks" not in page
+
+    results = _deserialize_results_payload(payload, query, True)
+    assert results["data"] == [{"id": i, "name": f"name {i}"} for i in range(25)]
+
+
+@pytest.mark.parametrize(
+    "offset, limit, expected",
+    [
+        (0, None, range(0, 3)),
+        (0, 10, range(0, 1)),
+        (12, 5, range(1, 2)),
+        (5, 10, range(0, 2)),
+        (20, 100, range(2, 3)),
+        (100, 10, range(2, 3)),
+        (0, 0, range(0, 1)),
+    ],
+)
+def test_get_results_chunk_range(
+    offset: int, limit: int | None, expected: range
+) -> None:
+    """
+    Test the chunks read for a page of results of 25 rows stored in chunks of 10.
+    """
+    from superset.sqllab.utils import get_results_chunk_range
+
+    manifest = {"rows": 25, "chunk_rows": 10, "chunks": 3}
+    assert get_results_chunk_range(manifest, offset, limit) == expected
+
+
 def test_execute_sql_statements_mutates_before_split_by_default(
     mocker: MockerFixture, app: SupersetApp
 ) -> None:
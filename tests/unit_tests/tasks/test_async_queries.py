@@ -498,3 +498,62 @@ def test_load_explore_json_into_cache_timeout_emits_error(
         "error",
         errors=[{"message": "A timeout occurred while loading explore json"}],
     )
+
+
+@mock.patch("superset.tasks.async_queries.cache_manager")
+@mock.patch("superset.tasks.async_queries.security_manager")
+@mock.patch("superset.tasks.async_queries.ChartDataQueryContextSchema")
+@mock.patch("superset.charts.data.query_context_cache_loader.QueryContextCacheLoader")
+@mock.patch("superset.commands.chart.data.get_data_command.ChartDataCommand")
+def test_refresh_chart_data_cache(
+    mock_command_cls,
+    mock_cache_loader,
+    mock_query_context_schema_cls,
+    mock_security_manager,
+    mock_cache_manager,
+):
+    """The cached query context is rerun bypassing the cache, then released."""
+    from superset.tasks.async_queries import refresh_chart_data_cache
+
+    mock_security_manager.get_user_by_id.return_value = mock.MagicMock()
+    mock_cache_loader.load.return_value = {"form_data": {}}
+    query_context = mock_query_context_schema_cls.return_value.load.return_value
+
+    refresh_chart_data_cache({"user_id": 1}, "qc-key", ["stale_refresh_key"])
+
+    mock_cache_loader.load.assert_called_once_with("qc-key")
+    assert query_context.force is True
+    mock_command_cls.assert_called_once_with(query_context)
+    mock_command_cls.return_value.run.assert_called_once()
+    mock_cache_manager.data_cache.delete_many.assert_called_once_with(
+        "stale_refresh_key"
+    )
+
+
+@mock.patch("superset.tasks.async_queries.cache_manager")
+@mock.patch("superset.tasks.async_queries.security_manager")
+@mock.patch("superset.tasks.async_queries.ChartDataQueryContextSchema")
+@mock.patch("superset.charts.data.query_context_cache_loader.QueryContextCacheLoader")
+@mock.patch("superset.commands.chart.data.get_data_command.ChartDataCommand")
+def test_refresh_chart_data_cache_with_error(
+    mock_command_cls,
+    mock_cache_loader,
+    mock_query_context_schema_cls,
+    mock_security_manager,
+    mock_cache_manager,
+):
+    """A failed refresh still releases its keys, so the next viewer can retry."""
+    from superset.tasks.async_queries import refresh_chart_data_cache
+
+    mock_security_manager.get_user_by_id.return_value = mock.MagicMock()
+    mock_cache_loader.load.return_value = {"form_data": {}}
+    mock_command_cls.return_value.run.side_effect = ChartDataQueryFailedError(
+        _("Something went wrong")
+    )
+
+    with pytest.raises(ChartDataQueryFailedError):
+        refresh_chart_data_cache({"user_id": 1}, "qc-key", ["stale_refresh_key"])
+
+    mock_cache_manager.data_cache.delete_many.assert_called_once_with(
+        "stale_refresh_key"
+    )
@@ -0,0 +1,99 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pickle
+from datetime import date, datetime
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from superset.utils.cache_codec import (
+    decode_dataframe,
+    encode_dataframe,
+    EncodedDataFrame,
+)
+
+
+@pytest.mark.parametrize(
+    "compression, compression_level",
+    [(None, None), ("lz4", None), ("zstd", None), ("zstd", 19)],
+)
+def test_roundtrip(compression: str | None, compression_level: int | None) -> None:
+    """
+    Test that supported dataframes are read back unchanged.
+    """
+    df = pd.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "float": [1.5, None, 3.5],
+            "nullable_int": pd.array([1, None, 3], dtype="Int64"),
+            "str": ["a", None, "c"],
+            "bool": pd.Series([True, None, False], dtype=object),
+            "decimal": [Decimal("1.10"), None, Decimal("3.30")],
+            "date": [date(2024, 1, 1), None, date(2024, 1, 3)],
+            "dttm": pd.to_datetime(["2024-01-01", None, "2024-01-03"]),
+            "dttm_tz": pd.to_datetime(["2024-01-01", None, "2024-01-03"], utc=True),
+            "empty": [None, None, None],
+        }
+    )
+
+    encoded = encode_dataframe(df, compression, compression_level)
+
+    assert isinstance(encoded, EncodedDataFrame)
+    assert encoded.num_rows == 3
+    assert encoded.num_columns == 10
+    pd.testing.assert_frame_equal(decode_dataframe(encoded), df)
+    unpickled = pickle.loads(pickle.dumps(encoded))  # noqa: S301
+    pd.testing.assert_frame_equal(unpickled.decode(), df)
+
+
+def test_roundtrip_empty() -> None:
+    """
+    Test that empty results keep their columns.
+    """
+    df = pd.DataFrame({"a": pd.Series([], dtype="int64"), "b": []})
+
+    pd.testing.assert_frame_equal(encode_dataframe(df).decode(), df)
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"a": pd.Series([1, None], dtype=object)}),
+        pd.DataFrame({"a": pd.Series([datetime(2024, 1, 1), None], dtype=object)}),
+        pd.DataFrame({"a": pd.Series([True, False], dtype=object)}),
+        pd.DataFrame({"a": [1, "a"]}),
+        pd.DataFrame({"a": [[1, 2], None]}),
+        pd.DataFrame({1: [1, 2]}),
+        pd.DataFrame([[1, 2]], columns=["a", "a"]),
+        pd.DataFrame({"a": [1, 2]}, index=["x", "y"]),
+    ],
+)
+def test_not_encoded(df: pd.DataFrame) -> None:
+    """
+    Test that dataframes Arrow can't roundtrip losslessly are not encoded.
+    """
+    assert encode_dataframe(df) is None
+
+
+def test_decode_dataframe_not_encoded() -> None:
+    """
+    Test that dataframes cached as is are returned unchanged.
+    """
+    df = pd.DataFrame({"a": [1]})
+
+    assert decode_dataframe(df) is df
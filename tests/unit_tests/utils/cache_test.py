@@ -274,3 +274,104 @@ def test_set_and_log_cache_set_failure_logs(mocker: MockerFixture) -> None:
 
     mock_logger.warning.assert_called_once_with("Could not cache key %s", "my_key")
     mock_logger.exception.assert_called_once_with(boom)
+
+
+def _patch_data_cache(mocker: MockerFixture) -> MagicMock:
+    """A data cache backed by an in-memory cache."""
+    from cachelib import SimpleCache
+
+    backend = SimpleCache()
+    data_cache = mocker.MagicMock()
+    data_cache.cache = backend
+    data_cache.get.side_effect = backend.get
+    data_cache.add.side_effect = backend.add
+    data_cache.set.side_effect = backend.set
+    mocker.patch("superset.utils.cache.cache_manager").data_cache = data_cache
+    return data_cache
+
+
+def test_cache_generation(mocker: MockerFixture) -> None:
+    """A datasource keeps its cache generation until it's bumped."""
+    from superset.utils.cache import bump_cache_generation, get_cache_generation
+
+    _patch_config(mocker, DATASOURCE_CACHE_GENERATIONS=True)
+    _patch_data_cache(mocker)
+
+    generation = get_cache_generation("1__table")
+    assert generation
+    assert get_cache_generation("1__table") == generation
+    other_generation = get_cache_generation("2__table")
+
+    bump_cache_generation("1__table")
+
+    assert get_cache_generation("1__table") not in {None, generation}
+    assert get_cache_generation("2__table") == other_generation
+
+
+def test_cache_generation_evicted(mocker: MockerFixture) -> None:
+    """An evicted cache generation is replaced by a new one, not reset."""
+    from superset.utils.cache import get_cache_generation
+
+    _patch_config(mocker, DATASOURCE_CACHE_GENERATIONS=True)
+    data_cache = _patch_data_cache(mocker)
+
+    generation = get_cache_generation("1__table")
+    data_cache.cache.clear()
+
+    assert get_cache_generation("1__table") not in {None, generation}
+
+
+def test_cache_generation_disabled(mocker: MockerFixture) -> None:
+    """Cache generations are not used unless enabled."""
+    from superset.utils.cache import bump_cache_generation, get_cache_generation
+
+    _patch_config(mocker, DATASOURCE_CACHE_GENERATIONS=False)
+    data_cache = _patch_data_cache(mocker)
+
+    bump_cache_generation("1__table")
+    assert get_cache_generation("1__table") is None
+    data_cache.get.assert_not_called()
+    data_cache.set.assert_not_called()
+
+
+def test_cache_generation_backend_failure(mocker: MockerFixture) -> None:
+    """Cache keys are computed without a generation if the backend is down."""
+    from superset.utils.cache import get_cache_generation
+
+    _patch_config(mocker, DATASOURCE_CACHE_GENERATIONS=True)
+    data_cache = _patch_data_cache(mocker)
+    data_cache.get.side_effect = ConnectionError("Cache backend is down")
+
+    assert get_cache_generation("1__table") is None
+
+
+def test_set_and_log_cache_encoded_dataframe_size(mocker: MockerFixture) -> None:
+    """Encoded dataframes count their encoded length, without being pickled."""
+    import pickle
+
+    import pandas as pd
+
+    from superset.utils.cache import set_and_log_cache
+    from superset.utils.cache_codec import encode_dataframe
+
+    encoded = encode_dataframe(pd.DataFrame({"a": range(1000)}))
+    assert encoded is not None
+    dttm = "2021-01-01T00:00:00"
+    metadata_size = len(
+        pickle.dumps({"query": "SELECT 1", "dttm": dttm}, pickle.HIGHEST_PROTOCOL)
+    )
+
+    _patch_config(mocker, DATA_CACHE_MAX_VALUE_SIZE=metadata_size + len(encoded))
+    cache_instance = _make_cache_instance(mocker)
+    mock_datetime = mocker.patch("superset.utils.cache.datetime")
+    mock_datetime.now.return_value.replace.return_value.isoformat.return_value = dttm
+    mock_dumps = mocker.spy(pickle, "dumps")
+
+    set_and_log_cache(cache_instance, "my_key", {"df": encoded, "query": "SELECT 1"})
+
+    cache_instance.set.assert_called_once()
+    assert all(
+        not isinstance(item, type(encoded))
+        for call in mock_dumps.call_args_list
+        for item in call.args[0].values()
+    )
@@ -0,0 +1,69 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import zlib
+
+import pytest
+
+from superset.utils.compression import compress, decompress, MAGIC
+from superset.utils.core import zlib_compress
+
+PAYLOAD = '{"data": [' + ", ".join(f'{{"id": {i}}}' for i in range(1000)) + "]}"
+
+
+@pytest.mark.parametrize(
+    "codec, level",
+    [
+        ("zlib", None),
+        ("zlib", 1),
+        ("zstd", None),
+        ("zstd", 19),
+        ("lz4", None),
+    ],
+)
+def test_roundtrip(codec: str, level: int | None) -> None:
+    """
+    Test that compressed values are read back unchanged, whatever their codec.
+    """
+    blob = compress(PAYLOAD, codec, level)  # type: ignore[arg-type]
+
+    assert len(blob) < len(PAYLOAD)
+    assert blob.startswith(MAGIC) == (codec != "zlib")
+    assert decompress(blob) == PAYLOAD
+    assert decompress(blob, decode=False) == PAYLOAD.encode("utf-8")
+
+
+def test_decompress_legacy_zlib() -> None:
+    """
+    Test that values compressed by previous versions are still readable.
+    """
+    assert decompress(zlib_compress(PAYLOAD)) == PAYLOAD
+    assert decompress(zlib.compress(b"\x00\xff"), decode=False) == b"\x00\xff"
+
+
+def test_compress_empty() -> None:
+    """
+    Test that empty values roundtrip.
+    """
+    assert decompress(compress(b"", "zstd"), decode=False) == b""
+
+
+def test_compress_unsupported_codec() -> None:
+    """
+    Test that unsupported codecs are rejected.
+    """
+    with pytest.raises(ValueError, match="Unsupported compression codec"):
+        compress(PAYLOAD, "brotli")  # type: ignore[arg-type]
@@ -0,0 +1,62 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine, text
+
+from superset.utils.engine_pool import get_pool_engine_kwargs
+
+
+def test_get_pool_engine_kwargs() -> None:
+    """
+    Test that the pool parameters of a database override the defaults.
+    """
+    kwargs = get_pool_engine_kwargs(1, {"pool_size": 1, "pool_recycle": -1})
+
+    assert kwargs["pool_size"] == 1
+    assert kwargs["pool_recycle"] == -1
+    assert kwargs["max_overflow"] == 10
+    assert kwargs["pool_timeout"] == 30
+    assert kwargs["pool_pre_ping"] is True
+    assert kwargs["pool_logging_name"] == "database.1.pool"
+
+
+def test_instrumented_queue_pool(mocker: MockerFixture) -> None:
+    """
+    Test that the pool reuses connections and reports its metrics.
+    """
+    stats_logger = mocker.patch(
+        "superset.utils.engine_pool.stats_logger_manager"
+    ).instance
+    engine = create_engine("sqlite://", **get_pool_engine_kwargs(1, {}))
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        stats_logger.gauge.assert_any_call("database.1.pool.checked_out", 1)
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert engine.pool.checkedin() == 1
+    timings = [call.args[0] for call in stats_logger.timing.call_args_list]
+    assert timings == ["database.1.pool.checkout_wait"] * 2
+    stats_logger.gauge.assert_called_with("database.1.pool.connections", 1)
+
+    # the pool keeps reporting under the same name once recreated
+    engine.dispose()
+    with engine.connect():
+        pass
+    assert stats_logger.timing.call_args.args[0] == "database.1.pool.checkout_wait"
@@ -17,10 +17,11 @@
 import copy
 import math
 import uuid
+from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pandas as pd
@@ -429,3 +430,150 @@ def test_dumps_preserves_unicode_when_ensure_ascii_false() -> None:
     assert json.dumps("Hello, world!", ensure_ascii=False) == '"Hello, world!"'
     assert json.dumps("Привет, мир!", ensure_ascii=False) == '"Привет, мир!"'
     assert json.dumps("你好，世界！", ensure_ascii=False) == '"你好，世界！"'
+
+
+PARITY_PAYLOAD = {
+    "str": "Hello World",
+    "unicode": "Привет 你好 🚀",
+    "int": 123456789,
+    "big_int": 2**53 + 1,
+    "float": 0.12345,
+    "nan": float("nan"),
+    "inf": float("inf"),
+    "bool": True,
+    "none": None,
+    "list": [1, "a", None, [2.5]],
+    "tuple": (1, 2),
+    "set": {1},
+    "nested": {"a": {"b": [{"c": 1}]}},
+    "non_str_keys": {1: "a", 2.5: "b", None: "c"},
+    "np_int64": np.int64(42),
+    "np_float64": np.float64(1.5),
+    "np_float64_nan": np.float64("nan"),
+    "np_bool": np.bool_(True),
+    "np_array": np.array([1, 2, 3]),
+    "np_float_array": np.array([1.5, np.nan]),
+    "np_datetime64_array": np.array(["2020-01-01"], dtype="datetime64[ns]"),
+    "np_datetime64_day_array": np.array(["2020-01-01"], dtype="datetime64[D]"),
+    "decimal": Decimal("1.10"),
+    "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "datetime": datetime(2021, 1, 1, 12, 30, 15, 123456),
+    "datetime_tz": datetime(2021, 1, 1, tzinfo=pytz.utc),
+    "date": date(2021, 1, 1),
+    "time": time(12, 30, 15),
+    "timestamp": pd.Timestamp("2021-01-01 12:30:15.123456"),
+    "timestamp_tz": pd.Timestamp("2021-01-01", tz="UTC"),
+    "timedelta": timedelta(days=-1, hours=5),
+    "bytes": b"Hello World",
+    "date_offset": pd.DateOffset(days=1),
+}
+
+
+@pytest.mark.parametrize(
+    "default",
+    [
+        json.json_iso_dttm_ser,
+        json.pessimistic_json_iso_dttm_ser,
+        json.json_int_dttm_ser,
+    ],
+)
+@pytest.mark.parametrize("sort_keys", [False, True])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_dumps_orjson_parity(
+    app: Any,
+    default: Any,
+    sort_keys: bool,
+    indent: int | None,
+) -> None:
+    """
+    Test that the orjson encoder produces the same JSON as simplejson.
+    """
+    expected = json.dumps(
+        PARITY_PAYLOAD, default=default, sort_keys=sort_keys, indent=indent
+    )
+    with (
+        patch.dict(app.config, {"JSON_ENCODER_BACKEND": "orjson"}),
+        patch.object(json, "_orjson_dumps", wraps=json._orjson_dumps) as orjson_dumps,
+    ):
+        result = json.dumps(
+            PARITY_PAYLOAD, default=default, sort_keys=sort_keys, indent=indent
+        )
+
+    orjson_dumps.assert_called_once()
+    assert result.isascii()
+    assert json.loads(result) == json.loads(expected)
+    if sort_keys:
+        assert list(json.loads(result)) == sorted(PARITY_PAYLOAD)
+    if indent:
+        assert result.startswith('{\n  "')
+
+
+def test_dumps_orjson_ensure_ascii(app: Any) -> None:
+    """
+    Test that the orjson encoder escapes non-ASCII characters like simplejson.
+    """
+    with patch.dict(app.config, {"JSON_ENCODER_BACKEND": "orjson"}):
+        assert json.dumps("Привет") == '"\\u041f\\u0440\\u0438\\u0432\\u0435\\u0442"'
+        assert json.dumps("🚀") == '"\\ud83d\\ude80"'
+        assert json.dumps("🚀", ensure_ascii=False) == '"🚀"'
+
+
+@pytest.mark.parametrize(
+    "obj,kwargs",
+    [
+        (2**64, {}),
+        ({"a": 1}, {"default": None}),
+        ({"a": 1}, {"default": lambda obj: str(obj)}),
+        ({"a": 1}, {"cls": json.DashboardEncoder}),
+        ({"a": 1}, {"indent": 4}),
+        ({"a": 1}, {"separators": (",", ":")}),
+        ({"a": float("nan")}, {"ignore_nan": False, "allow_nan": True}),
+    ],
+)
+def test_dumps_orjson_fallback(app: Any, obj: Any, kwargs: dict[str, Any]) -> None:
+    """
+    Test that calls not supported by the orjson encoder are handled by simplejson.
+    """
+    expected = json.dumps(obj, **kwargs)
+    with patch.dict(app.config, {"JSON_ENCODER_BACKEND": "orjson"}):
+        assert json.dumps(obj, **kwargs) == expected
+
+
+def test_dumps_orjson_errors(app: Any) -> None:
+    """
+    Test that the orjson encoder raises the same errors as simplejson.
+    """
+    with patch.dict(app.config, {"JSON_ENCODER_BACKEND": "orjson"}):
+        with pytest.raises(TypeError, match="Unserializable object"):
+            json.dumps({"a": object()})
+        assert json.dumps(
+            {"a": object()}, default=json.pessimistic_json_iso_dttm_ser
+        ) == json.dumps({"a": "Unserializable [<class 'object'>]"})
+        # NumPy scalars simplejson doesn't serialize
+        for value in (np.float32(1.5), np.int32(1)):
+            for default in (json.json_iso_dttm_ser, json.json_int_dttm_ser):
+                with pytest.raises(TypeError, match="Unserializable object"):
+                    json.dumps({"a": value}, default=default)
+            assert json.dumps(
+                {"a": value}, default=json.pessimistic_json_iso_dttm_ser
+            ) == json.dumps({"a": f"Unserializable [{type(value)}]"})
+
+        # dataclasses, which orjson would serialize as objects
+        @dataclass
+        class Point:
+            x: int
+
+        with pytest.raises(TypeError, match="Unserializable object"):
+            json.dumps({"a": Point(1)})
+        assert json.dumps(
+            {"a": Point(1)}, default=json.pessimistic_json_iso_dttm_ser
+        ) == json.dumps({"a": f"Unserializable [{Point}]"})
+
+
+def test_dumps_simplejson_by_default() -> None:
+    """
+    Test that orjson is only used when enabled.
+    """
+    with patch.object(json, "_orjson_dumps") as orjson_dumps:
+        json.dumps({"a": 1})
+    orjson_dumps.assert_not_called()
@@ -16,7 +16,17 @@
 # under the License.
 
 
-from superset.utils.log import get_logger_from_status
+import threading
+import time
+from datetime import datetime
+from typing import Any
+
+from pytest_mock import MockerFixture
+from sqlalchemy.exc import SQLAlchemyError
+
+from superset.extensions import stats_logger_manager
+from superset.utils import json
+from superset.utils.log import BufferedDBEventLogger, get_logger_from_status
 
 
 def test_log_from_status_exception() -> None:
@@ -35,3 +45,109 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+def make_buffered_logger(**kwargs: Any) -> tuple[BufferedDBEventLogger, list[Any]]:
+    event_logger = BufferedDBEventLogger(**kwargs)
+    batches: list[Any] = []
+    event_logger.write = batches.append  # type: ignore
+    return event_logger, batches
+
+
+def log_event(event_logger: BufferedDBEventLogger, action: str, count: int) -> None:
+    event_logger.log(
+        1,
+        action,
+        None,
+        10,
+        None,
+        None,
+        records=[{"slice_id": i} for i in range(count)],
+    )
+
+
+def test_buffered_db_event_logger_batches() -> None:
+    """
+    Test that logs are written in batches by the background thread, and that the
+    queued logs are written on shutdown.
+    """
+    event_logger, batches = make_buffered_logger(batch_size=2, flush_interval=60)
+
+    log_event(event_logger, "mount_dashboard", 3)
+    event_logger.shutdown()
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert [row["slice_id"] for batch in batches for row in batch] == [0, 1, 2]
+    row = batches[0][0]
+    assert row["action"] == "mount_dashboard"
+    assert row["user_id"] == 1
+    assert row["duration_ms"] == 10
+    assert json.loads(row["json"]) == {"slice_id": 0}
+    assert isinstance(row["dttm"], datetime)
+    assert event_logger._thread is not None
+    assert not event_logger._thread.is_alive()
+
+
+def test_buffered_db_event_logger_flush_interval() -> None:
+    """
+    Test that queued logs are written after the flush interval.
+    """
+    event_logger, batches = make_buffered_logger(batch_size=100, flush_interval=0.05)
+
+    log_event(event_logger, "log", 1)
+    deadline = time.monotonic() + 5
+    while not batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert len(batches) == 1
+    event_logger.shutdown()
+
+
+def test_buffered_db_event_logger_drops_logs(mocker: MockerFixture) -> None:
+    """
+    Test that logs are dropped and counted when the queue is full.
+    """
+    incr = mocker.patch.object(stats_logger_manager.instance, "incr")
+    event_logger, batches = make_buffered_logger(max_queue_size=2, flush_interval=60)
+    release = threading.Event()
+    mocker.patch.object(event_logger, "_run", side_effect=lambda *args: release.wait())
+
+    log_event(event_logger, "log", 5)
+    release.set()
+
+    assert incr.call_args_list == [mocker.call("event_logger.dropped")] * 3
+    assert event_logger._queue.qsize() == 2
+
+
+def test_buffered_db_event_logger_write_errors(mocker: MockerFixture) -> None:
+    """
+    Test that failing to write a batch doesn't stop the thread.
+    """
+    incr = mocker.patch.object(stats_logger_manager.instance, "incr")
+    event_logger = BufferedDBEventLogger(batch_size=1, flush_interval=60)
+    event_logger.write = mocker.MagicMock(  # type: ignore
+        side_effect=[SQLAlchemyError("database is locked"), None]
+    )
+
+    log_event(event_logger, "log", 2)
+    event_logger.shutdown()
+
+    assert event_logger.write.call_count == 2
+    incr.assert_called_once_with("event_logger.write_error")
+
+
+def test_buffered_db_event_logger_write(mocker: MockerFixture) -> None:
+    """
+    Test that batches are inserted in a transaction of their own.
+    """
+    from superset.models.core import Log
+
+    db = mocker.patch("superset.db")
+    rows = [{"action": "log", "dttm": datetime(2024, 1, 1)}]
+
+    BufferedDBEventLogger.write(rows)
+
+    connection = db.engine.begin.return_value.__enter__.return_value
+    statement, values = connection.execute.call_args.args
+    assert statement.table is Log.__table__
+    assert values == rows
@@ -0,0 +1,311 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from flask import current_app
+from pytest_mock import MockerFixture
+
+from superset.jinja_context import PrestoTemplateProcessor
+from superset.models.core import Database
+from superset.sql.parse import Table
+from superset.utils import json
+from superset.utils.partition_cache import (
+    get_partition_cache_timeout,
+    PartitionMetadataCache,
+)
+
+
+def make_database(metadata_cache_timeout: dict[str, Any] | None = None) -> Database:
+    return Database(
+        id=1,
+        database_name="presto",
+        sqlalchemy_uri="presto://localhost:8080/hive",
+        extra=json.dumps({"metadata_cache_timeout": metadata_cache_timeout or {}}),
+    )
+
+
+def test_get_partition_cache_timeout(mocker: MockerFixture) -> None:
+    """
+    Test that the partition timeout of a database falls back to the config, and not
+    to its table timeout.
+    """
+    assert get_partition_cache_timeout(make_database()) is None
+
+    mocker.patch.dict(current_app.config, {"PARTITION_METADATA_CACHE_TIMEOUT": 60})
+    assert get_partition_cache_timeout(make_database()) == 60
+    assert (
+        get_partition_cache_timeout(make_database({"table_cache_timeout": 600})) == 60
+    )
+    assert (
+        get_partition_cache_timeout(
+            make_database({"table_cache_timeout": 600, "partition_cache_timeout": 0})
+        )
+        == 0
+    )
+
+
+def test_partition_cache_get(mocker: MockerFixture) -> None:
+    """
+    Test that lookups are cached per table and lookup until they expire.
+    """
+    monotonic = mocker.patch(
+        "superset.utils.partition_cache.time.monotonic", return_value=0
+    )
+    cache = PartitionMetadataCache()
+    database = make_database({"partition_cache_timeout": 10})
+    fetch = MagicMock(side_effect=lambda: ("2024-01-01",))
+
+    for _ in range(3):
+        assert cache.get(database, Table("t", "s"), "latest", fetch) == ("2024-01-01",)
+    assert fetch.call_count == 1
+
+    cache.get(database, Table("t", "other"), "latest", fetch)
+    cache.get(database, Table("t", "s"), "sub", fetch)
+    assert fetch.call_count == 3
+
+    monotonic.return_value = 11
+    cache.get(database, Table("t", "s"), "latest", fetch)
+    assert fetch.call_count == 4
+
+
+@pytest.mark.parametrize("per_user", ["impersonate_user", "oauth2"])
+def test_partition_cache_per_user(mocker: MockerFixture, per_user: str) -> None:
+    """
+    Test that lookups are cached per user when the database is queried on behalf
+    of the user.
+    """
+    get_username = mocker.patch("superset.utils.partition_cache.get_username")
+    cache = PartitionMetadataCache()
+    database = make_database({"partition_cache_timeout": 10})
+    if per_user == "impersonate_user":
+        database.impersonate_user = True
+    else:
+        mocker.patch.object(database, "is_oauth2_enabled", return_value=True)
+
+    fetch = MagicMock(side_effect=["alice's", "bob's"])
+    for username in ("alice", "bob", "alice"):
+        get_username.return_value = username
+        assert cache.get(database, Table("t", "s"), "latest", fetch) == (
+            f"{username}'s"
+        )
+
+    assert fetch.call_count == 2
+
+
+def test_partition_cache_disabled(mocker: MockerFixture) -> None:
+    """
+    Test that lookups are not cached without a timeout, and that timeouts of 0
+    never expire.
+    """
+    cache = PartitionMetadataCache()
+    fetch = MagicMock(return_value=("2024-01-01",))
+
+    cache.get(make_database(), Table("t", "s"), "latest", fetch)
+    cache.get(make_database(), Table("t", "s"), "latest", fetch)
+    assert fetch.call_count == 2
+
+    mocker.patch("superset.utils.partition_cache.time.monotonic", return_value=10**9)
+    database = make_database({"partition_cache_timeout": 0})
+    cache.get(database, Table("t", "s"), "latest", fetch)
+    cache.get(database, Table("t", "s"), "latest", fetch)
+    assert fetch.call_count == 3
+
+
+def test_partition_cache_failures_not_cached() -> None:
+    """
+    Test that failed lookups are fetched again.
+    """
+    cache = PartitionMetadataCache()
+    database = make_database({"partition_cache_timeout": 10})
+    fetch = MagicMock(side_effect=[Exception("Table is not partitioned"), ("1",)])
+
+    with pytest.raises(Exception, match="Table is not partitioned"):
+        cache.get(database, Table("t", "s"), "latest", fetch)
+    assert cache.get(database, Table("t", "s"), "latest", fetch) == ("1",)
+
+
+def test_partition_cache_coalesces_lookups() -> None:
+    """
+    Test that concurrent lookups of the same partitions query the database once.
+    """
+    cache = PartitionMetadataCache()
+    database = make_database({"partition_cache_timeout": 10})
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch() -> tuple[str]:
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return ("2024-01-01",)
+
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    results: list[Any] = []
+
+    def render() -> None:
+        with app.app_context():
+            results.append(cache.get(database, Table("t", "s"), "latest", fetch))
+
+    threads = [threading.Thread(target=render) for _ in range(5)]
+    threads[0].start()
+    started.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert calls == [1]
+    assert results == [("2024-01-01",)] * 5
+
+
+def test_partition_cache_coalesced_lookup_timeout(mocker: MockerFixture) -> None:
+    """
+    Test that a caller waiting for a hanging lookup runs the lookup itself after
+    the webserver timeout.
+    """
+    mocker.patch.dict(current_app.config, {"SUPERSET_WEBSERVER_TIMEOUT": 0.1})
+    cache = PartitionMetadataCache()
+    database = make_database({"partition_cache_timeout": 10})
+    release = threading.Event()
+    started = threading.Event()
+
+    def hang() -> tuple[str]:
+        started.set()
+        release.wait(timeout=5)
+        return ("2024-01-01",)
+
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+
+    def render() -> None:
+        with app.app_context():
+            cache.get(database, Table("t", "s"), "latest", hang)
+
+    thread = threading.Thread(target=render)
+    thread.start()
+    started.wait(timeout=5)
+
+    fetch = MagicMock(return_value=("2024-01-02",))
+    assert cache.get(database, Table("t", "s"), "latest", fetch) == ("2024-01-02",)
+    fetch.assert_called_once()
+
+    release.set()
+    thread.join(timeout=5)
+
+
+def test_partition_cache_refresh() -> None:
+    """
+    Test that refreshing evicts the partitions of a database, schema or table.
+    """
+    cache = PartitionMetadataCache()
+    database = make_database({"partition_cache_timeout": 10})
+    fetch = MagicMock(return_value=("1",))
+    tables = [Table("a", "s1"), Table("b", "s1"), Table("a", "s2"), Table("c")]
+
+    def lookup_all() -> None:
+        for table in tables:
+            cache.get(database, table, "latest", fetch)
+
+    lookup_all()
+    assert fetch.call_count == 4
+
+    cache.refresh(1, schema="s1", table="a")
+    lookup_all()
+    assert fetch.call_count == 5
+
+    # tables looked up in the default schema are refreshed with any schema
+    cache.refresh(1, schema="s1")
+    lookup_all()
+    assert fetch.call_count == 8
+
+    cache.refresh(2)
+    lookup_all()
+    assert fetch.call_count == 8
+
+    cache.refresh(1)
+    lookup_all()
+    assert fetch.call_count == 12
+
+
+def test_partition_cache_refresh_other_processes(mocker: MockerFixture) -> None:
+    """
+    Test that the partitions are cached under the generation of the database in
+    the shared cache, which a refresh bumps.
+    """
+    generations = {1: "a"}
+    mocker.patch(
+        "superset.utils.partition_cache.get_partition_cache_generation",
+        side_effect=generations.get,
+    )
+    bump = mocker.patch(
+        "superset.utils.partition_cache.bump_partition_cache_generation",
+        side_effect=lambda database_id: generations.update({database_id: "b"}),
+    )
+    cache = PartitionMetadataCache()
+    other_process_cache = PartitionMetadataCache()
+    database = make_database({"partition_cache_timeout": 10})
+    fetch = MagicMock(return_value=("1",))
+
+    for partition_cache in (cache, other_process_cache, cache, other_process_cache):
+        partition_cache.get(database, Table("t", "s"), "latest", fetch)
+    assert fetch.call_count == 2
+
+    cache.refresh(1, schema="s")
+    bump.assert_called_once_with(1)
+    other_process_cache.get(database, Table("t", "s"), "latest", fetch)
+    assert fetch.call_count == 3
+
+
+def test_presto_latest_partition_macros_cached(mocker: MockerFixture) -> None:
+    """
+    Test that the partition macros query the partitions once per table.
+    """
+    mocker.patch(
+        "superset.jinja_context.partition_metadata_cache",
+        PartitionMetadataCache(),
+    )
+    database = make_database({"partition_cache_timeout": 10})
+    latest_partition = mocker.patch(
+        "superset.db_engine_specs.presto.PrestoEngineSpec.latest_partition",
+        return_value=(["ds"], ("2024-01-01",)),
+    )
+    latest_sub_partition = mocker.patch(
+        "superset.db_engine_specs.presto.PrestoEngineSpec.latest_sub_partition",
+        return_value="2024-01-01",
+    )
+
+    for _ in range(3):
+        processor = PrestoTemplateProcessor(database=database)
+        assert (
+            processor.process_template(
+                "{{ presto.latest_partition('s.t') }} "
+                "{{ presto.latest_sub_partition('s.t', event='click') }}"
+            )
+            == "2024-01-01 2024-01-01"
+        )
+    processor.process_template("{{ presto.latest_sub_partition('s.t', event='v') }}")
+
+    latest_partition.assert_called_once_with(database=database, table=Table("t", "s"))
+    assert latest_sub_partition.call_args_list == [
+        mocker.call(database=database, table=Table("t", "s"), event="click"),
+        mocker.call(database=database, table=Table("t", "s"), event="v"),
+    ]
@@ -0,0 +1,108 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from decimal import Decimal
+
+import pandas as pd
+import pyarrow as pa
+
+from superset.utils.arrow import arrow_ipc_to_df, df_to_arrow_ipc
+from superset.utils.core import GenericDataType
+
+
+def test_df_to_arrow_ipc_round_trip() -> None:
+    """Values and column metadata survive a round trip through the stream."""
+    df = pd.DataFrame(
+        {
+            "name": ["a", "b", None],
+            "count": [1, 2, 3],
+            "ds": pd.to_datetime(["2024-01-01", "2024-01-02", None]),
+            "ratio": [0.5, None, 1.5],
+        }
+    )
+    coltypes = [
+        GenericDataType.STRING,
+        GenericDataType.NUMERIC,
+        GenericDataType.TEMPORAL,
+        GenericDataType.NUMERIC,
+    ]
+
+    data = df_to_arrow_ipc(df, coltypes, verbose_map={"count": "Number of rows"})
+    result, metadata = arrow_ipc_to_df(data)
+
+    pd.testing.assert_frame_equal(result, df)
+    assert metadata == {
+        "colnames": ["name", "count", "ds", "ratio"],
+        "coltypes": [1, 0, 2, 0],
+        "verbose_labels": ["name", "Number of rows", "ds", "ratio"],
+    }
+    schema = pa.ipc.open_stream(data).schema
+    assert schema.field("count").type == pa.int64()
+    assert schema.field("ds").type == pa.timestamp("ns")
+
+
+def test_df_to_arrow_ipc_mixed_object_column() -> None:
+    """Object columns Arrow can't type are stringified, keeping nulls."""
+    df = pd.DataFrame(
+        {
+            "mixed": [1, "a", {"key": "value"}, None],
+            "decimal": [Decimal("1.5"), Decimal("2.5"), None, Decimal("3")],
+        }
+    )
+
+    data = df_to_arrow_ipc(df, [GenericDataType.STRING, GenericDataType.NUMERIC])
+    result, _ = arrow_ipc_to_df(data)
+
+    assert result["mixed"].tolist() == ["1", "a", '{"key": "value"}', None]
+    assert result["decimal"].tolist() == [
+        Decimal("1.5"),
+        Decimal("2.5"),
+        None,
+        Decimal("3"),
+    ]
+
+
+def test_df_to_arrow_ipc_index() -> None:
+    """A meaningful index is written as the leading column."""
+    df = pd.DataFrame({"value": [1, 2]}, index=pd.Index(["x", "y"], name="key"))
+
+    result, metadata = arrow_ipc_to_df(
+        df_to_arrow_ipc(df, [GenericDataType.NUMERIC], index=True)
+    )
+
+    assert result.to_dict(orient="list") == {"key": ["x", "y"], "value": [1, 2]}
+    assert metadata["colnames"] == ["key", "value"]
+    assert metadata["coltypes"] == [1, 0]
+
+
+def test_df_to_arrow_ipc_multi_index() -> None:
+    """The types of the levels of the index lead the types of the columns."""
+    df = pd.DataFrame(
+        {("sum", "a"): [1.5, 2.5], ("sum", "b"): [3, 4]},
+        index=pd.MultiIndex.from_arrays(
+            [pd.to_datetime(["2024-01-01", "2024-01-02"]), ["x", "y"]],
+            names=["ds", "key"],
+        ),
+    )
+
+    _, metadata = arrow_ipc_to_df(
+        df_to_arrow_ipc(
+            df, [GenericDataType.NUMERIC, GenericDataType.NUMERIC], index=True
+        )
+    )
+
+    assert metadata["colnames"] == ["ds", "key", "sum a", "sum b"]
+    assert metadata["coltypes"] == [2, 1, 0, 0]
@@ -0,0 +1,83 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+from functools import partial
+
+import pytest
+from flask import current_app, g, has_request_context, request
+
+from superset.utils.concurrency import run_in_thread_pool
+
+
+def test_run_in_thread_pool_keeps_order_and_g() -> None:
+    """Results keep the order of the callables, which see ``g`` and the app."""
+    g.concurrency_marker = "marker"
+    barrier = threading.Barrier(3, timeout=5)
+
+    def func(idx: int) -> tuple[int, str, str, bool]:
+        barrier.wait()
+        return (
+            idx,
+            g.concurrency_marker,
+            current_app.name,
+            threading.current_thread() is threading.main_thread(),
+        )
+
+    results = run_in_thread_pool([partial(func, idx) for idx in range(3)], 3)
+
+    assert results == [(idx, "marker", current_app.name, False) for idx in range(3)]
+
+
+def test_run_in_thread_pool_request_context(app) -> None:
+    """Inside a request, every callable runs in a copy of the request context."""
+
+    def func() -> tuple[bool, str]:
+        return has_request_context(), request.path
+
+    with app.test_request_context("/some/path"):
+        results = run_in_thread_pool([func, func], 2)
+
+    assert results == [(True, "/some/path"), (True, "/some/path")]
+
+
+def test_run_in_thread_pool_raises_first_error() -> None:
+    """The exception of the first failing callable is raised."""
+
+    def fail(message: str) -> None:
+        raise ValueError(message)
+
+    with pytest.raises(ValueError, match="first"):
+        run_in_thread_pool(
+            [lambda: None, partial(fail, "first"), partial(fail, "second")],
+            3,
+        )
+
+
+def test_run_in_thread_pool_nested() -> None:
+    """Calls nested in a callable run serially in the thread of the callable."""
+
+    def outer() -> list[str]:
+        return run_in_thread_pool(
+            [lambda: threading.current_thread().name] * 2,
+            2,
+            thread_name_prefix="inner",
+        )
+
+    results = run_in_thread_pool([outer, outer], 2, thread_name_prefix="outer")
+
+    assert all(name.startswith("outer") for names in results for name in names)
+    assert all(len(set(names)) == 1 for names in results)
@@ -20,6 +20,7 @@ from unittest.mock import MagicMock, patch, PropertyMock
 import pytest
 
 from superset.utils.webdriver import (
+    _PlaywrightBrowserManager,
     check_playwright_availability,
     PLAYWRIGHT_AVAILABLE,
     PLAYWRIGHT_INSTALL_MESSAGE,
@@ -1764,3 +1765,203 @@ class TestWebDriverPlaywrightAnimationWaitOrder:
         assert timeout_values == [0], (
             f"Expected only [0] (headstart), got {timeout_values}"
         )
+
+
+class TestWebDriverPlaywrightTabs:
+    """Test capturing the tabs of a dashboard concurrently with Playwright."""
+
+    urls = ["http://example.com/1", "http://example.com/2", "http://example.com/3"]
+
+    @pytest.fixture
+    def tabs(self):
+        """Mock the pages of the tabs, recording the order of the browser calls."""
+        calls = []
+        contexts = []
+
+        def new_page(user):
+            context = MagicMock()
+            page = MagicMock()
+            page.goto.side_effect = lambda url, wait_until: calls.append(
+                ("goto", url, wait_until)
+            )
+            contexts.append(context)
+            return context, page
+
+        def capture(page, url, element_name, **kwargs):
+            calls.append(("capture", url))
+            return None if url.endswith("fail") else url.encode()
+
+        with (
+            patch("superset.utils.webdriver.app") as mock_app,
+            patch.object(WebDriverPlaywright, "_new_page", side_effect=new_page),
+            patch.object(WebDriverPlaywright, "_capture", side_effect=capture),
+        ):
+            mock_app.config = {
+                "SCREENSHOT_PLAYWRIGHT_TAB_CONCURRENCY": 2,
+                "SCREENSHOT_PLAYWRIGHT_TAB_TIMEOUT": 60,
+                "SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT": 30000,
+                "SCREENSHOT_PLAYWRIGHT_WAIT_EVENT": "load",
+                "SCREENSHOT_LOCATE_WAIT": 10,
+                "SCREENSHOT_LOAD_WAIT": 10,
+            }
+            yield mock_app, calls, contexts
+
+    def test_get_screenshots_loads_tabs_concurrently(self, tabs):
+        """
+        Tabs start loading before the previous ones are captured, up to the
+        concurrency cap, and the screenshots keep the order of the tabs.
+        """
+        _, calls, contexts = tabs
+
+        driver = WebDriverPlaywright("chrome")
+        result = driver.get_screenshots(self.urls, "standalone")
+
+        assert result == [url.encode() for url in self.urls]
+        assert calls == [
+            ("goto", self.urls[0], "commit"),
+            ("goto", self.urls[1], "commit"),
+            ("capture", self.urls[0]),
+            ("goto", self.urls[2], "commit"),
+            ("capture", self.urls[1]),
+            ("capture", self.urls[2]),
+        ]
+        assert all(context.close.call_count == 1 for context in contexts)
+
+    def test_get_screenshots_stops_at_first_failure(self, tabs):
+        """A failed tab stops the capture, and closes the tabs still loading."""
+        _, calls, contexts = tabs
+        urls = ["http://example.com/fail", *self.urls[1:]]
+
+        driver = WebDriverPlaywright("chrome")
+        result = driver.get_screenshots(urls, "standalone")
+
+        assert result == [None, None, None]
+        assert ("goto", urls[2], "commit") not in calls
+        assert len(contexts) == 2
+        assert all(context.close.call_count == 1 for context in contexts)
+
+    def test_get_screenshots_tab_timeout(self, tabs):
+        """
+        The tab timeout starts with the capture of each tab, not with its
+        navigation, as the tabs are captured one after the other.
+        """
+        mock_app, _, contexts = tabs
+        mock_app.config["SCREENSHOT_PLAYWRIGHT_TAB_TIMEOUT"] = 10
+
+        driver = WebDriverPlaywright("chrome")
+        with patch(
+            "superset.utils.webdriver.time.monotonic",
+            side_effect=[0, 0, 8, 8, 16, 16],
+        ):
+            result = driver.get_screenshots(self.urls[:2], "standalone")
+
+        assert result == [url.encode() for url in self.urls[:2]]
+        assert all(context.close.call_count == 1 for context in contexts)
+
+    def test_bound_waits(self, tabs):
+        """Each wait of a tab is bounded by the time left before its deadline."""
+        from superset.utils.webdriver import PlaywrightTimeout
+
+        page = MagicMock()
+        with patch("superset.utils.webdriver.time.monotonic", side_effect=[4, 11]):
+            assert WebDriverPlaywright._bound_waits(page, "url", 10, 60) == 6
+            page.set_default_timeout.assert_called_once_with(6000)
+
+            with pytest.raises(PlaywrightTimeout, match="Timed out capturing"):
+                WebDriverPlaywright._bound_waits(page, "url", 10)
+
+        assert WebDriverPlaywright._bound_waits(page, "url", None, 60) == 60
+
+
+class TestPlaywrightContextPool:
+    """Test the pool of browser contexts reused across screenshots."""
+
+    def test_get_context_reuses_released_context(self):
+        """A released context is reused by the same key only."""
+        manager = _PlaywrightBrowserManager()
+        create = MagicMock(side_effect=lambda: MagicMock())
+
+        context = manager.get_context("alice", create, max_age=60)
+        page = MagicMock()
+        context.pages = [page]
+        manager.release_context(context, reuse=True, pool_size=2, max_uses=10)
+
+        page.close.assert_called_once()
+        context.close.assert_not_called()
+        assert manager.get_context("bob", create, max_age=60) is not context
+        assert manager.get_context("alice", create, max_age=60) is context
+        assert create.call_count == 2
+
+    def test_release_context_closes_unusable_contexts(self):
+        """
+        Contexts of failed screenshots, used too many times, or beyond the size of
+        the pool are closed.
+        """
+        manager = _PlaywrightBrowserManager()
+        create = MagicMock(side_effect=lambda: MagicMock(pages=[]))
+
+        failed = manager.get_context("alice", create, max_age=60)
+        manager.release_context(failed, reuse=False, pool_size=2, max_uses=10)
+        failed.close.assert_called_once()
+
+        worn = manager.get_context("alice", create, max_age=60)
+        manager.release_context(worn, reuse=True, pool_size=2, max_uses=1)
+        worn.close.assert_called_once()
+
+        contexts = [manager.get_context(key, create, max_age=60) for key in "abc"]
+        for context in contexts:
+            manager.release_context(context, reuse=True, pool_size=2, max_uses=10)
+        assert [context.close.call_count for context in contexts] == [1, 0, 0]
+
+    @patch("superset.utils.webdriver.time.monotonic")
+    def test_get_context_closes_expired_contexts(self, mock_monotonic):
+        """Idle contexts older than the maximum age are closed instead of reused."""
+        manager = _PlaywrightBrowserManager()
+        create = MagicMock(side_effect=lambda: MagicMock(pages=[]))
+
+        mock_monotonic.return_value = 0
+        context = manager.get_context("alice", create, max_age=60)
+        manager.release_context(context, reuse=True, pool_size=2, max_uses=10)
+
+        mock_monotonic.return_value = 60
+        assert manager.get_context("alice", create, max_age=60) is not context
+        context.close.assert_called_once()
+
+    @patch("superset.utils.webdriver.PLAYWRIGHT_AVAILABLE", True)
+    @patch("superset.utils.webdriver.app")
+    def test_get_screenshot_reuses_authenticated_context(self, mock_app):
+        """Screenshots of the same user only authenticate the first context."""
+        mock_app.config = {
+            "WEBDRIVER_OPTION_ARGS": [],
+            "WEBDRIVER_WINDOW": {"pixel_density": 1},
+            "SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT": 30000,
+            "SCREENSHOT_PLAYWRIGHT_WAIT_EVENT": "load",
+            "SCREENSHOT_PLAYWRIGHT_CONTEXT_POOL_SIZE": 2,
+            "SCREENSHOT_PLAYWRIGHT_CONTEXT_MAX_AGE": 600,
+            "SCREENSHOT_PLAYWRIGHT_CONTEXT_MAX_USES": 10,
+            "SCREENSHOT_LOCATE_WAIT": 10,
+            "SCREENSHOT_LOAD_WAIT": 10,
+        }
+        manager = _PlaywrightBrowserManager()
+        mock_browser = MagicMock()
+        mock_browser.new_context.side_effect = lambda **kwargs: MagicMock(pages=[])
+        mock_user = MagicMock(username="alice")
+
+        with (
+            patch("superset.utils.webdriver._browser_manager", manager),
+            patch.object(manager, "get_browser", return_value=mock_browser),
+            patch.object(WebDriverPlaywright, "auth") as mock_auth,
+            patch.object(
+                WebDriverPlaywright, "_capture", side_effect=[b"first", None, b"third"]
+            ),
+        ):
+            driver = WebDriverPlaywright("chrome")
+            results = [
+                driver.get_screenshot("http://example.com", "standalone", mock_user)
+                for _ in range(3)
+            ]
+
+        assert results == [b"first", None, b"third"]
+        # the context of the failed screenshot is replaced
+        assert mock_browser.new_context.call_count == 2
+        assert mock_auth.call_count == 2